@@ -2,4 +2,7 @@ class InvalidProblemText(Exception):
     ...
 
 class InvalidColor(Exception):
+    ...
+
+class InvalidBundle(Exception):
     ...
\ No newline at end of file
@@ -1,6 +1,7 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from pathlib import Path
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -8,12 +9,13 @@ class Language:
     name: str
     file_extension: str
     comment_symbol: str
+    aliases: Tuple[str, ...] = field(default=tuple())
 
     def __hash__(self) -> int:
         return hash(self.name)
 
 class _LanguageEnum(Enum):
-    
+
     @classmethod
     def by_name(cls, name: str) -> Language:
         for language in cls:
@@ -22,45 +24,87 @@ class _LanguageEnum(Enum):
         raise ValueError(f"Invalid language: {name}")
 
 class Languages(_LanguageEnum):
-    CPP = Language("C++", "cpp", "//")
+    CPP = Language("C++", "cpp", "//", ("cpp", "cxx"))
     JAVA = Language("Java", "java", "//")
-    PYTHON = Language("Python", "py", "#")
+    PYTHON = Language("Python", "py", "#", ("py", "python3"))
     C = Language("C", "c", "//")
-    CSHARP = Language("C#", "cs", "//")
-    JAVASCRIPT = Language("JavaScript", "js", "//")
-    TYPESCRIPT = Language("TypeScript", "ts", "//")
+    CSHARP = Language("C#", "cs", "//", ("cs", "csharp"))
+    JAVASCRIPT = Language("JavaScript", "js", "//", ("js", "node"))
+    TYPESCRIPT = Language("TypeScript", "ts", "//", ("ts",))
     PHP = Language("PHP", "php", "//")
     SWIFT = Language("Swift", "swift", "//")
-    KOTLIN = Language("Kotlin", "kt", "//")
+    KOTLIN = Language("Kotlin", "kt", "//", ("kt",))
     DART = Language("Dart", "dart", "//")
-    GOLANG = Language("Go", "go", "//")
-    RUBY = Language("Ruby", "rb", "#")
+    GOLANG = Language("Go", "go", "//", ("golang",))
+    RUBY = Language("Ruby", "rb", "#", ("rb",))
     SCALA = Language("Scala", "scala", "//")
-    RUST = Language("Rust", "rs", "//")
-    RACKET = Language("Racket", "rkt", ";")
-    ERLANG = Language("Erlang", "erl", "%")
-    ELIXIR = Language("Elixir", "exs", "#")
+    RUST = Language("Rust", "rs", "//", ("rs",))
+    RACKET = Language("Racket", "rkt", ";", ("rkt",))
+    ERLANG = Language("Erlang", "erl", "%", ("erl",))
+    ELIXIR = Language("Elixir", "exs", "#", ("ex", "exs"))
 
 class ShellLanguages(_LanguageEnum):
-    BASH = Language("Bash", "sh", "#")
+    BASH = Language("Bash", "sh", "#", ("sh", "shell"))
 
 class SQLDialects(_LanguageEnum):
     MYSQL = Language("MySQL", "sql", "--")
-    MSSQL = Language("MS SQL Server", "sql", "--")
-    ORACLE = Language("Oracle", "sql", "--")
-    POSTGRES = Language("PostgreSQL", "sql", "--")
+    MSSQL = Language("MS SQL Server", "sql", "--", ("mssql", "sqlserver", "tsql"))
+    ORACLE = Language("Oracle", "sql", "--", ("oraclesql", "plsql"))
+    POSTGRES = Language("PostgreSQL", "sql", "--", ("pg", "postgres", "psql"))
+
+
+class LanguageRegistry:
+    languages: List[Language]
+    _by_key: Dict[str, Language]
+    _by_extension: Dict[str, List[Language]]
+
+    def __init__(self, languages: Iterable[Language]) -> None:
+        self.languages = list()
+        self._by_key = dict()
+        self._by_extension = dict()
+        for language in languages:
+            self.register(language)
+
+    def register(self, language: Language) -> None:
+        for key in (language.name, *language.aliases):
+            registered = self._by_key.setdefault(key.casefold(), language)
+            if registered is not language:
+                raise ValueError(f"Language key \"{key}\" is already used by {registered.name}")
+
+        self.languages.append(language)
+        self._by_extension.setdefault(language.file_extension.casefold(), list()).append(language)
+
+    def get(self, name: str) -> Optional[Language]:
+        return self._by_key.get(name.strip().casefold())
 
+    def by_name(self, name: str) -> Language:
+        if (language := self.get(name)) is None:
+            raise ValueError(f"Invalid language: {name}")
+        return language
+
+    def by_extension(self, extension: str) -> List[Language]:
+        return list(self._by_extension.get(extension.lstrip(".").casefold(), list()))
+
+    def by_path(self, path: Path) -> Optional[Language]:
+        if (language := self.get(path.parent.name)) is not None \
+                and language.file_extension.casefold() == path.suffix.lstrip(".").casefold():
+            return language
+
+        languages = self.by_extension(path.suffix)
+        return languages[0] if len(languages) == 1 else None
+
+
+LANGUAGES = LanguageRegistry(
+    lang.value
+    for lang_set in [Languages, ShellLanguages, SQLDialects]
+    for lang in lang_set
+)
 
 def any_language_by_name(name: str) -> Language:
-    for lang_set in [Languages, ShellLanguages, SQLDialects]:
-        try:
-            return lang_set.by_name(name)
-        except ValueError:
-            continue
-    raise ValueError(f"Invalid language: {name}")
+    return LANGUAGES.by_name(name)
+
+def language_by_path(path: Path) -> Optional[Language]:
+    return LANGUAGES.by_path(path)
 
 def all_languages() -> List[Language]:
-    languages = list()
-    for lang_set in [Languages, ShellLanguages, SQLDialects]:
-        languages.extend([lang.value for lang in lang_set])
-    return languages
\ No newline at end of file
+    return list(LANGUAGES.languages)
@@ -1,7 +1,7 @@
-from typing import List, Dict
+from typing import List, Dict, Any
 from dataclasses import dataclass
 
-from .language import Language
+from .language import Language, any_language_by_name
 
 
 @dataclass
@@ -14,4 +14,31 @@ class PersistentProblem:
     description: str
     language: Language
     solution_code: str
-    metadata: Dict[str, str]
\ No newline at end of file
+    metadata: Dict[str, str]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "title_slug": self.title_slug,
+            "difficulty": self.difficulty,
+            "category": self.category,
+            "tags": self.tags,
+            "description": self.description,
+            "language": self.language.name,
+            "solution_code": self.solution_code,
+            "metadata": self.metadata
+        }
+
+    @classmethod
+    def from_json(cls, json: Dict[str, Any]) -> "PersistentProblem":
+        return cls(
+            title=json.get("title"),
+            title_slug=json.get("title_slug"),
+            difficulty=json.get("difficulty"),
+            category=json.get("category"),
+            tags=json.get("tags") or list(),
+            description=json.get("description"),
+            language=any_language_by_name(json.get("language")),
+            solution_code=json.get("solution_code"),
+            metadata=json.get("metadata") or dict()
+        )
\ No newline at end of file
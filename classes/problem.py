@@ -24,7 +24,10 @@ class Problem(ABC):
         ...
     
     def save(self, keeper: ProblemKeeper, include_tags: bool=True) -> Path:
-        return keeper.save_problem(PersistentProblem(
+        return keeper.save_problem(self.to_persistent(include_tags))
+
+    def to_persistent(self, include_tags: bool=True) -> PersistentProblem:
+        return PersistentProblem(
             title=self.title,
             title_slug=self.title_slug,
             difficulty=self.difficulty,
@@ -34,11 +37,18 @@ class Problem(ABC):
             language=self.language,
             solution_code=self.solution_code,
             metadata=self.get_metadata()
-        ))
+        )
     
     @classmethod
     def load(cls, title_slug: str, language: Language, keeper: ProblemKeeper) -> "Problem":
-        data = keeper.load_problem(title_slug, language)
+        return cls.from_persistent(keeper.load_problem(title_slug, language))
+
+    @classmethod
+    def load_from_path(cls, path: Path, language: Language, keeper: ProblemKeeper) -> "Problem":
+        return cls.from_persistent(keeper.load_problem_from_path(path, language))
+
+    @classmethod
+    def from_persistent(cls, data: PersistentProblem) -> "Problem":
         return cls(
             title=data.title,
             title_slug=data.title_slug,
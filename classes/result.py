@@ -24,6 +24,13 @@ class ResultStates(Enum):
     Error = ResultState('!', 'red', "Error")
     Unknown = ResultState('?', 'bright_blue', "Something went wrong")
 
+    @classmethod
+    def by_value(cls, value: str) -> ResultState:
+        for state in cls:
+            if state.value.value == value:
+                return state.value
+        return cls.Unknown.value
+
 
 @dataclass()
 class CommitResult(ABC):
@@ -1,5 +1,15 @@
+import os
+import sys
+import shlex
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from utils.completion import COMPLETE_VAR, complete_fast, get_completion_index
+from utils.config import Config, get_config
+
+if __name__ == "__main__" and COMPLETE_VAR in os.environ:
+    if complete_fast(get_completion_index(get_config().get("main", "cache_dir"), "leetcode")):
+        sys.exit(0)
 
 import click
 
@@ -7,16 +17,26 @@ from providers.leetcode.commands import add_commands as add_leetcode_commands
 from providers.leetcode.client import LeetCodeClient
 from utils.click import pass_config
 from utils.problem_keeper import ProblemKeeper
+from utils.problem_storage import ProblemStorageType
 from utils.problem_formatter import ProblemFormatter
-from utils.config import Config, get_config
+from utils.cache import JsonCache
+from utils.asset_store import AssetStore, ASSETS_DIR_NAME
+from utils.search_index import SearchIndex, SEARCH_INDEX_FILE_NAME
 from utils.style import OutputStyler, ColorType, AVAILABLE_COLORS
+from utils.output import OutputPrinter, OutputFormat
+from utils.repl import setup_readline, save_history, SHELL_HISTORY_FILE_NAME, EXIT_COMMANDS
 
 
 @click.group()
+@click.option("--format", "output_format", default=OutputFormat.TEXT.value,
+              type=click.Choice([output_format.value for output_format in OutputFormat]),
+              help="Output format, ndjson prints one JSON object per line without styling")
 @click.pass_context
-def dojo(ctx):
+def dojo(ctx, output_format: str):
     ctx.ensure_object(dict)
-    ctx.obj['config'] = get_config()
+    if 'config' not in ctx.obj:
+        ctx.obj['config'] = get_config()
+    ctx.obj['output_format'] = OutputFormat(output_format)
 
 @dojo.command("config")
 @click.argument("CONFIG_PATH")
@@ -42,7 +62,59 @@ def config(config: Config, config_path: str, set_value: Optional[str]):
 def leetcode(ctx, config: Config):
     """Use LeetCode API to get problems and test/submit their solutions"""
     ctx.ensure_object(dict)
-    
+    if 'client' not in ctx.obj:
+        ctx.obj.update(create_leetcode_objects(config))
+    ctx.obj['printer'] = OutputPrinter(ctx.obj.get('output_format', OutputFormat.TEXT), ctx.obj['styler'])
+
+@dojo.command("shell")
+@pass_config
+@click.pass_context
+def shell(ctx, config: Config):
+    """Run dojo commands in an interactive session that keeps LeetCode connection and loaded data between commands"""
+    history_path = Path(config.get("main", "cache_dir")).joinpath(SHELL_HISTORY_FILE_NAME)
+    setup_readline(dojo, history_path)
+    click.echo("Type commands without \"dojo\" prefix, \"exit\" to quit")
+
+    try:
+        while True:
+            try:
+                line = input("dojo> ")
+            except KeyboardInterrupt:
+                click.echo()
+                continue
+            except EOFError:
+                click.echo()
+                break
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                click.echo(f"Error: {e}", err=True)
+                continue
+            if len(args) == 0:
+                continue
+            if args[0] in EXIT_COMMANDS:
+                break
+            if args[0] == "shell":
+                click.echo("Already in dojo shell", err=True)
+                continue
+
+            try:
+                dojo.main(args, prog_name="dojo", standalone_mode=False, obj=ctx.obj)
+            except click.exceptions.Exit:
+                pass
+            except click.ClickException as e:
+                e.show()
+            except click.Abort:
+                click.echo("Aborted!", err=True)
+            except KeyboardInterrupt:
+                click.echo()
+            except Exception as e:
+                click.echo(f"Error: {e}", err=True)
+    finally:
+        save_history(history_path)
+
+def create_leetcode_objects(config: Config) -> Dict[str, Any]:
     formatter = ProblemFormatter(
         max_description_line_length=config.get("main", "max_description_line_length"),
         code_prefixes=config.get("providers", "leetcode", "code_prefixes")
@@ -53,21 +125,35 @@ def leetcode(ctx, config: Config):
         ColorType.VALUE: config.get("main", "colors", "value"),
         ColorType.DELIMITER: config.get("main", "colors", "delimiter")
     })
+    cache = JsonCache(
+        provider="leetcode",
+        cache_path=Path(config.get("main", "cache_dir"))
+    )
     client = LeetCodeClient(
-        cookies_file_path=Path(config.get("providers", "leetcode", "cookies_path"))
+        cookies_file_path=Path(config.get("providers", "leetcode", "cookies_path")),
+        cache=cache,
+        max_concurrent_requests=config.get("providers", "leetcode", "max_concurrent_requests"),
+        max_result_line_length=config.get("main", "max_result_line_length"),
+        max_result_lines=config.get("main", "max_result_lines"),
+        asset_store=AssetStore(cache.cache_path.joinpath(ASSETS_DIR_NAME)) if config.get("main", "download_assets") else None
     )
     keeper = ProblemKeeper(
         provider="leetcode",
         formatter=formatter,
         problems_path=Path(config.get("main", "problems_dir", allow_last_none=True)),
-        
+        storage_type=ProblemStorageType(config.get("main", "problems_storage")),
+        search_index=SearchIndex(cache.cache_path.joinpath(SEARCH_INDEX_FILE_NAME)),
+        completion_index=get_completion_index(config.get("main", "cache_dir"), "leetcode")
     )
 
-    ctx.obj['styler'] = styler
-    ctx.obj['client'] = client
-    ctx.obj['keeper'] = keeper
+    return {
+        'styler': styler,
+        'client': client,
+        'keeper': keeper,
+        'cache': cache
+    }
 
 
 if __name__ == "__main__":
     add_leetcode_commands(leetcode)
-    dojo()
\ No newline at end of file
+    dojo(prog_name="dojo", complete_var=COMPLETE_VAR)
\ No newline at end of file
@@ -0,0 +1,346 @@
+import asyncio
+from typing import Callable, Dict, Any, Optional, Set, List
+from pathlib import Path
+from http.cookiejar import MozillaCookieJar
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+import providers.leetcode.classes as classes
+import providers.leetcode.exceptions as exceptions
+import providers.leetcode.queries as queries
+from providers.leetcode.languages import LANGUAGE_TO_SLUG
+from classes.result import CommitResult, ResultStates
+from classes.language import Language
+from utils.cache import JsonCache
+from .client import LeetCodeClientBase, HEADERS, PENDING_DELAY_S, utc_date
+from .converter import LeetCodeConverter, OUTPUTS_DIR_NAME
+
+
+class AsyncLeetCodeClient(LeetCodeClientBase):
+    cookies: Dict[str, str]
+    headers: Dict[str, str]
+    _session: Optional["aiohttp.ClientSession"]
+    _semaphore: asyncio.Semaphore
+
+    def __init__(
+        self,
+        cookies_file_path: Path,
+        cache: Optional[JsonCache]=None,
+        max_concurrent_requests: int=8,
+        max_result_line_length: Optional[int]=None,
+        max_result_lines: Optional[int]=None
+    ) -> None:
+        if aiohttp is None:
+            raise RuntimeError("AsyncLeetCodeClient requires aiohttp, install it with \"pip install aiohttp\"")
+
+        self.converter = LeetCodeConverter(
+            max_output_length=max_result_line_length,
+            outputs_path=cache.cache_path.joinpath(OUTPUTS_DIR_NAME) if cache is not None else None,
+            max_output_lines=max_result_lines
+        )
+        self.cache = cache
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self._session = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        jar = MozillaCookieJar(cookies_file_path)
+        jar.load(cookies_file_path, ignore_expires=True)
+        self.cookies = {cookie.name: cookie.value for cookie in jar}
+        self.headers = dict(HEADERS)
+
+        if (csrf_token := self.cookies.get("csrftoken")) is not None:
+            self.headers["X-Csrftoken"] = csrf_token
+        else:
+            raise RuntimeError("No csrf cookie provided")
+
+        if self.cookies.get("LEETCODE_SESSION") is None:
+            raise RuntimeError("No LEETCODE_SESSION cookie provided")
+
+    async def __aenter__(self) -> "AsyncLeetCodeClient":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_problem(self, title_slug: str, languages: Set[Language]) -> classes.LeetCodeProblem:
+        if (question := await self.get_question(title_slug)) is None:
+            raise ValueError(f"Problem \"{title_slug}\" was not found")
+        return self.converter.json_to_problem(question, languages)
+
+    async def get_question(self, title_slug: str) -> Optional[Dict[str, Any]]:
+        data = await self._make_graphql_request("questionData", queries.QUESTION_DATA_QUERY, titleSlug=title_slug)
+
+        question = data.get("data").get("question")
+        await asyncio.to_thread(self._cache_question, question)
+        return question
+
+    async def get_problems(
+        self,
+        title_slugs: List[str],
+        languages: Set[Language],
+        on_error: Optional[Callable[[str, Exception], None]]=None
+    ) -> List[Optional[classes.LeetCodeProblem]]:
+        async def get_problem_or_none(title_slug: str) -> Optional[classes.LeetCodeProblem]:
+            try:
+                return await self.get_problem(title_slug, languages)
+            except (exceptions.AuthenticationFailed, exceptions.RateLimited):
+                raise
+            except Exception as e:
+                if on_error is not None:
+                    on_error(title_slug, e)
+                return None
+
+        return list(await asyncio.gather(*(get_problem_or_none(title_slug) for title_slug in title_slugs)))
+
+    async def test_solution(
+        self,
+        problem: classes.LeetCodeProblem,
+        test_input: Optional[str],
+        use_cache: bool=True
+    ) -> CommitResult:
+        test_input = test_input or problem.test_input
+        result_key = self._get_result_key("test", problem, test_input)
+        if use_cache and (cached_result := await asyncio.to_thread(self._get_cached_result, result_key)) is not None:
+            return cached_result
+
+        data = await self._make_request(
+            f"problems/{problem.title_slug}/interpret_solution/",
+            "POST",
+            headers={
+                "Referer": f"https://leetcode.com/problems/{problem.title_slug}/"
+            },
+            json={
+                "question_id": problem.problem_id,
+                "data_input": test_input,
+                "lang": LANGUAGE_TO_SLUG[problem.language],
+                "typed_code": problem.solution_code,
+                "judge_type": problem.judge_type
+            }
+        )
+
+        result = await self._await_running_submission(problem, data.get("interpret_id"), test_input, result_key)
+        await asyncio.to_thread(self._cache_result, result_key, result)
+        return result
+
+    async def submit_solution(self, problem: classes.LeetCodeProblem, use_cache: bool=True) -> CommitResult:
+        result_key = self._get_result_key("submit", problem)
+        if use_cache and (cached_result := await asyncio.to_thread(self._get_cached_result, result_key)) is not None:
+            return cached_result
+
+        json = {
+            "question_id": problem.problem_id,
+            "lang": LANGUAGE_TO_SLUG[problem.language],
+            "typed_code": problem.solution_code,
+        }
+
+        if problem.study_plan_slug is not None:
+            json["study_plan_slug"] = problem.study_plan_slug
+        data = await self._make_request(
+            f"problems/{problem.title_slug}/submit/",
+            "POST",
+            headers={
+                "Referer": f"https://leetcode.com/problems/{problem.title_slug}/"
+            },
+            json=json
+        )
+
+        result = await self._await_running_submission(problem, data.get("submission_id"), result_key=result_key)
+        await asyncio.to_thread(self._cache_result, result_key, result)
+        if result.state == ResultStates.Accepted.value:
+            await asyncio.to_thread(self._invalidate_prefetched_plan_problem, problem.title_slug)
+        return result
+
+    async def search_problem(self, problem_title: str, languages: Set[Language]) -> Optional[classes.LeetCodeProblem]:
+        data = await self._make_graphql_request(
+            "problemsetQuestionList",
+            queries.PROBLEMSET_QUESTION_LIST_QUERY,
+            categorySlug="all-code-essentials",
+            skip=0,
+            limit=1,
+            filters={"searchKeywords": problem_title.lower()}
+        )
+
+        problems = data.get("data").get("problemsetQuestionList").get("questions")
+        if len(problems) == 0:
+            return None
+
+        await asyncio.to_thread(self._cache_question, problems[0])
+        return self.converter.json_to_problem(problems[0], languages)
+
+    async def get_random_problem(
+        self,
+        languages: Set[Language],
+        difficulty: Optional[classes.LeetCodeProblemDifficulty]=None,
+        include_solved: bool=False
+    ) -> classes.LeetCodeProblem:
+        filters = {}
+        if difficulty is not None:
+            filters["difficulty"] = difficulty.value.upper()
+        if not include_solved:
+            filters["status"] = "NOT_STARTED"
+
+        data = await self._make_graphql_request(
+            "randomQuestion",
+            queries.RANDOM_QUESTION_QUERY,
+            categorySlug="all-code-essentials",
+            filters=filters
+        )
+
+        question = data.get("data").get("randomQuestion")
+        await asyncio.to_thread(self._cache_question, question)
+        return self.converter.json_to_problem(question, languages)
+
+    async def get_problem_of_today(self, languages: Set[Language]) -> classes.LeetCodeProblem:
+        if (question := await asyncio.to_thread(self._get_prefetched_question_of_today)) is None:
+            date = utc_date()
+            data = await self._make_graphql_request("questionOfToday", queries.QUESTION_OF_TODAY_QUERY)
+            question = data.get("data").get("activeDailyCodingChallengeQuestion").get("question")
+            await asyncio.to_thread(self._cache_question_of_today, question, date)
+        return self.converter.json_to_problem(question, languages)
+
+    async def get_next_plan_problem(self, plan_slug: str, languages: Set[Language]) -> Optional[classes.LeetCodeProblem]:
+        problem_slug = await self.get_next_plan_problem_slug(plan_slug)
+        if problem_slug is None:
+            return None
+        problem = await self.get_problem(problem_slug, languages)
+        problem.study_plan_slug = plan_slug
+        return problem
+
+    async def get_next_plan_problem_slug(self, plan_slug: str) -> Optional[str]:
+        return self._select_next_plan_problem_slug(plan_slug, await self.get_plan_statuses(plan_slug))
+
+    async def get_study_plan(self, plan_slug: str) -> Optional[classes.LeetCodeStudyPlan]:
+        data = await self._make_graphql_request("studyPlanStructure", queries.STUDY_PLAN_STRUCTURE_QUERY, slug=plan_slug)
+
+        plan_data = data.get("data").get("studyPlanV2Detail")
+        if plan_data is None:
+            return None
+        plan = self.converter.json_to_study_plan(plan_data)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.set, "plans", plan_slug, plan.to_json())
+        return plan
+
+    async def get_plan_statuses(self, plan_slug: str) -> Optional[Dict[str, Optional[str]]]:
+        data = await self._make_graphql_request("studyPlanProgress", queries.STUDY_PLAN_PROGRESS_QUERY, slug=plan_slug)
+
+        plan_data = data.get("data").get("studyPlanV2Detail")
+        if plan_data is None:
+            return None
+        return self.converter.json_to_plan_statuses(plan_data)
+
+    async def get_current_username(self) -> str:
+        data = await self._make_graphql_request("globalData", queries.GLOBAL_DATA_QUERY)
+        return self.converter.json_to_current_username(data.get("data"))
+
+    async def get_user_stats(self, username: str) -> Optional[classes.LeetCodeUserStats]:
+        profile_data, languages_data, problems_data = await asyncio.gather(
+            self._make_graphql_request("userPublicProfile", queries.USER_PUBLIC_PROFILE_QUERY, username=username),
+            self._make_graphql_request("languageStats", queries.LANGUAGE_STATS_QUERY, username=username),
+            self._make_graphql_request("userProblemsSolved", queries.USER_PROBLEMS_SOLVED_QUERY, username=username)
+        )
+        return self.converter.json_to_user_stats(
+            username,
+            profile_data.get("data"),
+            languages_data.get("data"),
+            problems_data.get("data")
+        )
+
+    async def get_users_stats(self, usernames: List[str]) -> Dict[str, Optional[classes.LeetCodeUserStats]]:
+        users_json, chunks = await asyncio.to_thread(self._get_cached_users_stats_json, usernames)
+        for chunk_json in await asyncio.gather(*(self._get_users_stats_json(chunk) for chunk in chunks)):
+            users_json.update(chunk_json)
+        return self._users_stats_from_json(usernames, users_json)
+
+    async def _get_users_stats_json(self, usernames: List[str]) -> Dict[str, Dict[str, Any]]:
+        aliases = {f"user{i}": username for i, username in enumerate(usernames)}
+        data = await self._make_graphql_request(
+            "usersStats",
+            queries.users_stats_query(list(aliases)),
+            **aliases
+        )
+        return await asyncio.to_thread(self._split_users_stats_json, aliases, data.get("data"))
+
+    async def _await_running_submission(
+        self,
+        problem: classes.LeetCodeProblem,
+        run_id: str,
+        run_input: Optional[str]=None,
+        result_key: Optional[str]=None
+    ) -> CommitResult:
+        while True:
+            data = await self._make_request(
+                f"submissions/detail/{run_id}/check/",
+                headers={
+                    "Referer": f"https://leetcode.com/problems/{problem.title_slug}/"
+                }
+            )
+
+            if data.get("state") in ["PENDING", "STARTED"]:
+                await asyncio.sleep(PENDING_DELAY_S)
+                continue
+
+            return await asyncio.to_thread(self.converter.json_to_commit_result, problem, data, run_input, result_key)
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self.BASE_URL,
+                headers=self.headers,
+                cookies=self.cookies,
+                connector=aiohttp.TCPConnector(limit=self.max_concurrent_requests)
+            )
+        return self._session
+
+    async def _make_request(
+        self,
+        path: str,
+        method: str="GET",
+        headers: Optional[Dict[str, str]]=None,
+        json: Optional[Dict[str, Any]]=None
+    ) -> Dict[str, Any]:
+        session = self._get_session()
+        async with self._semaphore:
+            async with session.request(method, f"/{path}", headers=headers, json=json) as response:
+                if response.status == 403:
+                    error = None
+                    try:
+                        error = (await response.json(content_type=None)).get("error")
+                    except Exception:
+                        pass
+                    if error is not None and error == "User is not authenticated":
+                        raise exceptions.AuthenticationFailed("Authentication failed, check LEETCODE_SESSION cookie.")
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After")
+                    raise exceptions.RateLimited(
+                        "Leetcode rate limit exceeded",
+                        float(retry_after) if retry_after is not None and retry_after.isdigit() else None
+                    )
+                if response.status != 200:
+                    raise exceptions.RequestFailed(f"Leetcode returned {response.status}", response.status)
+                return await response.json(content_type=None)
+
+    async def _make_graphql_request(
+        self,
+        operation_name: str,
+        query: str,
+        headers: Optional[Dict[str, str]]=None,
+        **variables: Any
+    ) -> Dict[str, Any]:
+        return await self._make_request(
+            path="graphql",
+            method="POST",
+            headers=headers,
+            json={
+                "operationName": operation_name,
+                "variables": variables,
+                "query": query
+            }
+        )
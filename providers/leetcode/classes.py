@@ -1,10 +1,14 @@
-from typing import Dict, Optional
+from time import time
+from math import ceil
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 
 from utils.style import OutputStyler, ColorType
+from utils.submission_queue import QueuedSubmission, SubmissionState
 from classes.problem import Problem
-from classes.result import CommitResult
+from classes.result import CommitResult, ResultState, ResultStates
+from classes.language import any_language_by_name
 from classes.stats import UserStats
 
 
@@ -23,6 +27,8 @@ class LeetCodeProblem(Problem):
             "study_plan_slug": self.study_plan_slug
         }
 
+REQUIRED_METADATA = ("problem_id", "judge_type")
+
 @dataclass()
 class LeetCodeCommitResult(CommitResult):
     memory: Optional[str]
@@ -34,10 +40,50 @@ class LeetCodeCommitResult(CommitResult):
     input: Optional[str]
     output: Optional[str]
     error: Optional[str]
+    full_output_path: Optional[str] = field(default=None)
+    cached: bool = field(default=False)
     
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "problem_title": self.problem_title,
+            "language": self.language.name,
+            "state": self.state.value,
+            "memory": self.memory,
+            "runtime": self.runtime,
+            "memory_percentile": self.memory_percentile,
+            "runtime_percentile": self.runtime_percentile,
+            "answer": self.answer,
+            "expected_answer": self.expected_answer,
+            "input": self.input,
+            "output": self.output,
+            "error": self.error,
+            "full_output_path": self.full_output_path
+        }
+
+    @classmethod
+    def from_json(cls, json: Dict[str, Any], cached: bool=False) -> "LeetCodeCommitResult":
+        return cls(
+            problem_title=json.get("problem_title"),
+            language=any_language_by_name(json.get("language")),
+            state=ResultStates.by_value(json.get("state")),
+            memory=json.get("memory"),
+            runtime=json.get("runtime"),
+            memory_percentile=json.get("memory_percentile"),
+            runtime_percentile=json.get("runtime_percentile"),
+            answer=json.get("answer"),
+            expected_answer=json.get("expected_answer"),
+            input=json.get("input"),
+            output=json.get("output"),
+            error=json.get("error"),
+            full_output_path=json.get("full_output_path"),
+            cached=cached
+        )
     
     def cut_lines(self, max_line_length: int) -> None:
-        for line in ["input", "answer", "expected_answer", "output", "error"]:
+        lines = ["input", "error"]
+        if self.full_output_path is None:
+            lines.extend(["answer", "expected_answer", "output"])
+        for line in lines:
             line_value = getattr(self, line)
             if line_value is not None and len(line_value) > max_line_length:
                 setattr(self, line, f"{line_value[:max_line_length]}... ({len(line_value)-max_line_length} characters more)")
@@ -59,10 +105,13 @@ class LeetCodeCommitResult(CommitResult):
             if line[1] is not None and len(line[1]) > 0
         ])
 
-        result_str = f"{self.problem_title} ({self.language.name}): {self.state}\nMemory: {memory}, Runtime: {runtime}"
+        cached = " (cached)" if self.cached else ""
+        result_str = f"{self.problem_title} ({self.language.name}): {self.state}{cached}\nMemory: {memory}, Runtime: {runtime}"
 
         if len(body) > 0:
             result_str+=f"\n\n{body}"
+        if self.full_output_path is not None:
+            result_str+=f"\n\nFull output: {self.full_output_path}"
 
         return result_str
     
@@ -88,13 +137,67 @@ class LeetCodeCommitResult(CommitResult):
 
         title = styler.style(self.problem_title, ColorType.TITLE)
         language = styler.style(self.language.name, ColorType.LANGUAGE)
-        result_str = f"{title} ({language}){dlmt} {self.state.styled_str(styler)}\nMemory{dlmt} {memory}, Runtime{dlmt} {runtime}"
+        cached = " (cached)" if self.cached else ""
+        result_str = f"{title} ({language}){dlmt} {self.state.styled_str(styler)}{cached}\nMemory{dlmt} {memory}, Runtime{dlmt} {runtime}"
 
         if len(body) > 0:
             result_str+=f"\n\n{body}"
+        if self.full_output_path is not None:
+            result_str+=f"\n\nFull output{dlmt} {self.full_output_path}"
 
         return result_str
 
+@dataclass()
+class LeetCodeStudyPlan:
+    slug: str
+    name: str
+    problem_slugs: List[str]
+    premium_slugs: List[str] = field(default_factory=list)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "slug": self.slug,
+            "name": self.name,
+            "problem_slugs": self.problem_slugs,
+            "premium_slugs": self.premium_slugs
+        }
+
+    @classmethod
+    def from_json(cls, json: Dict[str, Any]) -> "LeetCodeStudyPlan":
+        return cls(
+            slug=json.get("slug"),
+            name=json.get("name"),
+            problem_slugs=json.get("problem_slugs"),
+            premium_slugs=json.get("premium_slugs") or list()
+        )
+
+@dataclass()
+class LeetCodeContest:
+    slug: str
+    title: str
+    start_time: int
+    duration: int
+    problem_slugs: List[str] = field(default_factory=list)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "slug": self.slug,
+            "title": self.title,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "problem_slugs": self.problem_slugs
+        }
+
+    @classmethod
+    def from_json(cls, json: Dict[str, Any]) -> "LeetCodeContest":
+        return cls(
+            slug=json.get("slug"),
+            title=json.get("title"),
+            start_time=json.get("start_time"),
+            duration=json.get("duration"),
+            problem_slugs=json.get("problem_slugs") or list()
+        )
+
 class LeetCodeProblemDifficulty(Enum):
     All = "all"
     Easy = "easy"
@@ -123,6 +226,22 @@ class LeetCodeUserStats(UserStats):
     languages_problems_sovled: Dict[str, int]
     difficulty_problems_stats: Dict[LeetCodeProblemDifficulty, "DifficultyProblemsStats"]
 
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "username": self.username,
+            "real_name": self.real_name,
+            "rank": self.rank,
+            "views_count": self.views_count,
+            "solution_count": self.solution_count,
+            "discuss_count": self.discuss_count,
+            "reputation": self.reputation,
+            "languages_problems_solved": self.languages_problems_sovled,
+            "difficulty_problems_stats": {
+                difficulty.value: stats.to_json()
+                for difficulty, stats in self.difficulty_problems_stats.items()
+            }
+        }
+
     def __str__(self) -> str:
         username = f"{self.username} ({self.real_name})" if self.real_name is not None else self.username
         metrics = f"Rank: {self.rank}\nViews: {self.views_count}\nSolution: {self.solution_count}\nDiscuss: {self.discuss_count}\nReputation: {self.reputation}"
@@ -166,6 +285,13 @@ class DifficultyProblemsStats:
     solved: int
     beats_percentage: Optional[float]
 
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "total_problems": self.total_problems,
+            "solved": self.solved,
+            "beats_percentage": self.beats_percentage
+        }
+
     def __str__(self) -> str:
         string = f"{self.solved}/{self.total_problems}"
         if self.beats_percentage is not None:
@@ -176,4 +302,302 @@ class DifficultyProblemsStats:
         string = styler.style(f"{self.solved}/{self.total_problems}", ColorType.VALUE)
         if self.beats_percentage is not None:
             string+=f" (Beats {round(self.beats_percentage, 2)}%)"
-        return string
\ No newline at end of file
+        return string
+
+class LeaderboardSortKey(Enum):
+    Solved = "solved"
+    Easy = "easy"
+    Medium = "medium"
+    Hard = "hard"
+    Rank = "rank"
+    Reputation = "reputation"
+
+@dataclass()
+class LeetCodeLeaderboard(UserStats):
+    users: List[LeetCodeUserStats]
+    sort_key: LeaderboardSortKey = field(default=LeaderboardSortKey.Solved)
+
+    def sorted_users(self) -> List[LeetCodeUserStats]:
+        def solved(user: LeetCodeUserStats, difficulty: LeetCodeProblemDifficulty) -> int:
+            return user.difficulty_problems_stats[difficulty].solved or 0
+
+        match self.sort_key:
+            case LeaderboardSortKey.Rank:
+                return sorted(self.users, key=lambda user: user.rank or float("inf"))
+            case LeaderboardSortKey.Reputation:
+                return sorted(self.users, key=lambda user: user.reputation or 0, reverse=True)
+            case LeaderboardSortKey.Solved:
+                difficulty = LeetCodeProblemDifficulty.All
+            case _:
+                difficulty = LeetCodeProblemDifficulty(self.sort_key.value)
+        return sorted(self.users, key=lambda user: solved(user, difficulty), reverse=True)
+
+    def rows(self) -> List[List[str]]:
+        return [
+            [
+                str(place), user.username, str(user.rank),
+                *(str(user.difficulty_problems_stats[difficulty].solved) for difficulty in LEADERBOARD_DIFFICULTIES),
+                str(user.reputation)
+            ]
+            for place, user in enumerate(self.sorted_users(), start=1)
+        ]
+
+    def __str__(self) -> str:
+        return table_str(LEADERBOARD_HEADER, self.rows())
+
+    def styled_str(self, styler: OutputStyler) -> str:
+        return styled_table_str(LEADERBOARD_HEADER, self.rows(), styler, key_column=1)
+
+LEADERBOARD_DIFFICULTIES = [
+    LeetCodeProblemDifficulty.Easy,
+    LeetCodeProblemDifficulty.Medium,
+    LeetCodeProblemDifficulty.Hard,
+    LeetCodeProblemDifficulty.All
+]
+LEADERBOARD_HEADER = ["#", "User", "Rank", "Easy", "Medium", "Hard", "Solved", "Reputation"]
+
+@dataclass()
+class LeetCodeSubmitComparison:
+    results: List[LeetCodeCommitResult]
+
+    def rows(self) -> List[List[str]]:
+        def percentile(value: Optional[float]) -> str:
+            return f"{round(value, 2)}%" if value is not None else "-"
+
+        return [
+            [
+                result.language.name,
+                result.state.value+(" (cached)" if result.cached else "")
+                    +(f": {result.error}" if result.state == ResultStates.Unknown.value and result.error else ""),
+                result.runtime or "-", percentile(result.runtime_percentile),
+                result.memory or "-", percentile(result.memory_percentile)
+            ]
+            for result in self.results
+        ]
+
+    def __str__(self) -> str:
+        return table_str(SUBMIT_COMPARISON_HEADER, self.rows())
+
+    def styled_str(self, styler: OutputStyler) -> str:
+        return styled_table_str(SUBMIT_COMPARISON_HEADER, self.rows(), styler, key_column=0)
+
+@dataclass()
+class LeetCodeQuestionStatus:
+    title_slug: str
+    difficulty: str
+    status: Optional[str]
+    tags: List[str]
+    paid_only: bool = field(default=False)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "title_slug": self.title_slug,
+            "difficulty": self.difficulty,
+            "status": self.status,
+            "tags": self.tags,
+            "paid_only": self.paid_only
+        }
+
+    @classmethod
+    def from_json(cls, json: Dict[str, Any]) -> "LeetCodeQuestionStatus":
+        return cls(
+            title_slug=json.get("title_slug"),
+            difficulty=json.get("difficulty"),
+            status=json.get("status"),
+            tags=json.get("tags") or list(),
+            paid_only=json.get("paid_only") or False
+        )
+
+@dataclass()
+class ProgressGroup:
+    name: str
+    total: int
+    solved: int
+    attempted: int
+
+    @property
+    def coverage(self) -> float:
+        return self.solved/self.total*100 if self.total > 0 else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "total": self.total,
+            "solved": self.solved,
+            "attempted": self.attempted
+        }
+
+    def row(self) -> List[str]:
+        return [self.name, str(self.solved), str(self.attempted), str(self.total), f"{round(self.coverage, 1)}%"]
+
+@dataclass()
+class LeetCodeProgress:
+    username: str
+    synced_at: float
+    difficulties: List[ProgressGroup]
+    tags: List[ProgressGroup]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "username": self.username,
+            "synced_at": self.synced_at,
+            "difficulties": [group.to_json() for group in self.difficulties],
+            "tags": [group.to_json() for group in self.tags]
+        }
+
+    def __str__(self) -> str:
+        difficulties = table_str(["Difficulty", *PROGRESS_HEADER], [group.row() for group in self.difficulties])
+        tags = table_str(["Tag", *PROGRESS_HEADER], [group.row() for group in self.tags])
+        return f"{self.username}\n\n{difficulties}\n\n{tags}"
+
+    def styled_str(self, styler: OutputStyler) -> str:
+        difficulties = styled_table_str(["Difficulty", *PROGRESS_HEADER], [group.row() for group in self.difficulties], styler)
+        tags = styled_table_str(["Tag", *PROGRESS_HEADER], [group.row() for group in self.tags], styler)
+        return f"{styler.style(self.username, ColorType.TITLE)}\n\n{difficulties}\n\n{tags}"
+
+PROGRESS_HEADER = ["Solved", "Attempted", "Total", "Coverage"]
+
+@dataclass()
+class LeetCodeQueueStatus:
+    submissions: List[QueuedSubmission]
+
+    def rows(self) -> List[List[str]]:
+        def result_str(submission: QueuedSubmission) -> str:
+            if submission.result is not None:
+                result = LeetCodeCommitResult.from_json(submission.result)
+                return " ".join(value for value in (result.state.value, result.runtime, result.memory) if value)
+            if submission.state == SubmissionState.QUEUED and submission.next_attempt_at > time():
+                return f"retry in {ceil(submission.next_attempt_at-time())}s: {submission.error}"
+            return submission.error or "-"
+
+        return [
+            [
+                str(submission.submission_id), submission.problem_title, submission.language,
+                submission.state.value, str(submission.attempts), result_str(submission)
+            ]
+            for submission in self.submissions
+        ]
+
+    def __str__(self) -> str:
+        return table_str(QUEUE_STATUS_HEADER, self.rows())
+
+    def styled_str(self, styler: OutputStyler) -> str:
+        return styled_table_str(QUEUE_STATUS_HEADER, self.rows(), styler, key_column=2)
+
+QUEUE_STATUS_HEADER = ["ID", "Problem", "Language", "State", "Attempts", "Result"]
+
+@dataclass()
+class LeetCodeBenchmark:
+    problem_title: str
+    sizes: List[int]
+    times: List[float]
+    complexity: str
+    error: float
+    max_size: Optional[int] = field(default=None)
+    projected_time: Optional[float] = field(default=None)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "problem_title": self.problem_title,
+            "sizes": self.sizes,
+            "times": self.times,
+            "complexity": self.complexity,
+            "error": self.error,
+            "max_size": self.max_size,
+            "projected_time": self.projected_time
+        }
+
+    def rows(self) -> List[List[str]]:
+        return [[str(size), format_duration(time)] for size, time in zip(self.sizes, self.times)]
+
+    def _summary(self) -> List[Tuple[str, str]]:
+        summary = [("Complexity", f"{self.complexity} (error {round(self.error*100, 1)}%)")]
+        if self.max_size is not None and self.projected_time is not None:
+            summary.append((f"Projected time for n={self.max_size}", format_duration(self.projected_time)))
+        return summary
+
+    def __str__(self) -> str:
+        summary = "\n".join(f"{name}: {value}" for name, value in self._summary())
+        return f"{self.problem_title}\n{table_str(BENCHMARK_HEADER, self.rows())}\n\n{summary}"
+
+    def styled_str(self, styler: OutputStyler) -> str:
+        dlmt = styler.style(':', ColorType.DELIMITER)
+        summary = "\n".join(f"{name}{dlmt} {styler.style(value, ColorType.VALUE)}" for name, value in self._summary())
+        title = styler.style(self.problem_title, ColorType.TITLE)
+        return f"{title}\n{styled_table_str(BENCHMARK_HEADER, self.rows(), styler)}\n\n{summary}"
+
+@dataclass()
+class LeetCodeFuzzResult:
+    problem_title: str
+    cases: int
+    input: Optional[str] = field(default=None)
+    output: Optional[str] = field(default=None)
+    expected_output: Optional[str] = field(default=None)
+    saved: bool = field(default=False)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "problem_title": self.problem_title,
+            "cases": self.cases,
+            "input": self.input,
+            "output": self.output,
+            "expected_output": self.expected_output,
+            "saved": self.saved
+        }
+
+    def _lines(self) -> List[Tuple[str, Optional[str]]]:
+        return [("Input", self.input), ("Output", self.output), ("Expected", self.expected_output)]
+
+    @property
+    def state(self) -> ResultState:
+        return ResultStates.Rejected.value if self.input is not None else ResultStates.Accepted.value
+
+    def _footer(self) -> str:
+        return "\n\nThe case was added to the problem test input" if self.saved else ""
+
+    def __str__(self) -> str:
+        body = '\n\n'.join(f"{name}:\n{value}" for name, value in self._lines() if value is not None)
+        body = f"\n\n{body}" if len(body) > 0 else ""
+        return f"{self.problem_title}: {self.state}, {self.cases} cases checked{body}{self._footer()}"
+
+    def styled_str(self, styler: OutputStyler) -> str:
+        dlmt = styler.style(':', ColorType.DELIMITER)
+        body = '\n\n'.join(f"{name}{dlmt}\n{value}" for name, value in self._lines() if value is not None)
+        body = f"\n\n{body}" if len(body) > 0 else ""
+        title = styler.style(self.problem_title, ColorType.TITLE)
+        cases = styler.style(str(self.cases), ColorType.VALUE)
+        return f"{title}{dlmt} {self.state.styled_str(styler)}, {cases} cases checked{body}{self._footer()}"
+
+BENCHMARK_HEADER = ["Size", "Time"]
+
+def format_duration(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{round(seconds, 2)}s"
+    if seconds >= 1e-3:
+        return f"{round(seconds*1e3, 2)}ms"
+    return f"{round(seconds*1e6, 2)}us"
+
+SUBMIT_COMPARISON_HEADER = ["Language", "State", "Runtime", "Runtime %", "Memory", "Memory %"]
+
+def table_str(header: List[str], rows: List[List[str]]) -> str:
+    rows = [header, *rows]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return '\n'.join(
+        ' '.join(value.ljust(width) for value, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+def styled_table_str(header: List[str], rows: List[List[str]], styler: OutputStyler, key_column: int=0) -> str:
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    header_line = ' '.join(
+        styler.style(value.ljust(width), ColorType.TITLE)
+        for value, width in zip(header, widths)
+    )
+    lines = [
+        ' '.join(
+            styler.style(value.ljust(width), ColorType.LANGUAGE if i == key_column else ColorType.VALUE)
+            for i, (value, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    ]
+    return '\n'.join([header_line, *lines])
@@ -1,17 +1,27 @@
-from typing import Dict, Any, Optional, Set
-from time import sleep
+from typing import Callable, Dict, Any, Iterator, Optional, Set, List, Tuple
+from time import sleep, time
+from datetime import datetime, timezone
+from threading import Thread
 from pathlib import Path
 from http.cookiejar import MozillaCookieJar
 from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from hashlib import sha256
+from json import dumps
+from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import providers.leetcode.classes as classes
 import providers.leetcode.exceptions as exceptions
+import providers.leetcode.queries as queries
 from providers.leetcode.languages import LANGUAGE_TO_SLUG
-from classes.result import CommitResult
+from classes.result import CommitResult, ResultStates
 from classes.language import Language
-from .converter import LeetCodeConverter
+from utils.cache import JsonCache
+from utils.asset_store import AssetStore
+from .converter import LeetCodeConverter, OUTPUTS_DIR_NAME
 
 
 HEADERS = {
@@ -21,16 +31,189 @@ HEADERS = {
     "Connection": "keep-alive"
 }
 PENDING_DELAY_S = 2
+ASSET_TIMEOUT_S = 30
+PLAN_SOLVED_STATUS = "PAST_SOLVED"
+SOLVED_QUESTION_STATUS = "ac"
+ATTEMPTED_QUESTION_STATUS = "notac"
+ACCEPTED_SUBMISSION_STATUS = "Accepted"
+USERS_PER_REQUEST = 10
+PROBLEMSET_LIMIT = 10000
+PROGRESS_PAGE_SIZE = 500
+RECENT_SUBMISSIONS_LIMIT = 20
+USER_STATS_TTL_S = 5*60
+PREFETCH_TTL_S = 10*60
 
-class LeetCodeClient:
+class LeetCodeClientBase:
     BASE_URL = "https://leetcode.com/"
-    session: requests.Session
     converter: "LeetCodeConverter"
+    cache: Optional[JsonCache]
+    max_concurrent_requests: int
+
+    def get_cached_study_plan(self, plan_slug: str) -> Optional[classes.LeetCodeStudyPlan]:
+        if self.cache is None or (plan_json := self.cache.get("plans", plan_slug)) is None:
+            return None
+        return classes.LeetCodeStudyPlan.from_json(plan_json)
+
+    def get_cached_question(self, title_slug: str, max_age_s: Optional[float]=None) -> Optional[Dict[str, Any]]:
+        if self.cache is None:
+            return None
+        return self.cache.get("questions", title_slug, max_age_s=max_age_s)
+
+    def pop_prefetched_plan_problem_slug(self, plan_slug: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        problem_slug = self.cache.get("prefetched", f"plan-{plan_slug}", max_age_s=PREFETCH_TTL_S)
+        self.cache.delete("prefetched", f"plan-{plan_slug}")
+        if problem_slug is None or (question := self.get_cached_question(problem_slug, PREFETCH_TTL_S)) is None \
+                or question.get("status") == SOLVED_QUESTION_STATUS:
+            return None
+        return problem_slug
+
+    def _invalidate_prefetched_plan_problem(self, title_slug: str) -> None:
+        if self.cache is None:
+            return
+        for key in self.cache.keys("prefetched"):
+            if key.startswith("plan-") and self.cache.get("prefetched", key) == title_slug:
+                self.cache.delete("prefetched", key)
+
+    def _get_prefetched_question_of_today(self) -> Optional[Dict[str, Any]]:
+        if self.cache is None or (today := self.cache.get("prefetched", "today")) is None \
+                or today.get("date") != utc_date():
+            return None
+        return self.get_cached_question(today.get("title_slug"))
+
+    def _cache_question_of_today(self, question: Optional[Dict[str, Any]], date: str) -> None:
+        self._cache_question(question)
+        if self.cache is None or question is None or question.get("content") is None:
+            return
+        self.cache.set("prefetched", "today", {"date": date, "title_slug": question.get("titleSlug")})
+
+    def _select_next_plan_problem_slug(
+        self,
+        plan_slug: str,
+        statuses: Optional[Dict[str, Optional[str]]]
+    ) -> Optional[str]:
+        if statuses is None:
+            return None
+
+        if (plan := self.get_cached_study_plan(plan_slug)) is not None:
+            problem_slugs = plan.problem_slugs
+        else:
+            problem_slugs = list(statuses.keys())
+
+        for problem_slug in problem_slugs:
+            if problem_slug in statuses and statuses[problem_slug] != PLAN_SOLVED_STATUS:
+                return problem_slug
+        return None
+
+    def _get_cached_users_stats_json(
+        self,
+        usernames: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[List[str]]]:
+        users_json: Dict[str, Dict[str, Any]] = dict()
+        missing_usernames = list()
+        for username in dict.fromkeys(usernames):
+            if self.cache is not None and (user_json := self.cache.get("users", username, USER_STATS_TTL_S)) is not None:
+                users_json[username] = user_json
+            else:
+                missing_usernames.append(username)
+
+        chunks = [
+            missing_usernames[i:i+USERS_PER_REQUEST]
+            for i in range(0, len(missing_usernames), USERS_PER_REQUEST)
+        ]
+        return users_json, chunks
+
+    def _split_users_stats_json(
+        self,
+        aliases: Dict[str, str],
+        data: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        users_json = dict()
+        for alias, username in aliases.items():
+            users_json[username] = {
+                "allQuestionsCount": data.get("allQuestionsCount"),
+                "matchedUser": data.get(alias)
+            }
+            if self.cache is not None and data.get(alias) is not None:
+                self.cache.set("users", username, users_json[username])
+        return users_json
+
+    def _users_stats_from_json(
+        self,
+        usernames: List[str],
+        users_json: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Optional[classes.LeetCodeUserStats]]:
+        stats = dict()
+        for username in dict.fromkeys(usernames):
+            user_json = users_json.get(username)
+            try:
+                stats[username] = self.converter.json_to_user_stats(username, user_json, user_json, user_json)
+            except exceptions.UserNotFound:
+                stats[username] = None
+        return stats
+
+    def _cache_question(self, question: Optional[Dict[str, Any]]) -> None:
+        if self.cache is None or question is None or question.get("content") is None:
+            return
+        self.cache.set("questions", question.get("titleSlug"), question)
+
+    def _get_result_key(
+        self,
+        kind: str,
+        problem: classes.LeetCodeProblem,
+        test_input: Optional[str]=None
+    ) -> str:
+        key_data = dumps(
+            [kind, problem.title_slug, LANGUAGE_TO_SLUG[problem.language], problem.solution_code, test_input, problem.judge_type, problem.study_plan_slug],
+            ensure_ascii=False
+        )
+        return sha256(key_data.encode("utf-8")).hexdigest()
+
+    def _get_cached_result(self, result_key: str) -> Optional[classes.LeetCodeCommitResult]:
+        if self.cache is None or (result_json := self.cache.get("results", result_key)) is None:
+            return None
+        result = classes.LeetCodeCommitResult.from_json(result_json, cached=True)
+        if result.full_output_path is not None and not Path(result.full_output_path).is_file():
+            result.full_output_path = None
+        return result
 
-    def __init__(self, cookies_file_path: Path) -> None:
+    def _cache_result(self, result_key: str, result: Optional[CommitResult]) -> None:
+        if self.cache is None or not isinstance(result, classes.LeetCodeCommitResult) \
+                or result.state == ResultStates.Unknown.value:
+            return
+        self.cache.set("results", result_key, result.to_json())
+
+class LeetCodeClient(LeetCodeClientBase):
+    session: requests.Session
+    asset_session: requests.Session
+    asset_store: Optional[AssetStore]
+
+    def __init__(
+        self,
+        cookies_file_path: Path,
+        cache: Optional[JsonCache]=None,
+        max_concurrent_requests: int=8,
+        max_result_line_length: Optional[int]=None,
+        max_result_lines: Optional[int]=None,
+        asset_store: Optional[AssetStore]=None
+    ) -> None:
         self.session = requests.Session()
-        self.converter = LeetCodeConverter()
-        self.session.headers = HEADERS
+        self.asset_session = requests.Session()
+        self.asset_session.headers["User-Agent"] = HEADERS["User-Agent"]
+        self.converter = LeetCodeConverter(
+            max_output_length=max_result_line_length,
+            asset_store=asset_store,
+            outputs_path=cache.cache_path.joinpath(OUTPUTS_DIR_NAME) if cache is not None else None,
+            max_output_lines=max_result_lines
+        )
+        self.cache = cache
+        self.asset_store = asset_store
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.session.headers = dict(HEADERS)
+
+        adapter = HTTPAdapter(pool_maxsize=self.max_concurrent_requests)
+        self.session.mount("https://", adapter)
 
         jar = MozillaCookieJar(cookies_file_path)
         jar.load(cookies_file_path, ignore_expires=True)
@@ -46,17 +229,70 @@ class LeetCodeClient:
             raise RuntimeError("No LEETCODE_SESSION cookie provided")
         
 
-    def get_problem(self, title_slug: str, languages: Set[Language]) -> classes.LeetCodeProblem:
+    def get_problem(
+        self,
+        title_slug: str,
+        languages: Set[Language],
+        max_cache_age_s: Optional[float]=None
+    ) -> classes.LeetCodeProblem:
+        question = self.get_cached_question(title_slug, max_cache_age_s) if max_cache_age_s is not None else None
+        if (question := question or self.get_question(title_slug)) is None:
+            raise ValueError(f"Problem \"{title_slug}\" was not found")
+        return self.question_to_problem(question, languages)
+
+    def get_question(self, title_slug: str) -> Optional[Dict[str, Any]]:
+        question = self._fetch_question(title_slug)
+        self._cache_question(question)
+        return question
+
+    def get_problems(
+        self,
+        title_slugs: List[str],
+        languages: Set[Language],
+        on_error: Optional[Callable[[str, Exception], None]]=None
+    ) -> List[Optional[classes.LeetCodeProblem]]:
+        def get_problem_or_none(title_slug: str) -> Optional[classes.LeetCodeProblem]:
+            try:
+                return self.get_problem(title_slug, languages)
+            except (exceptions.AuthenticationFailed, exceptions.RateLimited):
+                raise
+            except Exception as e:
+                if on_error is not None:
+                    on_error(title_slug, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            return list(executor.map(get_problem_or_none, title_slugs))
+
+    def get_questions(self, title_slugs: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        title_slugs = list(dict.fromkeys(title_slugs))
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            questions = dict(zip(title_slugs, executor.map(self._fetch_question, title_slugs)))
+
+        for title_slug, question in questions.items():
+            if question != self.get_cached_question(title_slug):
+                self._cache_question(question)
+        return questions
+
+    def _fetch_question(self, title_slug: str) -> Optional[Dict[str, Any]]:
         resp = self._make_graphql_request(
             "questionData",
-            "query questionData($titleSlug: String!) {\n  question(titleSlug: $titleSlug) {\n    questionId\n    isPaidOnly\n    title\n    titleSlug\n    content\n    difficulty\n    categoryTitle\n    topicTags {\n      name\n    }\n    codeSnippets {\n      langSlug\n      code\n    }\n    sampleTestCase\n    judgeType\n  }\n}\n",
+            queries.QUESTION_DATA_QUERY,
             titleSlug=title_slug
         )
-
-        return self.converter.json_to_problem(resp.json().get("data").get("question"), languages)
+        return resp.json().get("data").get("question")
     
-    def test_solution(self, problem: classes.LeetCodeProblem, test_input: Optional[str]) -> CommitResult:
+    def test_solution(
+        self,
+        problem: classes.LeetCodeProblem,
+        test_input: Optional[str],
+        use_cache: bool=True
+    ) -> CommitResult:
         test_input = test_input or problem.test_input
+        result_key = self._get_result_key("test", problem, test_input)
+        if use_cache and (cached_result := self._get_cached_result(result_key)) is not None:
+            return cached_result
+
         resp = self._make_request(
             f"problems/{problem.title_slug}/interpret_solution/",
             "POST",
@@ -73,10 +309,21 @@ class LeetCodeClient:
         )
 
         run_id = resp.json().get("interpret_id")
-        result = self._await_running_submission(problem, run_id, test_input)
+        result = self._await_running_submission(problem, run_id, test_input, result_key)
+        self._cache_result(result_key, result)
         return result
     
-    def submit_solution(self, problem: classes.LeetCodeProblem) -> CommitResult:
+    def submit_solution(
+        self,
+        problem: classes.LeetCodeProblem,
+        use_cache: bool=True,
+        on_submitted: Optional[Callable[[str], None]]=None,
+        contest_slug: Optional[str]=None
+    ) -> CommitResult:
+        result_key = self._get_result_key("submit", problem)
+        if use_cache and (cached_result := self._get_cached_result(result_key)) is not None:
+            return cached_result
+
         json = {
             "question_id": problem.problem_id,
             "lang": LANGUAGE_TO_SLUG[problem.language],
@@ -85,22 +332,73 @@ class LeetCodeClient:
         
         if problem.study_plan_slug is not None:
             json["study_plan_slug"] = problem.study_plan_slug
+        problem_path = f"contest/{contest_slug}/problems/{problem.title_slug}" if contest_slug is not None \
+            else f"problems/{problem.title_slug}"
         resp = self._make_request(
-            f"problems/{problem.title_slug}/submit/",
+            f"{problem_path}/submit/",
             "POST",
             headers={
-                "Referer": f"https://leetcode.com/problems/{problem.title_slug}/"
+                "Referer": f"https://leetcode.com/{problem_path}/"
             },
             json=json
         )
 
-        run_id = resp.json().get("submission_id")
-        return self._await_running_submission(problem, run_id)
+        run_id = str(resp.json().get("submission_id"))
+        if on_submitted is not None:
+            on_submitted(run_id)
+        return self.await_submission(problem, run_id)
+
+    def await_submission(self, problem: classes.LeetCodeProblem, run_id: str) -> CommitResult:
+        result_key = self._get_result_key("submit", problem)
+        result = self._await_running_submission(problem, run_id, result_key=result_key)
+        self._cache_result(result_key, result)
+        if result.state == ResultStates.Accepted.value:
+            self._invalidate_prefetched_plan_problem(problem.title_slug)
+        return result
+    
+    def submit_solutions(
+        self,
+        problems: List[classes.LeetCodeProblem],
+        use_cache: bool=True
+    ) -> List[CommitResult]:
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            return list(executor.map(lambda problem: self._submit_solution_or_error(problem, use_cache), problems))
+
+    def iter_submit_solutions(
+        self,
+        problems: List[classes.LeetCodeProblem],
+        use_cache: bool=True
+    ) -> Iterator[CommitResult]:
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            futures = [executor.submit(self._submit_solution_or_error, problem, use_cache) for problem in problems]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _submit_solution_or_error(self, problem: classes.LeetCodeProblem, use_cache: bool) -> CommitResult:
+        try:
+            return self.submit_solution(problem, use_cache)
+        except (exceptions.AuthenticationFailed, exceptions.RateLimited):
+            raise
+        except Exception as e:
+            return classes.LeetCodeCommitResult(
+                problem_title=problem.title,
+                language=problem.language,
+                state=ResultStates.Unknown.value,
+                memory=None,
+                runtime=None,
+                memory_percentile=None,
+                runtime_percentile=None,
+                answer=None,
+                expected_answer=None,
+                input=None,
+                output=None,
+                error=str(e) or type(e).__name__
+            )
     
     def search_problem(self, problem_title: str, languages: Set[Language]) -> Optional[classes.LeetCodeProblem]:
         resp = self._make_graphql_request(
             "problemsetQuestionList",
-            "\n    query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {\n  problemsetQuestionList: questionList(\n    categorySlug: $categorySlug\n    limit: $limit\n    skip: $skip\n    filters: $filters\n  ) {\n    total: totalNum\n    questions: data {\n    questionId\n    isPaidOnly\n    title\n    titleSlug\n    content\n    difficulty\n    categoryTitle\n    topicTags {\n      name\n    }\n    codeSnippets {\n      langSlug\n      code\n    }\n    sampleTestCase\n    judgeType\n  }\n  }\n}\n    ",
+            queries.PROBLEMSET_QUESTION_LIST_QUERY,
             categorySlug="all-code-essentials",
             skip=0,
             limit=1,
@@ -111,8 +409,98 @@ class LeetCodeClient:
         if len(problems) == 0:
             return None
         
-        return self.converter.json_to_problem(problems[0], languages)
+        self._cache_question(problems[0])
+        return self.question_to_problem(problems[0], languages)
     
+    def get_problemset_slugs(self) -> List[str]:
+        resp = self._make_graphql_request(
+            "problemsetQuestionList",
+            queries.PROBLEMSET_SLUGS_QUERY,
+            categorySlug="all-code-essentials",
+            skip=0,
+            limit=PROBLEMSET_LIMIT,
+            filters={}
+        )
+        questions = resp.json().get("data").get("problemsetQuestionList").get("questions")
+        return [question.get("titleSlug") for question in questions]
+
+    def get_question_statuses(self, username: str, full_sync: bool=False) -> Tuple[List[classes.LeetCodeQuestionStatus], float]:
+        cached = self.cache.get("progress", username) if self.cache is not None and not full_sync else None
+        synced_at = time()
+
+        questions = self._update_question_statuses(username, cached) if cached is not None else None
+        if questions is None:
+            total, questions = self._get_all_question_statuses()
+        else:
+            total = cached.get("total")
+
+        if self.cache is not None:
+            self.cache.set("progress", username, {
+                "synced_at": synced_at,
+                "total": total,
+                "questions": [question.to_json() for question in questions]
+            })
+        return questions, synced_at
+
+    def _get_all_question_statuses(self) -> Tuple[int, List[classes.LeetCodeQuestionStatus]]:
+        total, questions = self._get_question_statuses_page(0, PROGRESS_PAGE_SIZE)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            for _, page in executor.map(
+                lambda skip: self._get_question_statuses_page(skip, PROGRESS_PAGE_SIZE),
+                range(PROGRESS_PAGE_SIZE, total, PROGRESS_PAGE_SIZE)
+            ):
+                questions.extend(page)
+        return total, questions
+
+    def _update_question_statuses(
+        self,
+        username: str,
+        cached: Dict[str, Any]
+    ) -> Optional[List[classes.LeetCodeQuestionStatus]]:
+        total, _ = self._get_question_statuses_page(0, 1)
+        if total != cached.get("total"):
+            return None
+
+        resp = self._make_graphql_request(
+            "recentSubmissions",
+            queries.RECENT_SUBMISSIONS_QUERY,
+            username=username,
+            limit=RECENT_SUBMISSIONS_LIMIT
+        )
+        submissions = resp.json().get("data").get("recentSubmissionList") or list()
+        new_submissions = [
+            submission for submission in submissions
+            if int(submission.get("timestamp")) >= cached.get("synced_at")
+        ]
+        if len(new_submissions) >= RECENT_SUBMISSIONS_LIMIT:
+            return None
+
+        questions = [classes.LeetCodeQuestionStatus.from_json(question) for question in cached.get("questions")]
+        questions_by_slug = {question.title_slug: question for question in questions}
+        for submission in new_submissions:
+            if (question := questions_by_slug.get(submission.get("titleSlug"))) is None:
+                return None
+            if submission.get("statusDisplay") == ACCEPTED_SUBMISSION_STATUS:
+                question.status = SOLVED_QUESTION_STATUS
+            elif question.status != SOLVED_QUESTION_STATUS:
+                question.status = ATTEMPTED_QUESTION_STATUS
+        return questions
+
+    def _get_question_statuses_page(self, skip: int, limit: int) -> Tuple[int, List[classes.LeetCodeQuestionStatus]]:
+        resp = self._make_graphql_request(
+            "problemsetQuestionList",
+            queries.PROBLEMSET_STATUSES_QUERY,
+            categorySlug="all-code-essentials",
+            skip=skip,
+            limit=limit,
+            filters={}
+        )
+        question_list = resp.json().get("data").get("problemsetQuestionList")
+        return question_list.get("total"), [
+            self.converter.json_to_question_status(question)
+            for question in question_list.get("questions")
+        ]
+
     def get_random_problem(
         self,
         languages: Set[Language],
@@ -127,51 +515,128 @@ class LeetCodeClient:
 
         resp = self._make_graphql_request(
             "randomQuestion",
-            "\n    query randomQuestion($categorySlug: String, $filters: QuestionListFilterInput) {\n  randomQuestion(categorySlug: $categorySlug, filters: $filters) {\n    questionId\n    isPaidOnly\n    title\n    titleSlug\n    content\n    difficulty\n    categoryTitle\n    topicTags {\n      name\n    }\n    codeSnippets {\n      langSlug\n      code\n    }\n    sampleTestCase\n    judgeType\n  }\n}\n    ",
+            queries.RANDOM_QUESTION_QUERY,
             categorySlug="all-code-essentials",
             filters=filters
         )
 
-        return self.converter.json_to_problem(resp.json().get("data").get("randomQuestion"), languages)
+        question = resp.json().get("data").get("randomQuestion")
+        self._cache_question(question)
+        return self.question_to_problem(question, languages)
     
     def get_problem_of_today(self, languages: Set[Language]) -> classes.LeetCodeProblem:
+        if (question := self._get_prefetched_question_of_today()) is None:
+            question = self._get_question_of_today()
+        return self.question_to_problem(question, languages)
+
+    def _get_question_of_today(self) -> Optional[Dict[str, Any]]:
+        date = utc_date()
         resp = self._make_graphql_request(
             "questionOfToday",
-            "\n    query questionOfToday {\n  activeDailyCodingChallengeQuestion {\n    question {\n    questionId\n    isPaidOnly\n    title\n    titleSlug\n    content\n    difficulty\n    categoryTitle\n    topicTags {\n      name\n    }\n    codeSnippets {\n      langSlug\n      code\n    }\n    sampleTestCase\n    judgeType\n  }\n  }\n}\n    ",
+            queries.QUESTION_OF_TODAY_QUERY,
         )
 
-        return self.converter.json_to_problem(
-            resp.json().get("data").get("activeDailyCodingChallengeQuestion").get("question"),
-            languages
-        )
+        question = resp.json().get("data").get("activeDailyCodingChallengeQuestion").get("question")
+        self._cache_question_of_today(question, date)
+        return question
     
     def get_next_plan_problem(self, plan_slug: str, languages: Set[Language]) -> Optional[classes.LeetCodeProblem]:
+        problem_slug = self.get_next_plan_problem_slug(plan_slug)
+        if problem_slug is None:
+            return None
+        problem = self.get_problem(problem_slug, languages)
+        problem.study_plan_slug = plan_slug
+        return problem
+
+    def get_next_plan_problem_slug(self, plan_slug: str) -> Optional[str]:
+        return self._select_next_plan_problem_slug(plan_slug, self.get_plan_statuses(plan_slug))
+
+    def prefetch_after_submit(self, problem: classes.LeetCodeProblem) -> List[Thread]:
+        if self.cache is None:
+            return list()
+
+        targets: List[Tuple[Callable[..., None], Tuple[Any, ...]]] = [(self._prefetch_question_of_today, ())]
+        if problem.study_plan_slug is not None:
+            targets.append((self._prefetch_next_plan_problem, (problem.study_plan_slug, problem.title_slug)))
+
+        threads = [Thread(target=self._run_prefetch, args=(target, *args), daemon=True) for target, args in targets]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _run_prefetch(self, target: Callable[..., None], *args: Any) -> None:
+        with suppress(Exception):
+            target(*args)
+
+    def _prefetch_next_plan_problem(self, plan_slug: str, solved_slug: str) -> None:
+        if (statuses := self.get_plan_statuses(plan_slug)) is None:
+            return
+        if solved_slug in statuses:
+            statuses[solved_slug] = PLAN_SOLVED_STATUS
+        if (problem_slug := self._select_next_plan_problem_slug(plan_slug, statuses)) is None:
+            return
+
+        if self.get_cached_question(problem_slug, PREFETCH_TTL_S) is None \
+                and self.get_question(problem_slug) is None:
+            return
+        self.cache.set("prefetched", f"plan-{plan_slug}", problem_slug)
+
+    def _prefetch_question_of_today(self) -> None:
+        if self._get_prefetched_question_of_today() is None:
+            self._get_question_of_today()
+
+    def get_study_plan(self, plan_slug: str) -> Optional[classes.LeetCodeStudyPlan]:
         resp = self._make_graphql_request(
-            "studyPlanDetail",
-            "\n    query studyPlanDetail($slug: String!) {\n  studyPlanV2Detail(planSlug: $slug) {\n    slug\n    name\n    highlight\n    staticCoverPicture\n    colorPalette\n    threeDimensionUrl\n    description\n    premiumOnly\n    needShowTags\n    awardDescription\n    defaultLanguage\n    award {\n      name\n      config {\n        icon\n        iconGif\n        iconGifBackground\n      }\n    }\n    relatedStudyPlans {\n      cover\n      highlight\n      name\n      slug\n      premiumOnly\n    }\n    planSubGroups {\n      slug\n      name\n      premiumOnly\n      questionNum\n      questions {\n        titleSlug\n      paidOnly\n      status\n      }\n    }\n  }\n}\n    ",
+            "studyPlanStructure",
+            queries.STUDY_PLAN_STRUCTURE_QUERY,
             slug=plan_slug
         )
 
         plan_data = resp.json().get("data").get("studyPlanV2Detail")
         if plan_data is None:
             return None
-        problem_slugs = [
-            problem.get("titleSlug")
-            for subgroup in plan_data.get("planSubGroups")
-            for problem in subgroup.get("questions")
-            if problem.get("status") != "PAST_SOLVED"
-        ]
+        plan = self.converter.json_to_study_plan(plan_data)
+        if self.cache is not None:
+            self.cache.set("plans", plan_slug, plan.to_json())
+        return plan
 
-        if len(problem_slugs) == 0:
+    def get_plan_statuses(self, plan_slug: str) -> Optional[Dict[str, Optional[str]]]:
+        resp = self._make_graphql_request(
+            "studyPlanProgress",
+            queries.STUDY_PLAN_PROGRESS_QUERY,
+            slug=plan_slug
+        )
+
+        plan_data = resp.json().get("data").get("studyPlanV2Detail")
+        if plan_data is None:
             return None
-        problem = self.get_problem(problem_slugs[0], languages)
-        problem.study_plan_slug = plan_slug
-        return problem
+        return self.converter.json_to_plan_statuses(plan_data)
+
+    def get_contest(self, contest_slug: str) -> Optional[classes.LeetCodeContest]:
+        resp = self._make_request(
+            f"contest/api/info/{contest_slug}/",
+            headers={
+                "Referer": f"https://leetcode.com/contest/{contest_slug}/"
+            }
+        )
+
+        contest_data = resp.json()
+        if contest_data.get("contest") is None:
+            return None
+        return self.converter.json_to_contest(contest_data)
+
+    def warm_up(self) -> str:
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            usernames = list(executor.map(
+                lambda _: self.get_current_username(),
+                range(self.max_concurrent_requests)
+            ))
+        return usernames[0]
 
     def get_current_username(self) -> str:
         resp = self._make_graphql_request(
             "globalData",
-            "\n    query globalData {\n  userStatus {\n    isSignedIn\n    username\n  }\n}\n    ",
+            queries.GLOBAL_DATA_QUERY,
         )
         return self.converter.json_to_current_username(resp.json().get("data"))
 
@@ -179,17 +644,17 @@ class LeetCodeClient:
     def get_user_stats(self, username: str) -> Optional[classes.LeetCodeUserStats]:
         profile_resp = self._make_graphql_request(
             "userPublicProfile",
-            "\n    query userPublicProfile($username: String!) {\n  matchedUser(username: $username) {\n    profile {\n      ranking\n      realName\n      postViewCount\n      reputation\n      solutionCount\n      categoryDiscussCount\n    }\n  }\n}\n    ",
+            queries.USER_PUBLIC_PROFILE_QUERY,
             username=username
         )
         languages_resp = self._make_graphql_request(
             "languageStats",
-            "\n    query languageStats($username: String!) {\n  matchedUser(username: $username) {\n    languageProblemCount {\n      languageName\n      problemsSolved\n    }\n  }\n}\n    ",
+            queries.LANGUAGE_STATS_QUERY,
             username=username
         )
         problems_resp = self._make_graphql_request(
             "userProblemsSolved",
-            "\n    query userProblemsSolved($username: String!) {\n  allQuestionsCount {\n    difficulty\n    count\n  }\n  matchedUser(username: $username) {\n    problemsSolvedBeatsStats {\n      difficulty\n      percentage\n    }\n    submitStatsGlobal {\n      acSubmissionNum {\n        difficulty\n        count\n      }\n    }\n  }\n}\n    ",
+            queries.USER_PROBLEMS_SOLVED_QUERY,
             username=username
         )
         return self.converter.json_to_user_stats(
@@ -199,11 +664,43 @@ class LeetCodeClient:
             problems_resp.json().get("data")
         )
 
+    def get_users_stats(self, usernames: List[str]) -> Dict[str, Optional[classes.LeetCodeUserStats]]:
+        users_json, chunks = self._get_cached_users_stats_json(usernames)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            for chunk_json in executor.map(self._get_users_stats_json, chunks):
+                users_json.update(chunk_json)
+        return self._users_stats_from_json(usernames, users_json)
+
+    def _get_users_stats_json(self, usernames: List[str]) -> Dict[str, Dict[str, Any]]:
+        aliases = {f"user{i}": username for i, username in enumerate(usernames)}
+        resp = self._make_graphql_request(
+            "usersStats",
+            queries.users_stats_query(list(aliases)),
+            **aliases
+        )
+
+        return self._split_users_stats_json(aliases, resp.json().get("data"))
+
+    def download_asset(self, url: str) -> bytes:
+        response = self.asset_session.get(urljoin(self.BASE_URL, url), timeout=ASSET_TIMEOUT_S)
+        response.raise_for_status()
+        return response.content
+
+    def question_to_problem(self, question: Dict[str, Any], languages: Set[Language]) -> classes.LeetCodeProblem:
+        if self.asset_store is not None:
+            self.asset_store.fetch(
+                self.converter.json_to_asset_urls(question),
+                self.download_asset,
+                max_workers=self.max_concurrent_requests
+            )
+        return self.converter.json_to_problem(question, languages)
+
     def _await_running_submission(
         self,
         problem: classes.LeetCodeProblem,
         run_id: str,
-        run_input: Optional[str]=None
+        run_input: Optional[str]=None,
+        result_key: Optional[str]=None
     ) -> CommitResult:
         while True:
             resp = self._make_request(
@@ -218,7 +715,7 @@ class LeetCodeClient:
                 sleep(PENDING_DELAY_S)
                 continue
             
-            return self.converter.json_to_commit_result(problem, data, run_input)
+            return self.converter.json_to_commit_result(problem, data, run_input, result_key)
     
     def _make_request(
         self,
@@ -240,8 +737,14 @@ class LeetCodeClient:
                 error = response.json().get("error")
             if error is not None and error == "User is not authenticated":
                 raise exceptions.AuthenticationFailed("Authentication failed, check LEETCODE_SESSION cookie.")
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise exceptions.RateLimited(
+                "Leetcode rate limit exceeded",
+                float(retry_after) if retry_after is not None and retry_after.isdigit() else None
+            )
         if response.status_code != 200:
-            raise RuntimeError(f"Leetcode returned {response.status_code}" )
+            raise exceptions.RequestFailed(f"Leetcode returned {response.status_code}", response.status_code)
         return response
     
     def _make_graphql_request(
@@ -260,4 +763,7 @@ class LeetCodeClient:
                 "variables": variables,
                 "query": query
             }
-        )
\ No newline at end of file
+        )
+
+def utc_date() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
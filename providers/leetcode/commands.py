@@ -1,24 +1,57 @@
 import re
-from time import sleep
-from typing import Optional, Tuple, Set
+import sys
+import subprocess
+from json import dumps
+from time import sleep, time
+from functools import partial
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple, Set, TextIO
 
 import click
+import numpy as np
 from slugify import slugify
 
-from .client import LeetCodeClient
-from .classes import LeetCodeProblemDifficulty
-from providers.leetcode.classes import LeetCodeProblem
+from .client import LeetCodeClient, PLAN_SOLVED_STATUS, PREFETCH_TTL_S, SOLVED_QUESTION_STATUS, ATTEMPTED_QUESTION_STATUS
+from .converter import LeetCodeConverter
+from .classes import LeetCodeProblemDifficulty, LeetCodeLeaderboard, LeaderboardSortKey, LeetCodeSubmitComparison, LeetCodeBenchmark, LeetCodeFuzzResult, LeetCodeQueueStatus, LeetCodeProgress, ProgressGroup
+from .input_generator import SolutionSignature, InputGenerator, parse_max_constraint
+from .local_runner import LocalRunner
+from .fuzzer import DifferentialFuzzer
+from .submission_worker import LeetCodeSubmissionWorker, start_worker_in_background
+from providers.leetcode.classes import LeetCodeProblem, REQUIRED_METADATA
 from providers.leetcode.exceptions import PremiumRequired, AuthenticationFailed
 from utils.problem_keeper import ProblemKeeper
-from utils.style import OutputStyler
-from utils.click import pass_client, pass_keeper, pass_config, pass_default_languages, pass_styler
+from utils.style import OutputStyler, ColorType
+from utils.click import pass_client, pass_keeper, pass_config, pass_default_languages, pass_styler, pass_cache, pass_printer
+from utils.output import OutputPrinter
+from utils.completion import shell_complete_saved_problems, shell_complete_problemset, shell_complete_languages, PROBLEMSET_KEY
+from utils.cache import JsonCache
+from utils.submission_queue import SubmissionQueue, SUBMISSION_QUEUE_FILE_NAME
+from utils.bundle import BundleWriter, BundleReader
+from utils.search_index import SearchDocument
+from utils.problem_checker import ProblemChecker, extract_solution_code
+from utils.complexity import fit_complexity
+from utils.coverage import group_coverage
+from utils.similarity import SimilarityModel, SIMILARITY_MODEL_DIR_NAME
 from utils.config import Config
-from classes.language import any_language_by_name, all_languages, Language
+from classes.language import any_language_by_name, language_by_path, Language, LANGUAGES
+from classes.persistent_problem import PersistentProblem
+from classes.result import ResultStates
+from classes.exceptions import InvalidBundle, InvalidProblemText
 
 
+BENCH_MIN_SIZE = 16
+BENCH_MAX_SIZE = 10**5
+FUZZ_CASES = 10000
+CONTEST_KEEPALIVE_S = 30
+CONTEST_POLL_DELAY_S = 0.5
+FUZZ_MAX_SIZE = 8
+FUZZ_TIMEOUT_S = 2
+
 @click.command("get")
-@click.argument("PROBLEM")
-@click.argument("LANGUAGE", required=False)
+@click.argument("PROBLEM", shell_complete=shell_complete_problemset)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
 @click.option("--rewrite", "-r", default=False, is_flag=True,
               help="Rewrite existing problem without confirmation")
 @click.option('--open/--no-open', '-o/-no', default=None,
@@ -26,6 +59,7 @@ from classes.language import any_language_by_name, all_languages, Language
 @click.option('--tags/--no-tags', '-t/-nt', default=None,
               help="Show problem tags (may contain solution hints)")
 @pass_default_languages(provider="leetcode")
+@pass_printer
 @pass_config
 @pass_keeper
 @pass_client
@@ -33,6 +67,7 @@ def get(
     client: LeetCodeClient,
     keeper: ProblemKeeper,
     config: Config,
+    printer: OutputPrinter,
     default_languages: Set[Language],
     problem: str,
     language: Optional[str],
@@ -56,12 +91,12 @@ def get(
     open_problem = open if open is not None else config.get("main", "open_saved_problems")
     include_tags = tags if tags is not None else config.get("main", "show_problem_tags")
 
-    save_problem(fetched_problem, keeper, rewrite, include_tags)
+    save_problem(printer, fetched_problem, keeper, rewrite, include_tags)
     if open_problem:
         keeper.open_problem(fetched_problem.title_slug)
 
 @click.command("random")
-@click.argument("LANGUAGE", required=False)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
 @click.option("--difficulty", "-d", help="Problem difficulty")
 @click.option("--solved", "-s", help="Include solved problems", default=False, is_flag=True)
 @click.option("--rewrite", "-r", default=False, is_flag=True,
@@ -71,6 +106,7 @@ def get(
 @click.option('--tags/--no-tags', '-t/-nt', default=None,
               help="Show problem tags (may contain solution hints)")
 @pass_default_languages(provider="leetcode")
+@pass_printer
 @pass_config
 @pass_keeper
 @pass_client
@@ -78,6 +114,7 @@ def random(
     client: LeetCodeClient,
     keeper: ProblemKeeper,
     config: Config,
+    printer: OutputPrinter,
     default_languages: Set[Language],
     language: Optional[str],
     difficulty: str,
@@ -108,12 +145,12 @@ def random(
     open_problem = open if open is not None else config.get("main", "open_saved_problems")
     include_tags = tags if tags is not None else config.get("main", "show_problem_tags")
 
-    save_problem(fetched_problem, keeper, rewrite, include_tags)
+    save_problem(printer, fetched_problem, keeper, rewrite, include_tags)
     if open_problem:
         keeper.open_problem(fetched_problem.title_slug)
 
 @click.command("today")
-@click.argument("LANGUAGE", required=False)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
 @click.option("--rewrite", "-r", default=False, is_flag=True,
               help="Rewrite existing problem without confirmation")
 @click.option('--open/--no-open', '-o/-no', default=None,
@@ -121,6 +158,7 @@ def random(
 @click.option('--tags/--no-tags', '-t/-nt', default=None,
               help="Show problem tags (may contain solution hints)")
 @pass_default_languages(provider="leetcode")
+@pass_printer
 @pass_config
 @pass_keeper
 @pass_client
@@ -128,6 +166,7 @@ def today(
     client: LeetCodeClient,
     keeper: ProblemKeeper,
     config: Config,
+    printer: OutputPrinter,
     default_languages: Set[Language],
     rewrite: bool,
     language: Optional[str],
@@ -141,13 +180,13 @@ def today(
     open_problem = open if open is not None else config.get("main", "open_saved_problems")
     include_tags = tags if tags is not None else config.get("main", "show_problem_tags")
 
-    save_problem(fetched_problem, keeper, rewrite, include_tags)
+    save_problem(printer, fetched_problem, keeper, rewrite, include_tags)
     if open_problem:
         keeper.open_problem(fetched_problem.title_slug)
 
 @click.command("plan_next")
 @click.argument("PLAN")
-@click.argument("LANGUAGE", required=False)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
 @click.option("--rewrite", "-r", default=False, is_flag=True,
               help="Rewrite existing problem without confirmation")
 @click.option('--open/--no-open', '-o/-no', default=None,
@@ -155,6 +194,7 @@ def today(
 @click.option('--tags/--no-tags', '-t/-nt', default=None,
               help="Show problem tags (may contain solution hints)")
 @pass_default_languages(provider="leetcode")
+@pass_printer
 @pass_config
 @pass_keeper
 @pass_client
@@ -162,6 +202,7 @@ def plan_next(
     client: LeetCodeClient,
     keeper: ProblemKeeper,
     config: Config,
+    printer: OutputPrinter,
     default_languages: Set[Language],
     plan: str,
     rewrite: bool,
@@ -173,41 +214,211 @@ def plan_next(
     PLAN: plan url or title slug\n
     LANGUAGE: get problem in a specified language"""
     language = [any_language_by_name(language)] if language is not None else None
-    plan_url_re = re.compile("leetcode\.com\/studyplan\/([\w-]+)")
-    slug_re = re.compile("^[a-z0-9]+(?:-[a-z0-9]+)*$")
+    if (plan_slug := parse_plan_slug(plan)) is None:
+        click.echo(f"Plan \"{plan}\" was not found")
+        return
 
-    if (match := plan_url_re.search(plan)) is not None:
-        plan_slug = match.group(1)
-    elif (match := slug_re.match(plan)) is not None:
-        plan_slug = plan
-    else:
+    if (problem_slug := client.pop_prefetched_plan_problem_slug(plan_slug)) is None:
+        try:
+            client.get_current_username()
+        except AuthenticationFailed:
+            raise AuthenticationFailed("Can't get current user data, next study plan problem may be incorrect, check LEETCODE_SESSION cookie.")
+
+        problem_slug = client.get_next_plan_problem_slug(plan_slug)
+        if problem_slug is None:
+            click.echo(f"All problems in \"{plan}\" are already solved")
+            return
+
+    open_problem = open if open is not None else config.get("main", "open_saved_problems")
+    include_tags = tags if tags is not None else config.get("main", "show_problem_tags")
+
+    if not rewrite:
+        for lang in language or default_languages:
+            if keeper.is_problem_saved(problem_slug, lang):
+                click.echo(f"Problem \"{problem_slug}\" is already saved at {keeper.get_problem_path(problem_slug, lang)}")
+                if open_problem:
+                    keeper.open_problem(problem_slug, lang)
+                return
+
+    fetched_problem = client.get_problem(problem_slug, language or default_languages, max_cache_age_s=PREFETCH_TTL_S)
+    fetched_problem.study_plan_slug = plan_slug
+
+    save_problem(printer, fetched_problem, keeper, rewrite, include_tags)
+    if open_problem:
+        keeper.open_problem(fetched_problem.title_slug, fetched_problem.language)
+
+@click.command("plan_sync")
+@click.argument("PLAN")
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
+@click.option("--rewrite", "-r", default=False, is_flag=True,
+              help="Download and rewrite already saved problems")
+@click.option('--tags/--no-tags', '-t/-nt', default=None,
+              help="Show problem tags (may contain solution hints)")
+@pass_default_languages(provider="leetcode")
+@pass_printer
+@pass_config
+@pass_keeper
+@pass_client
+def plan_sync(
+    client: LeetCodeClient,
+    keeper: ProblemKeeper,
+    config: Config,
+    printer: OutputPrinter,
+    default_languages: Set[Language],
+    plan: str,
+    language: Optional[str],
+    rewrite: bool,
+    tags: Optional[bool]
+):
+    """Cache LeetCode study plan and download all its unsolved problems\n
+    PLAN: plan url or title slug\n
+    LANGUAGE: get problems in a specified language"""
+    languages = [any_language_by_name(language)] if language is not None else default_languages
+    if (plan_slug := parse_plan_slug(plan)) is None:
         click.echo(f"Plan \"{plan}\" was not found")
+        return
 
     try:
         client.get_current_username()
     except AuthenticationFailed:
-        raise AuthenticationFailed("Can't get current user data, next study plan problem may be incorrect, check LEETCODE_SESSION cookie.")
+        raise AuthenticationFailed("Can't get current user data, solved study plan problems can't be skipped, check LEETCODE_SESSION cookie.")
 
-    fetched_problem = client.get_next_plan_problem(plan_slug, language or default_languages)
-    if fetched_problem is None:
-        click.echo(f"All problems in \"{plan}\" are already solved")
+    study_plan = client.get_study_plan(plan_slug)
+    statuses = client.get_plan_statuses(plan_slug)
+    if study_plan is None or statuses is None:
+        click.echo(f"Plan \"{plan}\" was not found")
+        return
+
+    problem_slugs = [
+        problem_slug
+        for problem_slug in study_plan.problem_slugs
+        if statuses.get(problem_slug) != PLAN_SOLVED_STATUS
+        and (rewrite or not any(keeper.is_problem_saved(problem_slug, lang) for lang in languages))
+    ]
+    if len(problem_slugs) == 0:
+        click.echo(f"Plan \"{study_plan.name}\" is synced, no new unsolved problems")
         return
 
-    open_problem = open if open is not None else config.get("main", "open_saved_problems")
     include_tags = tags if tags is not None else config.get("main", "show_problem_tags")
+    fetched_problems = client.get_problems(problem_slugs, languages, on_error=partial(report_skipped_problem, printer))
 
-    save_problem(fetched_problem, keeper, rewrite, include_tags)
-    if open_problem:
-        keeper.open_problem(fetched_problem.title_slug)
+    for fetched_problem in fetched_problems:
+        if fetched_problem is None:
+            continue
+        fetched_problem.study_plan_slug = plan_slug
+        save_problem(printer, fetched_problem, keeper, rewrite=True, include_tags=include_tags)
+
+@click.command("contest")
+@click.argument("CONTEST")
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
+@click.option("--rewrite", "-r", default=False, is_flag=True,
+              help="Rewrite existing problems without confirmation")
+@click.option('--open/--no-open', '-o/-no', default=None,
+              help="Open the first problem in default code editor")
+@pass_default_languages(provider="leetcode")
+@pass_printer
+@pass_config
+@pass_keeper
+@pass_client
+def contest(
+    client: LeetCodeClient,
+    keeper: ProblemKeeper,
+    config: Config,
+    printer: OutputPrinter,
+    default_languages: Set[Language],
+    contest: str,
+    language: Optional[str],
+    rewrite: bool,
+    open: Optional[bool]
+):
+    """Wait for contest start on a warm connection, download all its problems at once and test or submit them\n
+    CONTEST: contest url or slug\n
+    LANGUAGE: get problems in a specified language"""
+    if (contest_slug := parse_contest_slug(contest)) is None:
+        click.echo(f"Invalid contest \"{contest}\"")
+        return
+    if (loaded_contest := client.get_contest(contest_slug)) is None:
+        click.echo(f"Contest \"{contest}\" was not found")
+        return
+
+    username = client.warm_up()
+    start_time = datetime.fromtimestamp(loaded_contest.start_time).strftime("%Y-%m-%d %H:%M:%S")
+    printer.message(f"Signed in as {username}, \"{loaded_contest.title}\" starts at {start_time}")
+    while (remaining := loaded_contest.start_time-time()) > 0:
+        if remaining <= CONTEST_KEEPALIVE_S:
+            sleep(remaining)
+            break
+        sleep(CONTEST_KEEPALIVE_S)
+        client.warm_up()
+
+    while len(loaded_contest.problem_slugs) == 0:
+        if (polled_contest := client.get_contest(contest_slug)) is None:
+            click.echo(f"Contest \"{contest}\" was not found")
+            return
+        loaded_contest = polled_contest
+        if len(loaded_contest.problem_slugs) == 0:
+            sleep(CONTEST_POLL_DELAY_S)
+
+    languages = [any_language_by_name(language)] if language is not None else default_languages
+    fetched_problems = client.get_problems(loaded_contest.problem_slugs, languages, on_error=partial(report_skipped_problem, printer))
+    problems = [fetched_problem for fetched_problem in fetched_problems if fetched_problem is not None]
+    include_tags = config.get("main", "show_problem_tags")
+    for fetched_problem in problems:
+        save_problem(printer, fetched_problem, keeper, rewrite, include_tags)
+    if len(problems) > 0 and (open if open is not None else config.get("main", "open_saved_problems")):
+        keeper.open_problem(problems[0].title_slug, problems[0].language)
+
+    for i, fetched_problem in enumerate(problems, 1):
+        printer.message(f"{i}. {fetched_problem.title} ({fetched_problem.title_slug})")
+    printer.message("Commands: test N [INPUT...], submit N, quit")
+
+    max_line_length = config.get("main", "max_result_line_length")
+    while True:
+        try:
+            command = click.prompt(loaded_contest.title, default="", show_default=False, err=printer.is_ndjson)
+        except click.Abort:
+            break
+
+        action, *args = command.split() or [""]
+        if action in ("quit", "exit", "q"):
+            break
+        if action not in ("test", "submit", "t", "s") or len(args) == 0:
+            printer.message("Commands: test N [INPUT...], submit N, quit")
+            continue
+
+        selected = next(
+            (contest_problem for i, contest_problem in enumerate(problems, 1) if args[0] in (str(i), contest_problem.title_slug)),
+            None
+        )
+        if selected is None:
+            printer.message(f"Problem \"{args[0]}\" is not in this contest")
+            continue
+
+        try:
+            loaded_problem = LeetCodeProblem.load(selected.title_slug, selected.language, keeper)
+            if action in ("test", "t"):
+                result = client.test_solution(loaded_problem, "\n".join(args[1:]) or None)
+            else:
+                result = client.submit_solution(loaded_problem, use_cache=False, contest_slug=contest_slug)
+        except (FileNotFoundError, InvalidProblemText, RuntimeError) as e:
+            printer.message(str(e))
+            continue
+        if not printer.is_ndjson:
+            result.cut_lines(max_line_length)
+        printer.echo(result)
 
 @click.command("test")
-@click.argument("PROBLEM")
-@click.argument("LANGUAGE", required=False)
+@click.argument("PROBLEM", shell_complete=shell_complete_saved_problems)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
 @click.argument("TEST_INPUT", nargs=-1)
 @click.option("--fuzzy", "-f", default=False, is_flag=True,
               help="Use fuzzy search to find the problem by name")
+@click.option("--force", "-F", default=False, is_flag=True,
+              help="Run tests even if this solution was already tested")
+@click.option("--pager", "-p", default=False, is_flag=True,
+              help="Show full outputs in a pager if they were truncated")
 @pass_default_languages(provider="leetcode")
-@pass_styler
+@pass_printer
 @pass_config
 @pass_keeper
 @pass_client
@@ -215,49 +426,46 @@ def test(
     client: LeetCodeClient,
     keeper: ProblemKeeper,
     config: Config,
-    styler: OutputStyler,
+    printer: OutputPrinter,
     default_languages: Set[Language],
     problem: str,
     language: Optional[str],
     test_input: Tuple[str],
     fuzzy: bool=False,
+    force: bool=False,
+    pager: bool=False
 ):
     """Test saved solution for specified problem\n
-    PROBLEM: problem title or slug\n
+    PROBLEM: problem title, slug or path to the saved problem file\n
     TEST_INPUT: testcase arguments separated by space\n
     LANGUAGE: test solution in a specified language"""
-    problem_slug = slugify(problem)
-    languages = [any_language_by_name(language)] if language is not None else default_languages
-
-    for lang in languages:
-        try:
-            loaded_problem = LeetCodeProblem.load(problem_slug, lang, keeper)
-            break
-        except FileNotFoundError:
-            if fuzzy and (fuz_slug := keeper.fuzzy_search_problem(problem, lang)) is not None:
-                fuz_problem = LeetCodeProblem.load(fuz_slug, lang, keeper)
-                if click.confirm(f"Are you looking for problem \"{fuz_problem.title}\" ({lang.name}) ?"):
-                    loaded_problem = fuz_problem
-                    break
-    else:
-        if language is not None:
-            raise FileNotFoundError(f"Problem \"{problem}\" was not found in \"{language}\" directory")
-        else:
-            langs_str = ', '.join(lang.name for lang in default_languages)
-            raise FileNotFoundError(f"Problem \"{problem}\" was not found in your default languages ({langs_str}), try providing another language")
+    loaded_problem = load_saved_problem(printer, keeper, default_languages, problem, language, fuzzy)
 
     test_input = '\n'.join(test_input) if len(test_input) > 0 else None
-    result = client.test_solution(loaded_problem, test_input)
-    result.cut_lines(config.get("main", "max_result_line_length"))
-    click.echo(result.styled_str(styler))
+    result = client.test_solution(loaded_problem, test_input, use_cache=not force)
+    if not printer.is_ndjson:
+        result.cut_lines(config.get("main", "max_result_line_length"))
+    printer.echo(result)
+
+    full_output_path = getattr(result, "full_output_path", None)
+    if pager and full_output_path is not None and Path(full_output_path).is_file():
+        with open(full_output_path, "r", encoding="utf-8") as f:
+            click.echo_via_pager(f)
 
 @click.command("submit")
-@click.argument("PROBLEM")
-@click.argument("LANGUAGE", required=False)
+@click.argument("PROBLEM", shell_complete=shell_complete_saved_problems)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
 @click.option("--fuzzy", "-f", default=False, is_flag=True,
               help="Use fuzzy search to find the problem by name")
+@click.option("--force", "-F", default=False, is_flag=True,
+              help="Submit even if this solution was already submitted")
+@click.option("--all-languages", "-a", default=False, is_flag=True,
+              help="Submit every saved language of the problem and compare results")
+@click.option("--queue", "-q", "enqueue", default=False, is_flag=True,
+              help="Add solution to the submission queue and return immediately")
 @pass_default_languages(provider="leetcode")
-@pass_styler           
+@pass_printer
+@pass_cache
 @pass_config
 @pass_keeper
 @pass_client
@@ -265,98 +473,823 @@ def submit(
     client: LeetCodeClient,
     keeper: ProblemKeeper,
     config: Config,
-    styler: OutputStyler,
+    cache: JsonCache,
+    printer: OutputPrinter,
     default_languages: Set[Language],
     problem: str,
     language: Optional[str],
-    fuzzy: bool=False
+    fuzzy: bool=False,
+    force: bool=False,
+    all_languages: bool=False,
+    enqueue: bool=False
 ):
     """Submit saved solution for specified problem\n
-    PROBLEM: problem title or slug\n
+    PROBLEM: problem title, slug or path to the saved problem file\n
     LANGUAGE: submit solution in a specified language"""
-    problem_slug = slugify(problem)
-    languages = [any_language_by_name(language)] if language is not None else default_languages
+    if all_languages:
+        problem_slug = load_saved_problem(printer, keeper, default_languages, problem, language, fuzzy).title_slug \
+            if Path(problem).is_file() else slugify(problem)
+        problems = [
+            LeetCodeProblem.load(problem_slug, saved_language, keeper)
+            for saved_language in LANGUAGES.languages
+            if keeper.is_problem_saved(problem_slug, saved_language)
+        ]
+        if len(problems) == 0:
+            raise FileNotFoundError(f"Problem \"{problem}\" was not found in any language directory")
 
-    for lang in languages:
-        try:
-            loaded_problem = LeetCodeProblem.load(problem_slug, lang, keeper)
-            break
-        except FileNotFoundError:
-            if fuzzy and (fuz_slug := keeper.fuzzy_search_problem(problem, lang)) is not None:
-                fuz_problem = LeetCodeProblem.load(fuz_slug, lang, keeper)
-                if click.confirm(f"Are you looking for problem \"{fuz_problem.title}\" ({lang.name}) ?"):
-                    loaded_problem = fuz_problem
-                    break
-    else:
-        if language is not None:
-            raise FileNotFoundError(f"Problem \"{problem}\" was not found in \"{language}\" directory")
+        if enqueue:
+            enqueue_submissions(SubmissionQueue(cache.cache_path.joinpath(SUBMISSION_QUEUE_FILE_NAME)), problems, printer, not force)
+            return
+        if printer.is_ndjson:
+            for result in client.iter_submit_solutions(problems, use_cache=not force):
+                printer.echo(result)
         else:
-            langs_str = ', '.join(lang.name for lang in default_languages)
-            raise FileNotFoundError(f"Problem \"{problem}\" was not found in your default languages ({langs_str}), try providing another language")
+            results = client.submit_solutions(problems, use_cache=not force)
+            printer.echo(LeetCodeSubmitComparison(results))
+        return
+
+    loaded_problem = load_saved_problem(printer, keeper, default_languages, problem, language, fuzzy)
+    if enqueue:
+        enqueue_submissions(SubmissionQueue(cache.cache_path.joinpath(SUBMISSION_QUEUE_FILE_NAME)), [loaded_problem], printer, not force)
+        return
 
-    result = client.submit_solution(loaded_problem)
-    result.cut_lines(config.get("main", "max_result_line_length"))
-    click.echo(result.styled_str(styler))
+    result = client.submit_solution(loaded_problem, use_cache=not force)
+    if result.state == ResultStates.Accepted.value:
+        client.prefetch_after_submit(loaded_problem)
+    if not printer.is_ndjson:
+        result.cut_lines(config.get("main", "max_result_line_length"))
+    printer.echo(result)
+
+@click.group("queue")
+def queue():
+    """Show and process queued submissions"""
+
+@queue.command("status")
+@click.option("--all", "-a", "show_all", default=False, is_flag=True,
+              help="Show finished submissions too")
+@click.option("--limit", "-l", type=int, default=20, help="Maximum number of shown submissions")
+@pass_printer
+@pass_cache
+def queue_status(cache: JsonCache, printer: OutputPrinter, show_all: bool, limit: int):
+    """Show queued submissions and results of the finished ones"""
+    submission_queue = SubmissionQueue(cache.cache_path.joinpath(SUBMISSION_QUEUE_FILE_NAME))
+    submissions = submission_queue.submissions(include_finished=show_all, limit=limit)
+    if printer.is_ndjson:
+        for submission in submissions:
+            printer.echo_json(submission.to_json())
+    elif len(submissions) > 0:
+        printer.echo(LeetCodeQueueStatus(submissions))
+
+    worker_state = "running" if submission_queue.is_worker_alive() else "stopped"
+    printer.message(f"PENDING: {submission_queue.pending_count()}, WORKER: {worker_state}")
+
+@queue.command("clear")
+@pass_cache
+def queue_clear(cache: JsonCache):
+    """Remove finished submissions from the queue"""
+    removed = SubmissionQueue(cache.cache_path.joinpath(SUBMISSION_QUEUE_FILE_NAME)).clear_finished()
+    click.echo(f"REMOVED: {removed} submissions")
+
+@queue.command("work", hidden=True)
+@pass_config
+@pass_cache
+@pass_client
+def queue_work(client: LeetCodeClient, cache: JsonCache, config: Config):
+    """Submit queued solutions until the queue is empty"""
+    worker = LeetCodeSubmissionWorker(
+        client,
+        SubmissionQueue(cache.cache_path.joinpath(SUBMISSION_QUEUE_FILE_NAME)),
+        concurrency=config.get("providers", "leetcode", "queue_concurrency"),
+        submit_interval_s=config.get("providers", "leetcode", "queue_submit_interval_s")
+    )
+    click.echo(f"PROCESSED: {worker.run()} submissions")
 
 @click.command("stats")
 @click.argument("USERNAME", required=False)
-@pass_styler
+@pass_printer
 @pass_client
-def stats(client: LeetCodeClient, styler: OutputStyler, username: Optional[str]):
+def stats(client: LeetCodeClient, printer: OutputPrinter, username: Optional[str]):
     """Get user stats\n
     USERNAME: LeetCode username, defaults to your username"""
     if username is None:
         username = client.get_current_username()
     stats = client.get_user_stats(username)
     if stats is None:
-        click.echo(f"Can't get stats for user \"{username}\", try again later.")
+        printer.message(f"Can't get stats for user \"{username}\", try again later.")
         return
-    click.echo(stats.styled_str(styler))
+    printer.echo(stats)
+
+@click.command("progress")
+@click.option("--full", "-f", default=False, is_flag=True,
+              help="Download statuses of all problems instead of applying recent submissions")
+@click.option("--limit", "-l", type=int, default=None, help="Maximum number of shown tags")
+@click.option("--include-premium", "-p", default=False, is_flag=True,
+              help="Count premium problems too")
+@pass_printer
+@pass_client
+def progress(client: LeetCodeClient, printer: OutputPrinter, full: bool, limit: Optional[int], include_premium: bool):
+    """Show solved and attempted problems coverage per difficulty and tag"""
+    username = client.get_current_username()
+    questions, synced_at = client.get_question_statuses(username, full_sync=full)
+    questions = [question for question in questions if include_premium or not question.paid_only]
+
+    solved = [question.status == SOLVED_QUESTION_STATUS for question in questions]
+    attempted = [question.status == ATTEMPTED_QUESTION_STATUS for question in questions]
+    difficulties = group_coverage([[question.difficulty] for question in questions], solved, attempted)
+    tags = group_coverage([question.tags for question in questions], solved, attempted)
+
+    difficulty_order = {difficulty.name: i for i, difficulty in enumerate(LeetCodeProblemDifficulty)}
+    difficulties.sort(key=lambda group: difficulty_order.get(group[0], len(difficulty_order)))
+    printer.echo(LeetCodeProgress(
+        username=username,
+        synced_at=synced_at,
+        difficulties=[ProgressGroup(*group) for group in difficulties],
+        tags=[ProgressGroup(*group) for group in tags[:limit]]
+    ))
+
+@click.command("leaderboard")
+@click.argument("USERNAMES", nargs=-1)
+@click.option("--file", "-f", "usernames_file", type=click.File("r", encoding="utf-8"), default=None,
+              help="File with LeetCode usernames, one per line")
+@click.option("--sort", "-s", "sort_key", default=LeaderboardSortKey.Solved.value,
+              type=click.Choice([key.value for key in LeaderboardSortKey]), help="Column to sort users by")
+@pass_printer
+@pass_client
+def leaderboard(
+    client: LeetCodeClient,
+    printer: OutputPrinter,
+    usernames: Tuple[str],
+    usernames_file: Optional[TextIO],
+    sort_key: str
+):
+    """Compare stats of multiple users\n
+    USERNAMES: LeetCode usernames"""
+    usernames = list(usernames)
+    if usernames_file is not None:
+        usernames.extend(line.strip() for line in usernames_file if len(line.strip()) > 0)
+    if len(usernames) == 0:
+        raise click.UsageError("Provide at least one username")
+
+    users_stats = client.get_users_stats(usernames)
+    for username, user_stats in users_stats.items():
+        if user_stats is None:
+            printer.message(f"User \"{username}\" was not found")
+
+    found_stats = [user_stats for user_stats in users_stats.values() if user_stats is not None]
+    if len(found_stats) == 0:
+        return
+    board = LeetCodeLeaderboard(found_stats, LeaderboardSortKey(sort_key))
+    if printer.is_ndjson:
+        for place, user_stats in enumerate(board.sorted_users(), start=1):
+            printer.echo_json({"place": place, **user_stats.to_json()})
+    else:
+        printer.echo(board)
 
 @click.command("clear")
 @click.option("--yes", "-y",is_flag=True, help="Skip the confirmation prompt")
-@click.argument("LANGUAGE", required=False)
+@click.option("--keep-days", "-k", type=float, default=None,
+              help="Keep deleted problems for specified number of days, so they can be restored")
+@click.option("--undo", "-u", default=False, is_flag=True,
+              help="Restore problems deleted by the last clear")
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
 @pass_styler
+@pass_config
 @pass_keeper
-def clear(keeper: ProblemKeeper, styler: OutputStyler, yes: bool, language: Optional[str]=None):
+def clear(
+    keeper: ProblemKeeper,
+    config: Config,
+    styler: OutputStyler,
+    yes: bool,
+    keep_days: Optional[float],
+    undo: bool,
+    language: Optional[str]=None
+):
     """Delete all saved LeetCode problems\n
     LANGUAGE: Delete problems in specified language"""
+    if undo:
+        restored = keeper.restore_problems()
+        if restored is None:
+            click.echo("Nothing to restore")
+        else:
+            click.echo(f"RESTORED: {styler.style_with_color(restored, 'bright_green')}")
+        return
+
     language = any_language_by_name(language) if language is not None else None
+    keep_days = keep_days if keep_days is not None else config.get("main", "trash_keep_days")
     if not yes:
         if language is None:
             click.confirm("Are you sure you want to delete all leetcode problems ?", abort=True)
         else:
             click.confirm(f"Are you sure you want to delete all leetcode problems in {language.name} ?", abort=True)
 
-    if language is not None:
-        removed, failed = keeper.delete_problems(language)
+    removed = keeper.delete_problems(language)
+    keeper.purge_deleted_problems(keep_days)
+    if not removed:
+        click.echo("Nothing to delete")
+        return
+
+    click.echo(f"REMOVED: {styler.style_with_color(keeper.problems_dir if language is None else keeper.language_dir(language), 'bright_red')}")
+    if keep_days > 0:
+        click.echo(f"Deleted problems can be restored with \"clear --undo\" in the next {keep_days:g} days")
+
+@click.command("list")
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
+@click.option("--search", "-s", default=None,
+              help="List only problems with title or slug containing specified text")
+@pass_printer
+@pass_keeper
+def list_problems(keeper: ProblemKeeper, printer: OutputPrinter, language: Optional[str], search: Optional[str]):
+    """List saved LeetCode problems\n
+    LANGUAGE: list problems in specified language"""
+    language = any_language_by_name(language) if language is not None else None
+    if search is not None:
+        problems = keeper.search_problems(search, language)
     else:
-        removed = failed = 0
-        for language in all_languages():
-            lang_removed, lang_failed = keeper.delete_problems(language)
-            removed+=lang_removed
-            failed+=lang_failed
-    removed = styler.style_with_color(removed, 'bright_green')
-    failed = styler.style_with_color(failed, 'bright_red')
-    
-    click.echo(f"REMOVED: {removed}, FAILED: {failed}")
+        problems = keeper.list_problems(language)
 
-COMMANDS = [get, random, today, plan_next, test, submit, stats, clear]
+    styler = printer.styler
+    for problem_slug, lang in problems:
+        printer.echo_record(
+            {"title_slug": problem_slug, "language": lang.name},
+            f"{styler.style(problem_slug, ColorType.TITLE)} ({styler.style(lang.name, ColorType.LANGUAGE)})"
+        )
+
+@click.command("checkout")
+@click.argument("PROBLEM", shell_complete=shell_complete_saved_problems)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
+@click.option('--open/--no-open', '-o/-no', default=None,
+              help="Open problem in default code editor")
+@pass_default_languages(provider="leetcode")
+@pass_printer
+@pass_config
+@pass_keeper
+def checkout(
+    keeper: ProblemKeeper,
+    config: Config,
+    printer: OutputPrinter,
+    default_languages: Set[Language],
+    problem: str,
+    language: Optional[str],
+    open: Optional[bool]
+):
+    """Restore archived problem file to work on it\n
+    PROBLEM: problem title or slug\n
+    LANGUAGE: checkout problem in a specified language"""
+    loaded_problem = load_saved_problem(printer, keeper, default_languages, problem, language)
+    problem_path = keeper.checkout_problem(loaded_problem.title_slug, loaded_problem.language)
+    click.echo(f"Problem \"{loaded_problem.title}\" was restored at {problem_path}")
+
+    if open if open is not None else config.get("main", "open_saved_problems"):
+        keeper.open_problem(loaded_problem.title_slug, loaded_problem.language)
+
+@click.command("checkin")
+@click.argument("PROBLEM", required=False, shell_complete=shell_complete_saved_problems)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
+@pass_default_languages(provider="leetcode")
+@pass_printer
+@pass_keeper
+def checkin(
+    keeper: ProblemKeeper,
+    printer: OutputPrinter,
+    default_languages: Set[Language],
+    problem: Optional[str],
+    language: Optional[str]
+):
+    """Move edited problem files to the archive\n
+    PROBLEM: problem title or slug, all problem files are archived if not specified\n
+    LANGUAGE: checkin problem in a specified language"""
+    if problem is not None:
+        loaded_problem = load_saved_problem(printer, keeper, default_languages, problem, language)
+        problems = [(loaded_problem.title_slug, loaded_problem.language)]
+    else:
+        language = any_language_by_name(language) if language is not None else None
+        problems = [(path.stem, lang) for path, lang in keeper.iter_problem_files(language)]
+
+    archived = sum(keeper.checkin_problem(problem_slug, lang) for problem_slug, lang in problems)
+    if archived == 0 and len(problems) > 0:
+        click.echo("Problem files are kept as is, archive is only used with \"sqlite\" problems storage")
+        return
+    click.echo(f"ARCHIVED: {archived}")
+
+@click.command("search")
+@click.argument("QUERY", nargs=-1, required=True)
+@click.option("--limit", "-l", default=10, type=int, help="Maximum number of found problems")
+@click.option("--rebuild", default=False, is_flag=True,
+              help="Rebuild search index from cached and saved problems")
+@pass_printer
+@pass_cache
+@pass_keeper
+def search(
+    keeper: ProblemKeeper,
+    cache: JsonCache,
+    printer: OutputPrinter,
+    query: Tuple[str],
+    limit: int,
+    rebuild: bool
+):
+    """Search cached and saved problems by title, description and tags\n
+    QUERY: words to search for"""
+    index = keeper.search_index
+    if rebuild:
+        index.clear()
+
+    converter = LeetCodeConverter()
+    indexed_slugs = index.indexed_slugs()
+    index.add_documents(
+        converter.json_to_search_document(question)
+        for question_slug in cache.keys("questions")
+        if question_slug not in indexed_slugs and (question := cache.get("questions", question_slug)) is not None
+    )
+    if rebuild:
+        indexed_slugs = index.indexed_slugs()
+        index.add_documents(
+            SearchDocument.from_problem(problem)
+            for problem in keeper.iter_problems()
+            if problem.title_slug not in indexed_slugs
+        )
+
+    results = index.search(" ".join(query), limit)
+    if len(results) == 0:
+        printer.message(f"No problems found for \"{' '.join(query)}\"")
+        return
+
+    styler = printer.styler
+    dlmt = styler.style(':', ColorType.DELIMITER)
+    for result in results:
+        title = styler.style(result.title, ColorType.TITLE)
+        printer.echo_record(
+            {"title_slug": result.title_slug, "title": result.title, "difficulty": result.difficulty, "score": result.score},
+            f"{title} ({result.difficulty}){dlmt} {styler.style(result.title_slug, ColorType.VALUE)}"
+        )
+
+@click.command("similar")
+@click.argument("PROBLEM", shell_complete=shell_complete_problemset)
+@click.option("--limit", "-l", default=10, type=int, help="Maximum number of similar problems")
+@click.option("--solved", "-s", default=False, is_flag=True, help="Include solved problems")
+@pass_printer
+@pass_cache
+@pass_client
+def similar(
+    client: LeetCodeClient,
+    cache: JsonCache,
+    printer: OutputPrinter,
+    problem: str,
+    limit: int,
+    solved: bool
+):
+    """List problems similar to the specified one, using cached problems\n
+    PROBLEM: problem url, title or slug"""
+    problem_url_re = re.compile("leetcode\.com\/problems\/([\w-]+)")
+    if (match := problem_url_re.search(problem)) is not None:
+        problem_slug = match.group(1)
+    else:
+        problem_slug = slugify(problem)
+
+    if cache.get("questions", problem_slug) is None and client.get_question(problem_slug) is None:
+        printer.message(f"Problem \"{problem}\" was not found")
+        return
+
+    converter = LeetCodeConverter()
+    model = SimilarityModel(cache.cache_path.joinpath(SIMILARITY_MODEL_DIR_NAME))
+    model.update(
+        converter.json_to_search_document(question)
+        for question_slug in cache.keys("questions")
+        if question_slug not in model and (question := cache.get("questions", question_slug)) is not None
+    )
+    if problem_slug not in model:
+        printer.message(f"Problem \"{problem}\" has no cached description to compare, it may be a premium problem")
+        return
+
+    styler = printer.styler
+    dlmt = styler.style(':', ColorType.DELIMITER)
+    found = 0
+    for similar_slug, score in model.most_similar(problem_slug):
+        if found >= limit:
+            break
+        question = cache.get("questions", similar_slug)
+        if question is None or (not solved and question.get("status") == SOLVED_QUESTION_STATUS):
+            continue
+
+        found+=1
+        title = styler.style(question.get("title"), ColorType.TITLE)
+        printer.echo_record(
+            {"title_slug": similar_slug, "title": question.get("title"), "difficulty": question.get("difficulty"), "score": score},
+            f"{title} ({question.get('difficulty')}){dlmt} {styler.style(similar_slug, ColorType.VALUE)} ({round(score*100, 2)}%)"
+        )
+
+    if found == 0:
+        printer.message("No similar problems found, download more problems to extend the local problems cache")
+
+@click.command("bench")
+@click.argument("PROBLEM", shell_complete=shell_complete_saved_problems)
+@click.option("--max-size", "-n", type=int, default=None,
+              help=f"Largest generated input size, defaults to problem constraints (at most {BENCH_MAX_SIZE})")
+@click.option("--steps", "-s", type=int, default=6, help="Number of input sizes")
+@click.option("--repeats", "-r", type=int, default=5, help="Runs for every input size, the fastest one is used")
+@click.option("--timeout", "-t", type=float, default=10, help="Maximum seconds for every input size")
+@pass_printer
+@pass_keeper
+def bench(
+    keeper: ProblemKeeper,
+    printer: OutputPrinter,
+    problem: str,
+    max_size: Optional[int],
+    steps: int,
+    repeats: int,
+    timeout: float
+):
+    """Estimate time complexity of saved Python solution by running it locally on generated inputs\n
+    PROBLEM: problem title, slug or path to the saved problem file"""
+    python = any_language_by_name("Python")
+    loaded_problem = load_saved_problem(printer, keeper, {python}, problem, python.name)
+    signature = SolutionSignature.from_code(loaded_problem.solution_code)
+    generator = InputGenerator(signature, loaded_problem.test_input, seed=0)
+    runner = LocalRunner(loaded_problem.solution_code, signature.method_name, timeout)
+
+    constraint = parse_max_constraint(loaded_problem.description)
+    max_size = max_size or min(constraint or BENCH_MAX_SIZE, BENCH_MAX_SIZE)
+    sizes = np.unique(np.geomspace(BENCH_MIN_SIZE, max(max_size, BENCH_MIN_SIZE+steps), steps).astype(int)).tolist()
+
+    timed_sizes, times = list(), list()
+    for size in sizes:
+        try:
+            times.append(min(runner.time(generator.generate(size), signature.annotations, repeats)))
+        except subprocess.TimeoutExpired:
+            printer.message(f"Size {size} took more than {timeout}s, larger sizes are skipped")
+            break
+        timed_sizes.append(size)
+
+    try:
+        fit = fit_complexity(timed_sizes, times)[0]
+    except ValueError:
+        printer.message(f"Not enough timed sizes to fit complexity ({len(timed_sizes)} finished in {timeout}s), try a larger --timeout")
+        return
+    printer.echo(LeetCodeBenchmark(
+        problem_title=loaded_problem.title,
+        sizes=timed_sizes,
+        times=times,
+        complexity=fit.name,
+        error=fit.error,
+        max_size=constraint,
+        projected_time=fit.predict(constraint) if constraint is not None else None
+    ))
+
+@click.command("fuzz")
+@click.argument("PROBLEM", shell_complete=shell_complete_saved_problems)
+@click.option("--reference", "-r", required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help="Python file with a brute-force Solution to compare with")
+@click.option("--cases", "-c", type=int, default=FUZZ_CASES, help="Maximum number of generated cases")
+@click.option("--max-size", "-n", type=int, default=FUZZ_MAX_SIZE, help="Largest generated input size")
+@click.option("--any-order", "-a", default=False, is_flag=True, help="Ignore order of items in returned lists")
+@click.option("--seed", "-s", type=int, default=None, help="Seed for reproducible inputs")
+@click.option("--save/--no-save", default=True, help="Add the shrunk failing case to the problem test input")
+@click.option("--timeout", "-t", type=float, default=FUZZ_TIMEOUT_S,
+              help="Maximum seconds for every call, slower calls are reported as mismatches")
+@pass_printer
+@pass_keeper
+def fuzz(
+    keeper: ProblemKeeper,
+    printer: OutputPrinter,
+    problem: str,
+    reference: Path,
+    cases: int,
+    max_size: int,
+    any_order: bool,
+    seed: Optional[int],
+    save: bool,
+    timeout: float
+):
+    """Compare saved Python solution with a brute-force reference on random inputs\n
+    PROBLEM: problem title, slug or path to the saved problem file"""
+    python = any_language_by_name("Python")
+    loaded_problem = load_saved_problem(printer, keeper, {python}, problem, python.name)
+    reference_code = extract_solution_code(reference.read_text(encoding="utf-8"), python)
+    fuzzer = DifferentialFuzzer(
+        loaded_problem.solution_code,
+        reference_code,
+        loaded_problem.test_input,
+        any_order,
+        seed,
+        timeout if timeout > 0 else None
+    )
+
+    checked, mismatch = fuzzer.run(cases, max_size)
+    if mismatch is None:
+        printer.echo(LeetCodeFuzzResult(loaded_problem.title, checked))
+        return
+
+    saved = save and mismatch.test_case not in loaded_problem.test_input
+    if saved:
+        loaded_problem.test_input = f"{loaded_problem.test_input}\n{mismatch.test_case}"
+        loaded_problem.save(keeper)
+    printer.echo(LeetCodeFuzzResult(
+        problem_title=loaded_problem.title,
+        cases=checked,
+        input=mismatch.test_case,
+        output=dumps(mismatch.output, separators=(",", ":")),
+        expected_output=dumps(mismatch.expected_output, separators=(",", ":")),
+        saved=saved
+    ))
+
+@click.command("fsck")
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
+@click.option("--repair", "-r", default=False, is_flag=True,
+              help="Rebuild broken problem headers from cached problem data, keeping solutions")
+@pass_config
+@pass_cache
+@pass_keeper
+def fsck(keeper: ProblemKeeper, cache: JsonCache, config: Config, language: Optional[str], repair: bool):
+    """Check saved problem files for broken headers, missing metadata and orphaned files\n
+    LANGUAGE: check problems in specified language"""
+    lang = any_language_by_name(language) if language is not None else None
+    problem_files = list(keeper.iter_problem_files(lang))
+    checker = ProblemChecker(keeper.problems_dir, REQUIRED_METADATA)
+
+    issues = list()
+    for issue in checker.check(problem_files, find_orphans=lang is None):
+        issues.append(issue)
+        click.echo(issue)
+    click.echo(f"CHECKED: {len(problem_files)} files, ISSUES: {len(issues)}")
+
+    repairable = [issue for issue in issues if issue.repairable]
+    if len(repairable) == 0:
+        return
+    if not repair:
+        click.echo(f"Use --repair to rebuild {len(repairable)} problem headers from cached problem data")
+        return
+
+    converter = LeetCodeConverter()
+    include_tags = config.get("main", "show_problem_tags")
+    for issue in repairable:
+        problem_slug = issue.path.stem
+        if (question := cache.get("questions", problem_slug)) is None:
+            click.echo(f"Problem \"{problem_slug}\" ({issue.language.name}) isn't cached, use get to download it again")
+            continue
+
+        try:
+            repaired_problem = converter.json_to_problem(question, {issue.language})
+        except ValueError as e:
+            click.echo(f"Problem \"{problem_slug}\" ({issue.language.name}) can't be repaired: {e}")
+            continue
+
+        problem_text = issue.path.read_text(encoding="utf-8")
+        try:
+            saved_problem = keeper.formatter.parse_problem(problem_slug, issue.language, problem_text)
+            repaired_problem.solution_code = saved_problem.solution_code
+            repaired_problem.study_plan_slug = saved_problem.metadata.get("study_plan_slug")
+        except InvalidProblemText:
+            repaired_problem.solution_code = extract_solution_code(problem_text, issue.language)
+        repaired_problem.save(keeper, include_tags)
+        click.echo(f"REPAIRED: {issue.path}")
+
+@click.command("refresh")
+@click.argument("PROBLEM", required=False, shell_complete=shell_complete_saved_problems)
+@click.argument("LANGUAGE", required=False, shell_complete=shell_complete_languages)
+@click.option("--all", "-a", "refresh_all", default=False, is_flag=True,
+              help="Refresh all saved problems")
+@click.option("--fuzzy", "-f", default=False, is_flag=True,
+              help="Use fuzzy search to find the problem by name")
+@click.option('--tags/--no-tags', '-t/-nt', default=None,
+              help="Show problem tags (may contain solution hints), saved problems keep their tags by default")
+@pass_default_languages(provider="leetcode")
+@pass_printer
+@pass_keeper
+@pass_client
+def refresh(
+    client: LeetCodeClient,
+    keeper: ProblemKeeper,
+    printer: OutputPrinter,
+    default_languages: Set[Language],
+    problem: Optional[str],
+    language: Optional[str],
+    refresh_all: bool,
+    fuzzy: bool,
+    tags: Optional[bool]
+):
+    """Download descriptions, tags and test cases of saved problems again, keeping solutions\n
+    PROBLEM: problem title, slug or path to the saved problem file\n
+    LANGUAGE: refresh problems in a specified language"""
+    if refresh_all:
+        lang = any_language_by_name(language) if language is not None else None
+        saved_problems = list()
+        for problem_slug, problem_lang in keeper.list_problems(lang):
+            try:
+                saved_problems.append(LeetCodeProblem.load(problem_slug, problem_lang, keeper))
+            except InvalidProblemText as e:
+                click.echo(f"{e}, use fsck to repair it")
+    elif problem is not None:
+        saved_problems = [load_saved_problem(printer, keeper, default_languages, problem, language, fuzzy)]
+    else:
+        raise click.UsageError("Provide a problem or use --all")
+
+    title_slugs = [saved_problem.title_slug for saved_problem in saved_problems]
+    old_questions = {title_slug: client.get_cached_question(title_slug) for title_slug in title_slugs}
+    questions = client.get_questions(title_slugs)
+
+    refreshed = 0
+    for saved_problem in saved_problems:
+        if (question := questions.get(saved_problem.title_slug)) is None:
+            click.echo(f"Problem \"{saved_problem.title_slug}\" was not found")
+            continue
+        try:
+            fetched_problem = client.question_to_problem(question, {saved_problem.language})
+        except (PremiumRequired, ValueError) as e:
+            click.echo(f"Problem \"{saved_problem.title_slug}\" ({saved_problem.language.name}) can't be refreshed: {e}")
+            continue
+
+        old_question = old_questions.get(saved_problem.title_slug) or dict()
+        fetched_problem.test_input = refresh_test_input(
+            saved_problem.test_input,
+            old_question.get("sampleTestCase"),
+            fetched_problem.test_input
+        )
+        fetched_problem.solution_code = saved_problem.solution_code
+        fetched_problem.study_plan_slug = saved_problem.study_plan_slug
+        include_tags = tags if tags is not None else len(saved_problem.tags) > 0
+
+        if keeper.refresh_problem(fetched_problem.to_persistent(include_tags)):
+            refreshed+=1
+            click.echo(f"REFRESHED: {keeper.get_problem_path(saved_problem.title_slug, saved_problem.language)}")
+    click.echo(f"CHECKED: {len(saved_problems)} problems, REFRESHED: {refreshed}")
+
+@click.command("completion")
+@click.option("--fetch", default=False, is_flag=True,
+              help="Download slugs of all LeetCode problems for completion of the get command")
+@pass_cache
+@pass_keeper
+@pass_client
+def completion(client: LeetCodeClient, keeper: ProblemKeeper, cache: JsonCache, fetch: bool):
+    """Rebuild the shell completion index of saved and known problems"""
+    keeper.update_completion_index()
+    problemset_slugs = set(cache.keys("questions"))
+    if fetch:
+        problemset_slugs.update(client.get_problemset_slugs())
+    keeper.completion_index.add(PROBLEMSET_KEY, problemset_slugs)
+    click.echo(f"INDEXED: {len(keeper.completion_index.get(PROBLEMSET_KEY))} problems")
+
+@click.command("export")
+@click.argument("BUNDLE_PATH", type=click.Path(dir_okay=False, path_type=Path))
+@pass_cache
+@pass_keeper
+def export_bundle(keeper: ProblemKeeper, cache: JsonCache, bundle_path: Path):
+    """Export cached and saved LeetCode problems to a compressed bundle\n
+    BUNDLE_PATH: path to the bundle file to create"""
+    converter = LeetCodeConverter()
+    question_slugs = cache.keys("questions")
+    saved_problems = keeper.list_problems()
+
+    skipped = 0
+    with BundleWriter(bundle_path, "leetcode", {"questions": len(question_slugs), "problems": len(saved_problems)}) as bundle:
+        for question_slug in question_slugs:
+            if (question := cache.get("questions", question_slug)) is not None:
+                bundle.write("question", question)
+
+        for problem_slug, problem_lang in saved_problems:
+            try:
+                problem = keeper.load_problem(problem_slug, problem_lang)
+            except InvalidProblemText as e:
+                click.echo(f"SKIPPED: {e}")
+                skipped+=1
+                continue
+            if (question := cache.get("questions", problem_slug)) is not None and question.get("content") is not None:
+                problem.description = converter.json_to_description(question)
+            bundle.write("problem", problem.to_json())
+    index = {"questions": 0, "problems": 0, **bundle.counts}
+
+    click.echo(f"EXPORTED: {index['questions']} questions, {index['problems']} problems to {bundle_path}, SKIPPED: {skipped}")
+
+@click.command("import")
+@click.argument("BUNDLE_PATH", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--rewrite", "-r", default=False, is_flag=True,
+              help="Rewrite already saved problems, your solutions will be replaced")
+@pass_cache
+@pass_keeper
+def import_bundle(keeper: ProblemKeeper, cache: JsonCache, bundle_path: Path, rewrite: bool):
+    """Import LeetCode problems from a bundle created with export\n
+    BUNDLE_PATH: path to the bundle file"""
+    questions = saved = skipped = 0
+    with BundleReader(bundle_path) as bundle:
+        if bundle.provider != "leetcode":
+            raise InvalidBundle(f"Bundle \"{bundle_path}\" was exported from \"{bundle.provider}\", not leetcode")
+
+        for record_type, data in bundle.records():
+            match record_type:
+                case "question":
+                    cache.set("questions", data.get("titleSlug"), data)
+                    questions+=1
+                case "problem":
+                    problem = PersistentProblem.from_json(data)
+                    if not rewrite and keeper.is_problem_saved(problem.title_slug, problem.language):
+                        skipped+=1
+                        continue
+                    keeper.save_problem(problem, materialize=False)
+                    saved+=1
+
+    click.echo(f"IMPORTED: {questions} questions, {saved} problems, SKIPPED: {skipped}")
+
+COMMANDS = [get, random, today, plan_next, plan_sync, contest, test, submit, queue, stats, progress, leaderboard, clear, list_problems, search, similar, checkout, checkin, bench, fuzz, fsck, refresh, completion, export_bundle, import_bundle]
 
 def add_commands(group: click.Group):
     for command in COMMANDS:
         group.add_command(command)
 
+def parse_plan_slug(plan: str) -> Optional[str]:
+    plan_url_re = re.compile("leetcode\.com\/studyplan\/([\w-]+)")
+    slug_re = re.compile("^[a-z0-9]+(?:-[a-z0-9]+)*$")
+
+    if (match := plan_url_re.search(plan)) is not None:
+        return match.group(1)
+    if slug_re.match(plan) is not None:
+        return plan
+    return None
+
+def enqueue_submissions(
+    submission_queue: SubmissionQueue,
+    problems: List[LeetCodeProblem],
+    printer: OutputPrinter,
+    use_cache: bool=True
+):
+    for queued_problem in problems:
+        submission_id = submission_queue.enqueue(
+            queued_problem.title,
+            queued_problem.language.name,
+            {"problem": queued_problem.to_persistent().to_json(), "use_cache": use_cache}
+        )
+        printer.echo_record(
+            {"submission_id": submission_id, "problem_title": queued_problem.title, "language": queued_problem.language.name},
+            f"QUEUED: #{submission_id} {queued_problem.title} ({queued_problem.language.name})"
+        )
+
+    if not submission_queue.is_worker_alive():
+        script = sys.argv[0]
+        command = [sys.executable, script] if script.endswith(".py") else [script]
+        start_worker_in_background([*command, "leetcode", "queue", "work"])
+
+def parse_contest_slug(contest: str) -> Optional[str]:
+    contest_url_re = re.compile("leetcode\.com\/contest\/([\w-]+)")
+    slug_re = re.compile("^[a-z0-9]+(?:-[a-z0-9]+)*$")
+
+    if (match := contest_url_re.search(contest)) is not None:
+        return match.group(1)
+    if slug_re.match(contest) is not None:
+        return contest
+    return None
+
+def load_saved_problem(
+    printer: OutputPrinter,
+    keeper: ProblemKeeper,
+    default_languages: Set[Language],
+    problem: str,
+    language: Optional[str]=None,
+    fuzzy: bool=False
+) -> LeetCodeProblem:
+    if (problem_path := Path(problem)).is_file():
+        lang = any_language_by_name(language) if language is not None else language_by_path(problem_path)
+        if lang is None:
+            raise ValueError(f"Can't detect language of \"{problem}\", try providing language")
+        return LeetCodeProblem.load_from_path(problem_path, lang, keeper)
+
+    problem_slug = slugify(problem)
+    languages = [any_language_by_name(language)] if language is not None else default_languages
+
+    for lang in languages:
+        try:
+            return LeetCodeProblem.load(problem_slug, lang, keeper)
+        except FileNotFoundError:
+            if fuzzy and (fuz_slug := keeper.fuzzy_search_problem(problem, lang)) is not None:
+                fuz_problem = LeetCodeProblem.load(fuz_slug, lang, keeper)
+                if printer.confirm(f"Are you looking for problem \"{fuz_problem.title}\" ({lang.name}) ?"):
+                    return fuz_problem
+
+    if language is not None:
+        raise FileNotFoundError(f"Problem \"{problem}\" was not found in \"{language}\" directory")
+    langs_str = ', '.join(lang.name for lang in default_languages)
+    raise FileNotFoundError(f"Problem \"{problem}\" was not found in your default languages ({langs_str}), try providing another language")
+
+def refresh_test_input(saved_input: Optional[str], old_sample: Optional[str], new_sample: Optional[str]) -> Optional[str]:
+    if saved_input is None or new_sample is None:
+        return new_sample or saved_input
+    if old_sample is not None and saved_input.startswith(old_sample):
+        return f"{new_sample}{saved_input[len(old_sample):]}"
+    return saved_input
+
+def report_skipped_problem(printer: OutputPrinter, problem_slug: str, error: Exception):
+    if isinstance(error, PremiumRequired):
+        printer.message(f"Problem \"{problem_slug}\" was skipped, premium is required")
+    else:
+        printer.message(f"Problem \"{problem_slug}\" was skipped: {str(error) or type(error).__name__}")
+
 def save_problem(
+    printer: OutputPrinter,
     problem: LeetCodeProblem,
     keeper: ProblemKeeper,
     rewrite: bool=False,
     include_tags: bool=True
 ):
     if keeper.is_problem_saved(problem.title_slug, problem.language) and not rewrite:
-        confirmed = click.confirm(f"Are you sure you want to rewrite problem \"{problem.title}\" ? Your solution will be lost.")
+        confirmed = printer.confirm(f"Are you sure you want to rewrite problem \"{problem.title}\" ? Your solution will be lost.")
         if not confirmed:
-            click.echo("Saving aborted")
+            printer.message("Saving aborted")
             return
     saved_at = problem.save(keeper, include_tags)
-    click.echo(f"Problem \"{problem.title}\" was saved at {saved_at}")
\ No newline at end of file
+    printer.message(f"Problem \"{problem.title}\" was saved at {saved_at}")
\ No newline at end of file
@@ -1,4 +1,9 @@
-from typing import Dict, Any, Optional, Set
+import os
+from typing import Dict, Any, List, Optional, Set, Tuple
+from itertools import islice
+from hashlib import sha256
+from contextlib import suppress
+from pathlib import Path
 
 from bs4 import BeautifulSoup
 
@@ -6,10 +11,34 @@ import providers.leetcode.classes as classes
 import providers.leetcode.exceptions as exceptions
 from classes.result import CommitResult, ResultStates
 from classes.language import Language
-from providers.leetcode.languages import SLUG_TO_LANGUAGE
+from utils.search_index import SearchDocument
+from utils.asset_store import AssetStore
+from utils.atomic import atomic_open_text
+from providers.leetcode.languages import language_by_slug
 
 
+DIFF_CONTEXT_LINES = 5
+OUTPUTS_DIR_NAME = "outputs"
+MAX_OUTPUT_DUMPS = 50
+
 class LeetCodeConverter():
+    max_output_length: Optional[int]
+    max_output_lines: Optional[int]
+    asset_store: Optional[AssetStore]
+    outputs_path: Optional[Path]
+
+    def __init__(
+        self,
+        max_output_length: Optional[int]=None,
+        asset_store: Optional[AssetStore]=None,
+        outputs_path: Optional[Path]=None,
+        max_output_lines: Optional[int]=None
+    ) -> None:
+        self.max_output_length = max_output_length
+        self.max_output_lines = max_output_lines
+        self.asset_store = asset_store
+        self.outputs_path = outputs_path
+
     def json_to_problem(self, json: Dict[str, Any], languages: Set[Language]) -> classes.LeetCodeProblem:
         premium_problem = json.get("isPaidOnly") or json.get("paidOnly") or False
 
@@ -18,11 +47,10 @@ class LeetCodeConverter():
 
         
         for snippet in json.get("codeSnippets"):
-            snippet_language = SLUG_TO_LANGUAGE.get(snippet.get("langSlug"))
+            snippet_language = language_by_slug(snippet.get("langSlug"))
 
-            if snippet_language is not None and snippet_language.value in languages:
+            if snippet_language is not None and snippet_language in languages:
                 code_snippet = snippet.get("code")
-                snippet_language = snippet_language.value
                 break
         else:
             langs_str = ', '.join(lang.name for lang in languages)
@@ -43,18 +71,76 @@ class LeetCodeConverter():
             judge_type=json.get("judgeType")
         )
     
+    def json_to_description(self, json: Dict[str, Any]) -> str:
+        return self._content_to_description(json.get("content") or "")
+
+    def json_to_search_document(self, json: Dict[str, Any]) -> SearchDocument:
+        return SearchDocument(
+            title_slug=json.get("titleSlug"),
+            title=json.get("title"),
+            difficulty=json.get("difficulty"),
+            tags=[tag.get("name") for tag in json.get("topicTags") or list()],
+            text=self.json_to_description(json)
+        )
+
+    def json_to_asset_urls(self, json: Dict[str, Any]) -> List[str]:
+        if json.get("content") is None:
+            return list()
+        soup = BeautifulSoup(f"<html>{json.get('content')}</html", features="lxml")
+        return [src for img in soup.select("img") if (src := img.attrs.get("src")) is not None]
+
     def json_to_commit_result(
         self,
         problem: classes.LeetCodeProblem,
         json: Dict[str, Any],
-        input_data: Optional[str]=None
+        input_data: Optional[str]=None,
+        result_key: Optional[str]=None
     ) -> CommitResult:
         match json.get("task_name"):
             case "judger.runcodetask.RunCode":
-                return self._json_to_test_result(problem, json, input_data)
+                return self._json_to_test_result(problem, json, input_data, result_key)
             case "judger.judgetask.Judge":
                 return self._json_to_submit_result(problem, json)
     
+    def json_to_study_plan(self, json: Dict[str, Any]) -> classes.LeetCodeStudyPlan:
+        problems = [
+            problem
+            for subgroup in json.get("planSubGroups")
+            for problem in subgroup.get("questions")
+        ]
+        return classes.LeetCodeStudyPlan(
+            slug=json.get("slug"),
+            name=json.get("name"),
+            problem_slugs=[problem.get("titleSlug") for problem in problems],
+            premium_slugs=[problem.get("titleSlug") for problem in problems if problem.get("paidOnly")]
+        )
+
+    def json_to_contest(self, json: Dict[str, Any]) -> classes.LeetCodeContest:
+        contest = json.get("contest")
+        return classes.LeetCodeContest(
+            slug=contest.get("title_slug"),
+            title=contest.get("title"),
+            start_time=contest.get("start_time"),
+            duration=contest.get("duration"),
+            problem_slugs=[question.get("title_slug") for question in json.get("questions") or list()]
+        )
+
+    def json_to_question_status(self, json: Dict[str, Any]) -> classes.LeetCodeQuestionStatus:
+        return classes.LeetCodeQuestionStatus(
+            title_slug=json.get("titleSlug"),
+            difficulty=json.get("difficulty"),
+            status=json.get("status"),
+            tags=[tag.get("name") for tag in json.get("topicTags") or list()],
+            paid_only=json.get("isPaidOnly") or False
+        )
+
+    def json_to_plan_statuses(self, json: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        return {
+            problem.get("titleSlug"): problem.get("status")
+            for subgroup in json.get("planSubGroups")
+            for problem in subgroup.get("questions")
+        }
+
     def json_to_current_username(self, json: Dict[str, Any]) -> str:
         user_status = json.get("userStatus")
         if user_status is None or not user_status.get("isSignedIn"):
@@ -113,7 +199,8 @@ class LeetCodeConverter():
         self,
         problem: classes.LeetCodeProblem,
         json: Dict[str, Any],
-        input_data: Optional[str]=None
+        input_data: Optional[str]=None,
+        result_key: Optional[str]=None
         ) -> CommitResult:
         is_error = json.get("runtime_error") is not None or json.get("compile_error")
         is_time_limit_exceeded = json.get("status_msg") == "Time Limit Exceeded"
@@ -128,9 +215,29 @@ class LeetCodeConverter():
             case _:
                 state = ResultStates.Unknown.value
             
-        answer = "\n".join(answer_list) if (answer_list := json.get("code_answer")) is not None else None
-        exp_answer = "\n".join(exp_answer_list) if (exp_answer_list := json.get("expected_code_answer")) is not None else None
-        output = "\n".join(out_list) if (out_list := json.get("code_output")) is not None else None
+        answer_list = json.get("code_answer")
+        exp_answer_list = json.get("expected_code_answer")
+        out_list = json.get("code_output")
+
+        start, max_lines = 0, None
+        if state == ResultStates.Rejected.value and answer_list is not None and exp_answer_list is not None:
+            start = next(
+                (i for i, (line, exp_line) in enumerate(zip(answer_list, exp_answer_list)) if line != exp_line),
+                min(len(answer_list), len(exp_answer_list))
+            )
+            max_lines = DIFF_CONTEXT_LINES
+
+        answer, answer_cut = self._join_lines(answer_list, start, max_lines)
+        exp_answer, exp_answer_cut = self._join_lines(exp_answer_list, start, max_lines)
+        output, output_cut = self._join_lines(out_list)
+
+        full_output_path = None
+        if answer_cut or exp_answer_cut or output_cut:
+            full_output_path = self._dump_outputs(
+                problem,
+                [("Output", answer_list), ("Expected", exp_answer_list), ("StdOut", out_list)],
+                result_key
+            )
 
         error = json.get("runtime_error") or json.get("compile_error")
         if is_time_limit_exceeded:
@@ -150,8 +257,70 @@ class LeetCodeConverter():
             expected_answer=exp_answer,
             input=input_data,
             output=output,
-            error=error
+            error=error,
+            full_output_path=full_output_path
         )
+
+    def _join_lines(
+        self,
+        lines: Optional[List[str]],
+        start: int=0,
+        max_lines: Optional[int]=None
+    ) -> Tuple[Optional[str], bool]:
+        if lines is None:
+            return None, False
+
+        max_lines = max_lines if max_lines is not None else self.max_output_lines
+        end = len(lines) if max_lines is None else min(len(lines), start+max_lines)
+        parts, is_cut = list(), False
+        for line in islice(lines, start, end):
+            if self.max_output_length is not None and len(line) > self.max_output_length:
+                line = f"{line[:self.max_output_length]}... ({len(line)-self.max_output_length} characters more)"
+                is_cut = True
+            parts.append(line)
+
+        shown = start+len(parts)
+        if start > 0:
+            parts.insert(0, f"... ({start} matching lines)")
+        if shown < len(lines):
+            parts.append(f"... ({len(lines)-shown} lines more)")
+        return "\n".join(parts), is_cut or start > 0 or shown < len(lines)
+
+    def _dump_outputs(
+        self,
+        problem: classes.LeetCodeProblem,
+        outputs: List[Tuple[str, Optional[List[str]]]],
+        result_key: Optional[str]=None
+    ) -> Optional[str]:
+        if self.outputs_path is None:
+            return None
+
+        outputs = [(name, lines) for name, lines in outputs if lines is not None]
+        if (dump_name := result_key) is None:
+            digest = sha256()
+            for name, lines in outputs:
+                digest.update(f"{name}:\n".encode("utf-8"))
+                for line in lines:
+                    digest.update(f"{line}\n".encode("utf-8"))
+            dump_name = f"{problem.title_slug}-{digest.hexdigest()}"
+
+        dump_path = self.outputs_path.joinpath(f"{dump_name}.txt")
+        with atomic_open_text(dump_path) as f:
+            for name, lines in outputs:
+                f.write(f"{name}:\n")
+                for line in lines:
+                    f.write(line)
+                    f.write("\n")
+                f.write("\n")
+
+        dumps = list()
+        for path in self.outputs_path.glob("*.txt"):
+            with suppress(OSError):
+                dumps.append((path.stat().st_mtime, path))
+        for _, old_dump in sorted(dumps, reverse=True)[MAX_OUTPUT_DUMPS:]:
+            with suppress(OSError):
+                os.remove(old_dump)
+        return str(dump_path.resolve())
     
     def _json_to_submit_result(
         self,
@@ -196,7 +365,10 @@ class LeetCodeConverter():
         soup = BeautifulSoup(f"<html>{problem_content}</html", features="lxml")
         for img in soup.select("img"):
             img.name = "span"
-            img.append(img.attrs.get("src"))
+            src = img.attrs.get("src")
+            if self.asset_store is not None and src is not None and (asset_path := self.asset_store.get_path(src)) is not None:
+                src = str(asset_path.resolve())
+            img.append(src)
         for sup in soup.select("sup"):
             sup.string = f"^{sup.text}"
         for a in soup.select('a'):
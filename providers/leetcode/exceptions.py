@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class PremiumRequired(Exception):
     ...
 
@@ -5,4 +8,18 @@ class AuthenticationFailed(Exception):
     ...
 
 class UserNotFound(Exception):
-    ...
\ No newline at end of file
+    ...
+
+class RateLimited(Exception):
+    retry_after_s: Optional[float]
+
+    def __init__(self, message: str, retry_after_s: Optional[float]=None) -> None:
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+class RequestFailed(RuntimeError):
+    status_code: int
+
+    def __init__(self, message: str, status_code: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
@@ -0,0 +1,205 @@
+import os
+import signal
+from json import dumps
+from threading import Thread
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .input_generator import SolutionSignature, InputGenerator
+from .local_runner import load_solution_method, convert_arg, serialize_value
+
+
+FUZZ_CHUNK_SIZE = 64
+MAX_SHRINK_ELEMENT_REMOVALS = 64
+_worker_methods: Optional[Tuple[Callable[..., Any], Callable[..., Any]]] = None
+_worker_annotations: List[str] = list()
+_worker_any_order: bool = False
+_worker_timeout_s: Optional[float] = None
+
+class CaseTimeout(BaseException):
+    ...
+
+@dataclass()
+class FuzzMismatch:
+    args: List[Any]
+    output: Any
+    expected_output: Any
+
+    @property
+    def test_case(self) -> str:
+        return "\n".join(dumps(arg, separators=(",", ":")) for arg in self.args)
+
+class DifferentialFuzzer:
+    solution_code: str
+    reference_code: str
+    signature: SolutionSignature
+    reference_method_name: str
+    generator: InputGenerator
+    any_order: bool
+    timeout_s: Optional[float]
+    max_workers: int
+
+    def __init__(
+        self,
+        solution_code: str,
+        reference_code: str,
+        test_input: str,
+        any_order: bool=False,
+        seed: Optional[int]=None,
+        timeout_s: Optional[float]=None,
+        max_workers: Optional[int]=None
+    ) -> None:
+        self.solution_code = solution_code
+        self.reference_code = reference_code
+        self.signature = SolutionSignature.from_code(solution_code)
+        self.reference_method_name = SolutionSignature.from_code(reference_code).method_name
+        self.generator = InputGenerator(self.signature, test_input, seed)
+        self.any_order = any_order
+        self.timeout_s = timeout_s
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def run(self, cases: int, max_size: int) -> Tuple[int, Optional[FuzzMismatch]]:
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=init_worker,
+            initargs=(self.solution_code, self.reference_code, self.signature.method_name,
+                      self.reference_method_name, self.signature.annotations, self.any_order, self.timeout_s)
+        ) as executor:
+            checked, mismatch = 0, None
+            batch_size = self.max_workers*FUZZ_CHUNK_SIZE
+            while checked < cases and mismatch is None:
+                batch = [
+                    self.generator.generate(self.generator.rng.randint(1, max_size), vary_scalars=True)
+                    for _ in range(min(batch_size, cases-checked))
+                ]
+                for result in executor.map(compare_case, batch, chunksize=FUZZ_CHUNK_SIZE):
+                    checked+=1
+                    if result is not None:
+                        mismatch = result
+                        break
+
+            if mismatch is not None:
+                mismatch = self._shrink(executor, mismatch)
+            executor.shutdown(cancel_futures=True)
+        return checked, mismatch
+
+    def _shrink(self, executor: ProcessPoolExecutor, mismatch: FuzzMismatch) -> FuzzMismatch:
+        while True:
+            candidates = list(shrink_candidates(mismatch.args))
+            smaller = next(
+                (result for result in executor.map(compare_case, candidates) if result is not None),
+                None
+            )
+            if smaller is None:
+                return mismatch
+            mismatch = smaller
+
+def init_worker(
+    solution_code: str,
+    reference_code: str,
+    method_name: str,
+    reference_method_name: str,
+    annotations: List[str],
+    any_order: bool,
+    timeout_s: Optional[float]=None
+) -> None:
+    global _worker_methods, _worker_annotations, _worker_any_order, _worker_timeout_s
+    _worker_methods = (
+        load_solution_method(solution_code, method_name, "solution.py"),
+        load_solution_method(reference_code, reference_method_name, "reference.py")
+    )
+    _worker_annotations = annotations
+    _worker_any_order = any_order
+    _worker_timeout_s = timeout_s
+
+def compare_case(args: List[Any]) -> Optional[FuzzMismatch]:
+    solution_method, reference_method = _worker_methods
+    timeout_output = f"Timeout: exceeded {_worker_timeout_s}s"
+    try:
+        expected_output = call_with_timeout(reference_method, args, _worker_annotations, _worker_timeout_s)
+    except CaseTimeout:
+        expected_output = timeout_output
+    except Exception:
+        return None
+    try:
+        output = call_with_timeout(solution_method, args, _worker_annotations, _worker_timeout_s)
+    except CaseTimeout:
+        output = timeout_output
+    except Exception as e:
+        output = f"{type(e).__name__}: {e}"
+
+    if normalize_output(output, _worker_any_order) == normalize_output(expected_output, _worker_any_order):
+        return None
+    return FuzzMismatch(args, output, expected_output)
+
+def call_with_timeout(
+    method: Callable[..., Any],
+    args: List[Any],
+    annotations: List[str],
+    timeout_s: Optional[float]
+) -> Any:
+    if timeout_s is None:
+        return call_method(method, args, annotations)
+
+    if hasattr(signal, "setitimer"):
+        def on_alarm(*_) -> None:
+            raise CaseTimeout()
+
+        previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout_s)
+        try:
+            return call_method(method, args, annotations)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    outcome: List[Tuple[bool, Any]] = list()
+    def run() -> None:
+        try:
+            outcome.append((True, call_method(method, args, annotations)))
+        except Exception as e:
+            outcome.append((False, e))
+
+    thread = Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout_s)
+    if len(outcome) == 0:
+        raise CaseTimeout()
+    succeeded, value = outcome[0]
+    if not succeeded:
+        raise value
+    return value
+
+def call_method(method: Callable[..., Any], args: List[Any], annotations: List[str]) -> Any:
+    call_args = [convert_arg(deepcopy(arg), annotation) for arg, annotation in zip(args, annotations)]
+    result = method(*call_args)
+    if result is None and len(call_args) > 0:
+        result = call_args[0]
+    return serialize_value(result)
+
+def normalize_output(output: Any, any_order: bool) -> str:
+    if any_order and isinstance(output, list):
+        output = sorted(output, key=lambda item: dumps(item, sort_keys=True))
+    return dumps(output, sort_keys=True)
+
+def shrink_candidates(args: List[Any]) -> Iterator[List[Any]]:
+    for i, arg in enumerate(args):
+        if isinstance(arg, (list, str)) and len(arg) > 1:
+            half = len(arg)//2
+            yield [*args[:i], arg[:half], *args[i+1:]]
+            yield [*args[:i], arg[half:], *args[i+1:]]
+
+    for i, arg in enumerate(args):
+        if isinstance(arg, (list, str)) and len(arg) > 0:
+            for j in range(min(len(arg), MAX_SHRINK_ELEMENT_REMOVALS)):
+                yield [*args[:i], arg[:j]+arg[j+1:], *args[i+1:]]
+
+    for i, arg in enumerate(args):
+        if isinstance(arg, int) and not isinstance(arg, bool) and arg != 0:
+            yield [*args[:i], int(arg/2), *args[i+1:]]
+        elif isinstance(arg, list):
+            for j, item in enumerate(arg):
+                if isinstance(item, int) and not isinstance(item, bool) and item != 0:
+                    yield [*args[:i], [*arg[:j], int(item/2), *arg[j+1:]], *args[i+1:]]
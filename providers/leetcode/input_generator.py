@@ -0,0 +1,106 @@
+import re
+import ast
+import random
+import string
+from json import loads, JSONDecodeError
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+
+CONSTRAINT_RE = re.compile(r"<=\s*(?:(\d+)\s*\*\s*)?(\d+)(?:\^(\d+))?")
+
+@dataclass()
+class SolutionSignature:
+    method_name: str
+    parameters: List[Tuple[str, str]]
+
+    @property
+    def annotations(self) -> List[str]:
+        return [annotation for _, annotation in self.parameters]
+
+    @classmethod
+    def from_code(cls, solution_code: str) -> "SolutionSignature":
+        try:
+            tree = ast.parse(solution_code)
+        except SyntaxError as e:
+            raise ValueError(f"Can't parse solution code: {e}")
+
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef) or node.name != "Solution":
+                continue
+            for method in node.body:
+                if isinstance(method, ast.FunctionDef) and not method.name.startswith("_"):
+                    return cls(
+                        method_name=method.name,
+                        parameters=[
+                            (arg.arg, ast.unparse(arg.annotation) if arg.annotation is not None else "")
+                            for arg in method.args.args[1:]
+                        ]
+                    )
+        raise ValueError("Solution class with a public method was not found")
+
+class InputGenerator:
+    signature: SolutionSignature
+    sample_args: List[Any]
+    rng: random.Random
+
+    def __init__(self, signature: SolutionSignature, test_input: str, seed: Optional[int]=None) -> None:
+        self.signature = signature
+        self.rng = random.Random(seed)
+
+        lines = [line for line in test_input.splitlines() if len(line.strip()) > 0]
+        if len(lines) < len(signature.parameters):
+            raise ValueError("Test input doesn't match solution signature")
+        try:
+            self.sample_args = [loads(line) for line in lines[:len(signature.parameters)]]
+        except JSONDecodeError as e:
+            raise ValueError(f"Can't parse test input: {e}")
+
+    def generate(self, size: int, vary_scalars: bool=False) -> List[Any]:
+        scalable = any(isinstance(arg, (list, str)) for arg in self.sample_args)
+        return [self._generate_value(arg, size, scalable, vary_scalars) for arg in self.sample_args]
+
+    def _generate_value(self, sample: Any, size: int, scalable: bool, vary_scalars: bool) -> Any:
+        if isinstance(sample, bool):
+            return self.rng.random() < 0.5
+        if isinstance(sample, int) and vary_scalars:
+            bound = max(abs(sample), size)
+            return self.rng.randint(-bound, bound)
+        if isinstance(sample, int):
+            return sample if scalable else size
+        if isinstance(sample, float):
+            return sample if scalable else float(size)
+        if isinstance(sample, str):
+            return self._generate_string(sample, size)
+        if isinstance(sample, list):
+            return self._generate_list(sample, size)
+        return sample
+
+    def _generate_string(self, sample: str, size: int) -> str:
+        alphabet = sorted(set(sample)) or string.ascii_lowercase
+        return "".join(self.rng.choice(alphabet) for _ in range(size))
+
+    def _generate_list(self, sample: List[Any], size: int) -> List[Any]:
+        items = [item for item in sample if item is not None]
+        if len(items) == 0 or all(isinstance(item, int) and not isinstance(item, bool) for item in items):
+            low = min(items, default=0)
+            high = max(max(items, default=size), size)
+            return [self.rng.randint(low, high) for _ in range(size)]
+        if all(isinstance(item, float) for item in items):
+            low, high = min(items), max(items)
+            return [self.rng.uniform(low, high) for _ in range(size)]
+        if all(isinstance(item, str) for item in items):
+            length = max(len(item) for item in items)
+            return [self._generate_string("".join(items), length) for _ in range(size)]
+        if all(isinstance(item, list) for item in items):
+            return [self._generate_list(self.rng.choice(items), len(self.rng.choice(items))) for _ in range(size)]
+        return [self.rng.choice(items) for _ in range(size)]
+
+def parse_max_constraint(description: str) -> Optional[int]:
+    lines = [line for line in description.splitlines() if "length" in line or re.search(r"\bn\b", line)]
+    values = [
+        int(factor or 1)*int(base)**int(power or 1)
+        for line in lines
+        for factor, base, power in CONSTRAINT_RE.findall(line)
+    ]
+    return max(values, default=None)
@@ -1,32 +1,7 @@
-from classes.language import Languages, ShellLanguages, SQLDialects
+from typing import Optional
 
+from classes.language import Language, Languages, ShellLanguages, SQLDialects
 
-SLUG_TO_LANGUAGE = {
-    "cpp": Languages.CPP,
-    "java": Languages.JAVA,
-    "python3": Languages.PYTHON,
-    "c": Languages.C,
-    "csharp": Languages.CSHARP,
-    "javascript": Languages.JAVASCRIPT,
-    "typescript": Languages.TYPESCRIPT,
-    "php": Languages.PHP,
-    "swift": Languages.SWIFT,
-    "kotlin": Languages.KOTLIN,
-    "dart": Languages.DART,
-    "golang": Languages.GOLANG,
-    "ruby": Languages.RUBY,
-    "scala": Languages.SCALA,
-    "rust": Languages.RUST,
-    "racket": Languages.RACKET,
-    "erlang": Languages.ERLANG,
-    "elixir": Languages.ELIXIR,
-    "bash": ShellLanguages.BASH,
-    "mysql": SQLDialects.MYSQL,
-    "mssql": SQLDialects.MSSQL,
-    "oraclesql": SQLDialects.ORACLE,
-    "postgresql": SQLDialects.POSTGRES,
-    "pythondata": Languages.PYTHON
-}
 
 LANGUAGE_TO_SLUG = {
     Languages.CPP.value: "cpp",
@@ -52,4 +27,12 @@ LANGUAGE_TO_SLUG = {
     SQLDialects.MSSQL.value: "mssql",
     SQLDialects.ORACLE.value: "oraclesql",
     SQLDialects.POSTGRES.value: "postgresql"
-}
\ No newline at end of file
+}
+
+SLUG_TO_LANGUAGE = {
+    **{slug: language for language, slug in LANGUAGE_TO_SLUG.items()},
+    "pythondata": Languages.PYTHON.value
+}
+
+def language_by_slug(slug: str) -> Optional[Language]:
+    return SLUG_TO_LANGUAGE.get(slug)
@@ -0,0 +1,150 @@
+import sys
+import subprocess
+from copy import deepcopy
+from json import dump, dumps, load, loads
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+SOLUTION_PRELUDE = """
+import bisect, collections, functools, heapq, itertools, math, operator, random, re, string
+from bisect import *
+from collections import *
+from functools import *
+from heapq import *
+from itertools import *
+from math import *
+from typing import *
+"""
+RECURSION_LIMIT = 10**6
+
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+class TreeNode:
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+class LocalRunner:
+    solution_code: str
+    method_name: str
+    timeout_s: Optional[float]
+
+    def __init__(self, solution_code: str, method_name: str, timeout_s: Optional[float]=None) -> None:
+        self.solution_code = solution_code
+        self.method_name = method_name
+        self.timeout_s = timeout_s
+
+    def time(self, args: List[Any], annotations: List[str], repeats: int=1) -> List[float]:
+        return self._run(args, annotations, repeats)
+
+    def _run(self, args: List[Any], annotations: List[str], repeats: int) -> Any:
+        with TemporaryDirectory(prefix="cldojo-run-") as run_dir:
+            solution_path, input_path = Path(run_dir, "solution.py"), Path(run_dir, "input.json")
+            solution_path.write_text(self.solution_code, encoding="utf-8")
+            with input_path.open("w", encoding="utf-8") as w:
+                dump({"args": args, "annotations": annotations}, w)
+
+            process = subprocess.run(
+                (sys.executable, str(Path(__file__).resolve()), str(solution_path),
+                 self.method_name, str(input_path), str(repeats)),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout_s
+            )
+
+        if process.returncode != 0:
+            error_lines = process.stderr.strip().splitlines()
+            raise RuntimeError(error_lines[-1] if len(error_lines) > 0 else f"Solution exited with code {process.returncode}")
+        return loads(process.stdout.strip().splitlines()[-1])
+
+def build_linked_list(values: List[Any]) -> Optional[ListNode]:
+    head = None
+    for value in reversed(values):
+        head = ListNode(value, head)
+    return head
+
+def build_tree(values: List[Any]) -> Optional[TreeNode]:
+    if len(values) == 0 or values[0] is None:
+        return None
+
+    root = TreeNode(values[0])
+    level, i = [root], 1
+    while len(level) > 0 and i < len(values):
+        next_level = list()
+        for node in level:
+            for side in ("left", "right"):
+                if i < len(values) and values[i] is not None:
+                    child = TreeNode(values[i])
+                    setattr(node, side, child)
+                    next_level.append(child)
+                i+=1
+        level = next_level
+    return root
+
+def convert_arg(value: Any, annotation: str) -> Any:
+    if "ListNode" in annotation and isinstance(value, list):
+        return build_linked_list(value)
+    if "TreeNode" in annotation and isinstance(value, list):
+        return build_tree(value)
+    return value
+
+def serialize_value(value: Any) -> Any:
+    if isinstance(value, ListNode):
+        values = list()
+        while value is not None:
+            values.append(serialize_value(value.val))
+            value = value.next
+        return values
+    if isinstance(value, TreeNode):
+        values, level = list(), [value]
+        while any(node is not None for node in level):
+            next_level = list()
+            for node in level:
+                values.append(serialize_value(node.val) if node is not None else None)
+                if node is not None:
+                    next_level.extend((node.left, node.right))
+            level = next_level
+        while len(values) > 0 and values[-1] is None:
+            values.pop()
+        return values
+    if isinstance(value, (list, tuple)):
+        return [serialize_value(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(serialize_value(item) for item in value)
+    if isinstance(value, dict):
+        return {str(key): serialize_value(item) for key, item in value.items()}
+    return value
+
+def load_solution_method(source: str, method_name: str, file_name: str="solution.py") -> Callable[..., Any]:
+    sys.setrecursionlimit(RECURSION_LIMIT)
+    namespace = {"__name__": "solution", "ListNode": ListNode, "TreeNode": TreeNode}
+    exec(SOLUTION_PRELUDE, namespace)
+    exec(compile(source, file_name, "exec"), namespace)
+    return getattr(namespace["Solution"](), method_name)
+
+def run_solution(solution_path: str, method_name: str, input_path: str, repeats: int) -> None:
+    with open(input_path, "r", encoding="utf-8") as f:
+        data: Dict[str, Any] = load(f)
+    with open(solution_path, "r", encoding="utf-8") as f:
+        method = load_solution_method(f.read(), method_name, solution_path)
+
+    args, annotations = data.get("args"), data.get("annotations")
+    times = list()
+    for _ in range(repeats):
+        call_args = [convert_arg(deepcopy(arg), annotation) for arg, annotation in zip(args, annotations)]
+        start = perf_counter()
+        method(*call_args)
+        times.append(perf_counter()-start)
+    print(dumps(times))
+
+
+if __name__ == "__main__":
+    run_solution(sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4]))
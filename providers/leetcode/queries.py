@@ -0,0 +1,25 @@
+from typing import List
+
+
+QUESTION_DATA_QUERY = "query questionData($titleSlug: String!) {\n  question(titleSlug: $titleSlug) {\n    questionId\n    isPaidOnly\n    title\n    titleSlug\n    content\n    difficulty\n    categoryTitle\n    topicTags {\n      name\n    }\n    codeSnippets {\n      langSlug\n      code\n    }\n    sampleTestCase\n    judgeType\n    status\n  }\n}\n"
+PROBLEMSET_QUESTION_LIST_QUERY = "\n    query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {\n  problemsetQuestionList: questionList(\n    categorySlug: $categorySlug\n    limit: $limit\n    skip: $skip\n    filters: $filters\n  ) {\n    total: totalNum\n    questions: data {\n    questionId\n    isPaidOnly\n    title\n    titleSlug\n    content\n    difficulty\n    categoryTitle\n    topicTags {\n      name\n    }\n    codeSnippets {\n      langSlug\n      code\n    }\n    sampleTestCase\n    judgeType\n    status\n  }\n  }\n}\n    "
+RANDOM_QUESTION_QUERY = "\n    query randomQuestion($categorySlug: String, $filters: QuestionListFilterInput) {\n  randomQuestion(categorySlug: $categorySlug, filters: $filters) {\n    questionId\n    isPaidOnly\n    title\n    titleSlug\n    content\n    difficulty\n    categoryTitle\n    topicTags {\n      name\n    }\n    codeSnippets {\n      langSlug\n      code\n    }\n    sampleTestCase\n    judgeType\n    status\n  }\n}\n    "
+QUESTION_OF_TODAY_QUERY = "\n    query questionOfToday {\n  activeDailyCodingChallengeQuestion {\n    question {\n    questionId\n    isPaidOnly\n    title\n    titleSlug\n    content\n    difficulty\n    categoryTitle\n    topicTags {\n      name\n    }\n    codeSnippets {\n      langSlug\n      code\n    }\n    sampleTestCase\n    judgeType\n    status\n  }\n  }\n}\n    "
+STUDY_PLAN_STRUCTURE_QUERY = "\n    query studyPlanStructure($slug: String!) {\n  studyPlanV2Detail(planSlug: $slug) {\n    slug\n    name\n    planSubGroups {\n      questions {\n        titleSlug\n        paidOnly\n      }\n    }\n  }\n}\n    "
+STUDY_PLAN_PROGRESS_QUERY = "\n    query studyPlanProgress($slug: String!) {\n  studyPlanV2Detail(planSlug: $slug) {\n    planSubGroups {\n      questions {\n        titleSlug\n        status\n      }\n    }\n  }\n}\n    "
+GLOBAL_DATA_QUERY = "\n    query globalData {\n  userStatus {\n    isSignedIn\n    username\n  }\n}\n    "
+USER_PUBLIC_PROFILE_QUERY = "\n    query userPublicProfile($username: String!) {\n  matchedUser(username: $username) {\n    profile {\n      ranking\n      realName\n      postViewCount\n      reputation\n      solutionCount\n      categoryDiscussCount\n    }\n  }\n}\n    "
+LANGUAGE_STATS_QUERY = "\n    query languageStats($username: String!) {\n  matchedUser(username: $username) {\n    languageProblemCount {\n      languageName\n      problemsSolved\n    }\n  }\n}\n    "
+USER_PROBLEMS_SOLVED_QUERY = "\n    query userProblemsSolved($username: String!) {\n  allQuestionsCount {\n    difficulty\n    count\n  }\n  matchedUser(username: $username) {\n    problemsSolvedBeatsStats {\n      difficulty\n      percentage\n    }\n    submitStatsGlobal {\n      acSubmissionNum {\n        difficulty\n        count\n      }\n    }\n  }\n}\n    "
+PROBLEMSET_SLUGS_QUERY = "\n    query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {\n  problemsetQuestionList: questionList(\n    categorySlug: $categorySlug\n    limit: $limit\n    skip: $skip\n    filters: $filters\n  ) {\n    total: totalNum\n    questions: data {\n      titleSlug\n    }\n  }\n}\n    "
+PROBLEMSET_STATUSES_QUERY = "\n    query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {\n  problemsetQuestionList: questionList(\n    categorySlug: $categorySlug\n    limit: $limit\n    skip: $skip\n    filters: $filters\n  ) {\n    total: totalNum\n    questions: data {\n      titleSlug\n      difficulty\n      status\n      isPaidOnly\n      topicTags {\n        name\n      }\n    }\n  }\n}\n    "
+RECENT_SUBMISSIONS_QUERY = "\n    query recentSubmissions($username: String!, $limit: Int!) {\n  recentSubmissionList(username: $username, limit: $limit) {\n    titleSlug\n    timestamp\n    statusDisplay\n  }\n}\n    "
+USER_STATS_FIELDS = "    profile {\n      ranking\n      realName\n      postViewCount\n      reputation\n      solutionCount\n      categoryDiscussCount\n    }\n    languageProblemCount {\n      languageName\n      problemsSolved\n    }\n    problemsSolvedBeatsStats {\n      difficulty\n      percentage\n    }\n    submitStatsGlobal {\n      acSubmissionNum {\n        difficulty\n        count\n      }\n    }\n"
+
+def users_stats_query(aliases: List[str]) -> str:
+    variables = ", ".join(f"${alias}: String!" for alias in aliases)
+    users_query = "\n".join(
+        f"  {alias}: matchedUser(username: ${alias}) {{\n{USER_STATS_FIELDS}  }}"
+        for alias in aliases
+    )
+    return f"\n    query usersStats({variables}) {{\n  allQuestionsCount {{\n    difficulty\n    count\n  }}\n{users_query}\n}}\n    "
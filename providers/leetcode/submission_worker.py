@@ -0,0 +1,119 @@
+import os
+import platform
+import subprocess
+from time import sleep, time, time_ns
+from typing import List, Optional, Set
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import requests
+
+import providers.leetcode.classes as classes
+import providers.leetcode.exceptions as exceptions
+from classes.persistent_problem import PersistentProblem
+from utils.submission_queue import SubmissionQueue, QueuedSubmission
+from .client import LeetCodeClient
+
+
+QUEUE_POLL_S = 1
+QUEUE_RETRY_DELAY_S = 5
+QUEUE_MAX_RETRY_DELAY_S = 5*60
+QUEUE_MAX_ATTEMPTS = 20
+
+class LeetCodeSubmissionWorker:
+    client: LeetCodeClient
+    queue: SubmissionQueue
+    concurrency: int
+    submit_interval_s: float
+    worker_id: str
+
+    def __init__(
+        self,
+        client: LeetCodeClient,
+        queue: SubmissionQueue,
+        concurrency: int=2,
+        submit_interval_s: float=0
+    ) -> None:
+        self.client = client
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.submit_interval_s = submit_interval_s
+        self.worker_id = f"{os.getpid()}-{time_ns()}"
+
+    def run(self) -> int:
+        if not self.queue.acquire_worker(self.worker_id):
+            return 0
+
+        processed, last_claimed_at = 0, 0.0
+        running: Set[Future] = set()
+        try:
+            self.queue.requeue_running()
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                while True:
+                    self.queue.acquire_worker(self.worker_id)
+                    free = self.concurrency-len(running)
+                    if free > 0 and time()-last_claimed_at >= self.submit_interval_s:
+                        for submission in self.queue.claim(1 if self.submit_interval_s > 0 else free):
+                            running.add(executor.submit(self._process, submission))
+                            last_claimed_at = time()
+
+                    if len(running) == 0:
+                        if self.queue.release_worker_if_idle(self.worker_id):
+                            break
+                        sleep(QUEUE_POLL_S)
+                        continue
+                    done, running = wait(running, timeout=QUEUE_POLL_S, return_when=FIRST_COMPLETED)
+                    processed+=len(done)
+        finally:
+            self.queue.release_worker(self.worker_id)
+        return processed
+
+    def _process(self, submission: QueuedSubmission) -> None:
+        problem = classes.LeetCodeProblem.from_persistent(PersistentProblem.from_json(submission.payload.get("problem")))
+        try:
+            if submission.run_id is not None:
+                result = self.client.await_submission(problem, submission.run_id)
+            else:
+                result = self.client.submit_solution(
+                    problem,
+                    use_cache=submission.payload.get("use_cache", True),
+                    on_submitted=lambda run_id: self._set_run_id(submission, run_id)
+                )
+        except exceptions.RateLimited as e:
+            self._retry(submission, str(e), e.retry_after_s)
+        except exceptions.RequestFailed as e:
+            if e.status_code < 500:
+                self.queue.fail(submission.submission_id, str(e))
+            else:
+                self._retry(submission, str(e))
+        except (requests.ConnectionError, requests.Timeout, RuntimeError) as e:
+            self._retry(submission, str(e) or type(e).__name__)
+        except Exception as e:
+            self.queue.fail(submission.submission_id, str(e) or type(e).__name__)
+        else:
+            self.queue.complete(submission.submission_id, result.to_json())
+
+    def _set_run_id(self, submission: QueuedSubmission, run_id: str) -> None:
+        submission.run_id = run_id
+        self.queue.set_run_id(submission.submission_id, run_id)
+
+    def _retry(self, submission: QueuedSubmission, error: str, delay_s: Optional[float]=None) -> None:
+        if submission.attempts >= QUEUE_MAX_ATTEMPTS:
+            self.queue.fail(submission.submission_id, error)
+            return
+        backoff = min(QUEUE_RETRY_DELAY_S*2**(submission.attempts-1), QUEUE_MAX_RETRY_DELAY_S)
+        self.queue.retry(submission.submission_id, error, delay_s if delay_s is not None else backoff)
+
+def start_worker_in_background(command: List[str]) -> subprocess.Popen:
+    kwargs = {}
+    if platform.system() == "Windows":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    return subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs
+    )
@@ -0,0 +1,58 @@
+import lzma
+
+import pytest
+
+from utils.bundle import BundleReader, BundleWriter, BUNDLE_FORMAT
+from classes.exceptions import InvalidBundle
+
+
+def test_round_trip_keeps_records_in_order(tmp_path):
+    bundle_path = tmp_path.joinpath("problems.xz")
+    with BundleWriter(bundle_path, "leetcode", {"questions": 2, "problems": 1}) as bundle:
+        bundle.write("question", {"titleSlug": "two-sum"})
+        bundle.write("question", {"titleSlug": "add-two-numbers"})
+        bundle.write("problem", {"title_slug": "two-sum", "solution_code": "pass"})
+
+    with BundleReader(bundle_path) as bundle:
+        assert bundle.provider == "leetcode"
+        assert list(bundle.records()) == [
+            ("question", {"titleSlug": "two-sum"}),
+            ("question", {"titleSlug": "add-two-numbers"}),
+            ("problem", {"title_slug": "two-sum", "solution_code": "pass"})
+        ]
+
+def test_index_record_replaces_header_estimate(tmp_path):
+    bundle_path = tmp_path.joinpath("problems.xz")
+    with BundleWriter(bundle_path, "leetcode", {"questions": 5, "problems": 5}) as bundle:
+        bundle.write("question", {"titleSlug": "two-sum"})
+
+    with BundleReader(bundle_path) as bundle:
+        assert bundle.index == {"questions": 5, "problems": 5}
+        assert [record_type for record_type, _ in bundle.records()] == ["question"]
+        assert bundle.index == {"questions": 1}
+
+def test_failed_export_has_no_index_record(tmp_path):
+    bundle_path = tmp_path.joinpath("problems.xz")
+    with pytest.raises(RuntimeError):
+        with BundleWriter(bundle_path, "leetcode", {"questions": 1}) as bundle:
+            bundle.write("question", {"titleSlug": "two-sum"})
+            raise RuntimeError()
+
+    with BundleReader(bundle_path) as bundle:
+        assert len(list(bundle.records())) == 1
+        assert bundle.index == {"questions": 1}
+
+def test_plain_file_is_not_a_bundle(tmp_path):
+    bundle_path = tmp_path.joinpath("problems.xz")
+    bundle_path.write_text("not a bundle", encoding="utf-8")
+    with pytest.raises(InvalidBundle):
+        with BundleReader(bundle_path):
+            pass
+
+def test_other_format_is_not_a_bundle(tmp_path):
+    bundle_path = tmp_path.joinpath("problems.xz")
+    with lzma.open(bundle_path, "wt", encoding="utf-8") as f:
+        f.write(f'{{"format": "{BUNDLE_FORMAT}", "version": 0}}\n')
+    with pytest.raises(InvalidBundle):
+        with BundleReader(bundle_path):
+            pass
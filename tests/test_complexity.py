@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from utils.complexity import fit_complexity
+
+
+SIZES = [16, 64, 256, 1024, 4096, 16384]
+
+@pytest.mark.parametrize("name, function", [
+    ("O(1)", lambda n: np.full_like(n, 2e-6)),
+    ("O(n)", lambda n: 1e-7*n+1e-6),
+    ("O(n log n)", lambda n: 1e-7*n*np.log2(n)),
+    ("O(n^2)", lambda n: 1e-9*n**2+1e-6)
+])
+def test_detects_complexity_class(name, function):
+    times = function(np.array(SIZES, dtype=np.float64)).tolist()
+    assert fit_complexity(SIZES, times)[0].name == name
+
+def test_prefers_simpler_class_for_close_fits():
+    sizes = [100, 200, 400, 800]
+    times = [1e-3, 1.02e-3, 0.99e-3, 1.01e-3]
+    assert fit_complexity(sizes, times)[0].name == "O(1)"
+
+def test_skips_exponential_class_for_large_sizes():
+    times = [1e-7*n for n in SIZES]
+    assert "O(2^n)" not in {fit.name for fit in fit_complexity(SIZES, times)}
+
+def test_predict_extrapolates_fit():
+    times = [1e-7*n for n in SIZES]
+    fit = fit_complexity(SIZES, times)[0]
+    assert fit.predict(10**5) == pytest.approx(1e-2, rel=1e-3)
+
+def test_requires_two_sizes():
+    with pytest.raises(ValueError):
+        fit_complexity([16], [1e-6])
@@ -0,0 +1,51 @@
+from utils.search_index import SearchIndex, SearchDocument, tokenize
+
+
+def make_document(title_slug: str, title: str, text: str, tags=None) -> SearchDocument:
+    return SearchDocument(title_slug=title_slug, title=title, difficulty="Easy", tags=tags or list(), text=text)
+
+def test_tokenize_drops_stop_words_and_punctuation():
+    assert tokenize("Find the Sum of a sorted-array, in O(n)!") == ["find", "sum", "sorted", "array", "o", "n"]
+
+def test_term_frequencies_weight_title_and_tags():
+    frequencies = make_document("two-sum", "Two Sum", "sum of numbers", ["Array"]).term_frequencies()
+    assert frequencies["sum"] == 4
+    assert frequencies["two"] == 3
+    assert frequencies["array"] == 2
+    assert frequencies["numbers"] == 1
+
+def test_search_ranks_matching_documents(tmp_path):
+    index = SearchIndex(tmp_path.joinpath("index.sqlite3"))
+    index.add_documents([
+        make_document("two-sum", "Two Sum", "Return indices of two numbers adding up to target"),
+        make_document("valid-parentheses", "Valid Parentheses", "Check that brackets are closed in order", ["Stack"]),
+        make_document("min-stack", "Min Stack", "Design a stack that retrieves the minimum element", ["Stack", "Design"])
+    ])
+
+    results = index.search("stack")
+    assert [result.title_slug for result in results] == ["min-stack", "valid-parentheses"]
+    assert results[0].score > results[1].score
+    assert index.search("stack", limit=1)[0].title_slug == "min-stack"
+
+def test_search_without_matches(tmp_path):
+    index = SearchIndex(tmp_path.joinpath("index.sqlite3"))
+    assert index.search("stack") == list()
+    index.add_document(make_document("two-sum", "Two Sum", "Return indices of two numbers"))
+    assert index.search("the of") == list()
+    assert index.search("graph") == list()
+
+def test_readding_document_replaces_postings(tmp_path):
+    index = SearchIndex(tmp_path.joinpath("index.sqlite3"))
+    index.add_document(make_document("two-sum", "Two Sum", "hash map lookup"))
+    index.add_document(make_document("two-sum", "Two Sum", "sorting and two pointers"))
+
+    assert index.indexed_slugs() == {"two-sum"}
+    assert index.search("hash") == list()
+    assert [result.title_slug for result in index.search("pointers")] == ["two-sum"]
+
+def test_clear_removes_documents(tmp_path):
+    index = SearchIndex(tmp_path.joinpath("index.sqlite3"))
+    index.add_document(make_document("two-sum", "Two Sum", "hash map lookup"))
+    index.clear()
+    assert index.indexed_slugs() == set()
+    assert index.search("hash") == list()
@@ -0,0 +1,44 @@
+import pytest
+
+from utils.search_index import SearchDocument
+from utils.similarity import SimilarityModel
+
+
+def make_document(title_slug: str, text: str) -> SearchDocument:
+    return SearchDocument(title_slug=title_slug, title="", difficulty="Easy", tags=list(), text=text)
+
+DOCUMENTS = [
+    make_document("two-sum", "array hash map target indices"),
+    make_document("three-sum", "array target triplets sorting pointers"),
+    make_document("min-stack", "stack design minimum element"),
+    make_document("max-stack", "stack design maximum element")
+]
+
+def test_most_similar_orders_by_cosine_similarity(tmp_path):
+    model = SimilarityModel(tmp_path)
+    assert model.update(DOCUMENTS) == 4
+
+    similar = list(model.most_similar("min-stack"))
+    assert similar[0][0] == "max-stack"
+    assert "two-sum" not in {slug for slug, _ in similar}
+    assert all(0 < score <= 1 for _, score in similar)
+
+def test_model_is_persisted(tmp_path):
+    SimilarityModel(tmp_path).update(DOCUMENTS)
+    model = SimilarityModel(tmp_path)
+
+    assert "two-sum" in model
+    assert [slug for slug, _ in model.most_similar("two-sum")] == ["three-sum"]
+
+def test_update_skips_known_and_empty_documents(tmp_path):
+    model = SimilarityModel(tmp_path)
+    model.update(DOCUMENTS[:2])
+    assert model.update([DOCUMENTS[0], make_document("empty", "the of"), DOCUMENTS[2]]) == 1
+    assert model.slugs == ["two-sum", "three-sum", "min-stack"]
+    assert "empty" not in model
+
+def test_unknown_problem(tmp_path):
+    model = SimilarityModel(tmp_path)
+    assert "two-sum" not in model
+    with pytest.raises(KeyError):
+        list(model.most_similar("two-sum"))
@@ -0,0 +1,93 @@
+import sqlite3
+
+from utils.submission_queue import SubmissionQueue, SubmissionState
+
+
+def make_queue(tmp_path) -> SubmissionQueue:
+    return SubmissionQueue(tmp_path.joinpath("queue.sqlite3"))
+
+def test_claim_marks_submissions_running_in_order(tmp_path):
+    queue = make_queue(tmp_path)
+    first = queue.enqueue("Two Sum", "Python", {"title_slug": "two-sum"})
+    second = queue.enqueue("Two Sum", "Go", {"title_slug": "two-sum"})
+
+    claimed = queue.claim(1)
+    assert [submission.submission_id for submission in claimed] == [first]
+    assert claimed[0].state == SubmissionState.RUNNING
+    assert claimed[0].attempts == 1
+    assert claimed[0].payload == {"title_slug": "two-sum"}
+
+    assert [submission.submission_id for submission in queue.claim(5)] == [second]
+    assert queue.claim(5) == list()
+    assert queue.pending_count() == 2
+
+def test_finished_submissions_are_not_pending(tmp_path):
+    queue = make_queue(tmp_path)
+    done = queue.enqueue("Two Sum", "Python", dict())
+    failed = queue.enqueue("Two Sum", "Go", dict())
+    queue.claim(2)
+    queue.complete(done, {"state": "Accepted"})
+    queue.fail(failed, "Leetcode returned 400")
+
+    assert queue.pending_count() == 0
+    assert queue.submissions(include_finished=False) == list()
+    submissions = queue.submissions()
+    assert submissions[0].result == {"state": "Accepted"}
+    assert submissions[1].error == "Leetcode returned 400"
+    assert queue.clear_finished() == 2
+    assert queue.submissions() == list()
+
+def test_retry_delays_next_attempt(tmp_path):
+    queue = make_queue(tmp_path)
+    submission_id = queue.enqueue("Two Sum", "Python", dict())
+    queue.claim(1)
+    queue.retry(submission_id, "Leetcode returned 502", delay_s=60)
+
+    assert queue.claim(1) == list()
+    assert queue.pending_count() == 1
+    assert queue.next_attempt_at() > queue.submissions()[0].created_at+59
+
+def test_run_id_survives_requeue(tmp_path):
+    queue = make_queue(tmp_path)
+    submission_id = queue.enqueue("Two Sum", "Python", dict())
+    queue.claim(1)
+    queue.set_run_id(submission_id, "123")
+
+    assert queue.requeue_running() == 1
+    claimed = queue.claim(1)
+    assert claimed[0].run_id == "123"
+    assert claimed[0].attempts == 2
+
+def test_single_worker_is_allowed(tmp_path):
+    queue = make_queue(tmp_path)
+    assert queue.acquire_worker("a")
+    assert not queue.acquire_worker("b")
+    assert queue.is_worker_alive()
+    queue.release_worker("a")
+    assert queue.acquire_worker("b")
+
+def test_worker_is_released_only_when_idle(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.acquire_worker("a")
+    submission_id = queue.enqueue("Two Sum", "Python", dict())
+
+    assert not queue.release_worker_if_idle("a")
+    assert queue.is_worker_alive()
+    queue.claim(1)
+    queue.complete(submission_id, dict())
+    assert queue.release_worker_if_idle("a")
+    assert not queue.is_worker_alive()
+
+def test_old_queue_gets_run_id_column(tmp_path):
+    queue_path = tmp_path.joinpath("queue.sqlite3")
+    with sqlite3.connect(queue_path) as conn:
+        conn.execute(
+            "CREATE TABLE submissions (id INTEGER PRIMARY KEY, problem_title TEXT NOT NULL, language TEXT NOT NULL, "
+            "payload TEXT NOT NULL, state TEXT NOT NULL, attempts INTEGER NOT NULL, created_at REAL NOT NULL, "
+            "next_attempt_at REAL NOT NULL, result TEXT, error TEXT)"
+        )
+    conn.close()
+
+    queue = SubmissionQueue(queue_path)
+    queue.enqueue("Two Sum", "Python", dict())
+    assert queue.claim(1)[0].run_id is None
@@ -0,0 +1,82 @@
+from hashlib import sha256
+from json import load, dumps, JSONDecodeError
+from typing import Callable, Dict, Iterable, Optional
+from pathlib import Path
+from urllib.parse import urlparse
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+
+from .atomic import file_lock, atomic_write_bytes, atomic_write_text
+
+
+ASSETS_DIR_NAME = "assets"
+INDEX_FILE_NAME = "index.json"
+MAX_SUFFIX_LENGTH = 8
+
+class AssetStore:
+    store_path: Path
+    index: Dict[str, str]
+    _lock: Lock
+
+    def __init__(self, store_path: Path) -> None:
+        self.store_path = store_path
+        self.index = self._load_index()
+        self._lock = Lock()
+
+    def get_path(self, url: str) -> Optional[Path]:
+        with self._lock:
+            name = self.index.get(url)
+        if name is None:
+            return None
+        path = self.store_path.joinpath(name)
+        return path if path.is_file() else None
+
+    def fetch(
+        self,
+        urls: Iterable[str],
+        download: Callable[[str], bytes],
+        max_workers: int=8
+    ) -> Dict[str, Path]:
+        urls = list(dict.fromkeys(urls))
+        missing = [url for url in urls if self.get_path(url) is None]
+
+        if len(missing) > 0:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                contents = list(executor.map(lambda url: self._try_download(download, url), missing))
+            for url, content in zip(missing, contents):
+                if content is not None:
+                    self.put(url, content)
+            self.save_index()
+
+        return {url: path for url in urls if (path := self.get_path(url)) is not None}
+
+    def put(self, url: str, content: bytes) -> Path:
+        digest = sha256(content).hexdigest()
+        suffix = Path(urlparse(url).path).suffix.lower()[:MAX_SUFFIX_LENGTH]
+        name = f"{digest[:2]}/{digest}{suffix}"
+
+        path = self.store_path.joinpath(name)
+        if not path.is_file():
+            atomic_write_bytes(path, content)
+
+        with self._lock:
+            self.index[url] = name
+        return path
+
+    def save_index(self) -> None:
+        with self._lock, file_lock(self.store_path.joinpath(INDEX_FILE_NAME)):
+            self.index = {**self._load_index(), **self.index}
+            atomic_write_text(self.store_path.joinpath(INDEX_FILE_NAME), dumps(self.index, ensure_ascii=False))
+
+    def _load_index(self) -> Dict[str, str]:
+        try:
+            with self.store_path.joinpath(INDEX_FILE_NAME).open("r", encoding="utf-8") as f:
+                return load(f)
+        except (OSError, JSONDecodeError):
+            return dict()
+
+    def _try_download(self, download: Callable[[str], bytes], url: str) -> Optional[bytes]:
+        try:
+            return download(url)
+        except OSError:
+            return None
@@ -0,0 +1,104 @@
+import os
+import stat
+from time import time_ns
+from contextlib import contextmanager, suppress
+from typing import IO, Iterator
+from pathlib import Path
+
+if os.name == "nt":
+    import msvcrt
+    fcntl = None
+else:
+    import fcntl
+    msvcrt = None
+
+
+LOCK_SUFFIX = ".lock"
+TMP_SUFFIX = ".tmp"
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    lock_path = path.with_name(f".{path.name}{LOCK_SUFFIX}")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    while True:
+        f = lock_path.open("a+b")
+        try:
+            _lock_file(f)
+        except BaseException:
+            f.close()
+            raise
+        if _is_same_file(f, lock_path):
+            break
+        _unlock_file(f)
+        f.close()
+
+    try:
+        yield
+    finally:
+        if msvcrt is None:
+            with suppress(OSError):
+                os.remove(lock_path)
+        _unlock_file(f)
+        f.close()
+        if msvcrt is not None:
+            with suppress(OSError):
+                os.remove(lock_path)
+
+def _lock_file(f: IO[bytes]) -> None:
+    if msvcrt is not None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+def _unlock_file(f: IO[bytes]) -> None:
+    if msvcrt is not None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def _is_same_file(f: IO[bytes], path: Path) -> bool:
+    try:
+        return os.path.samestat(os.fstat(f.fileno()), os.stat(path))
+    except OSError:
+        return False
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{time_ns()}{TMP_SUFFIX}")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as w:
+            w.write(content)
+            w.flush()
+            os.fsync(w.fileno())
+        with suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+@contextmanager
+def atomic_open_text(path: Path, encoding: str="utf-8") -> Iterator[IO[str]]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{time_ns()}{TMP_SUFFIX}")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as w:
+            yield w
+            w.flush()
+            os.fsync(w.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+def atomic_write_text(path: Path, text: str, encoding: str="utf-8") -> None:
+    atomic_write_bytes(path, text.replace("\n", os.linesep).encode(encoding))
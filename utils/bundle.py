@@ -0,0 +1,98 @@
+import lzma
+from time import time
+from json import dumps, loads
+from typing import Any, Dict, IO, Iterator, Optional, Tuple
+from pathlib import Path
+
+from classes.exceptions import InvalidBundle
+
+
+BUNDLE_FORMAT = "cldojo-bundle"
+BUNDLE_VERSION = 1
+INDEX_RECORD_TYPE = "index"
+
+class BundleWriter:
+    path: Path
+    provider: str
+    index: Dict[str, int]
+    counts: Dict[str, int]
+    _file: Optional[IO[str]]
+
+    def __init__(self, path: Path, provider: str, index: Dict[str, int]) -> None:
+        self.path = path
+        self.provider = provider
+        self.index = index
+        self.counts = dict()
+        self._file = None
+
+    def __enter__(self) -> "BundleWriter":
+        self._file = lzma.open(self.path, "wt", encoding="utf-8")
+        self._write_line({
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "provider": self.provider,
+            "created_at": time(),
+            "index": self.index
+        })
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        try:
+            if exc_type is None:
+                self._write_line({"type": INDEX_RECORD_TYPE, "data": self.counts})
+        finally:
+            self._file.close()
+            self._file = None
+
+    def write(self, record_type: str, data: Dict[str, Any]) -> None:
+        self._write_line({"type": record_type, "data": data})
+        self.counts[f"{record_type}s"] = self.counts.get(f"{record_type}s", 0)+1
+
+    def _write_line(self, obj: Dict[str, Any]) -> None:
+        self._file.write(dumps(obj, ensure_ascii=False))
+        self._file.write("\n")
+
+class BundleReader:
+    path: Path
+    header: Dict[str, Any]
+    _file: Optional[IO[str]]
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.header = dict()
+        self._file = None
+
+    def __enter__(self) -> "BundleReader":
+        self._file = lzma.open(self.path, "rt", encoding="utf-8")
+        try:
+            self.header = loads(self._file.readline())
+        except (lzma.LZMAError, ValueError):
+            self._file.close()
+            raise InvalidBundle(f"\"{self.path}\" is not a valid bundle")
+
+        if self.header.get("format") != BUNDLE_FORMAT or self.header.get("version") != BUNDLE_VERSION:
+            self._file.close()
+            raise InvalidBundle(f"\"{self.path}\" is not a valid bundle")
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._file.close()
+        self._file = None
+
+    @property
+    def provider(self) -> str:
+        return self.header.get("provider")
+
+    @property
+    def index(self) -> Dict[str, int]:
+        return self.header.get("index") or dict()
+
+    def records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for line in self._file:
+            if len(line.strip()) == 0:
+                continue
+            record = loads(line)
+            if record.get("type") == INDEX_RECORD_TYPE:
+                self.header["index"] = record.get("data")
+                continue
+            yield record.get("type"), record.get("data")
@@ -0,0 +1,50 @@
+import os
+import re
+from time import time
+from typing import Any, List, Optional
+from pathlib import Path
+from json import load, dumps, JSONDecodeError
+
+from .atomic import atomic_write_text
+
+
+UNSAFE_KEY_CHARS = re.compile(r"[^\w.-]")
+
+class JsonCache:
+    provider: str
+    cache_path: Path
+
+    def __init__(self, provider: str, cache_path: Path=Path(".cache")) -> None:
+        self.provider = provider
+        self.cache_path = cache_path.joinpath(self.provider)
+
+    def get(self, namespace: str, key: str, max_age_s: Optional[float]=None) -> Optional[Any]:
+        entry_path = self.get_entry_path(namespace, key)
+        try:
+            if max_age_s is not None and time()-entry_path.stat().st_mtime > max_age_s:
+                return None
+            with entry_path.open("r", encoding="utf-8") as f:
+                return load(f)
+        except (OSError, JSONDecodeError):
+            return None
+
+    def set(self, namespace: str, key: str, value: Any) -> Path:
+        entry_path = self.get_entry_path(namespace, key)
+        atomic_write_text(entry_path, dumps(value, ensure_ascii=False))
+        return entry_path
+
+    def delete(self, namespace: str, key: str) -> bool:
+        try:
+            os.remove(self.get_entry_path(namespace, key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def keys(self, namespace: str) -> List[str]:
+        namespace_dir = self.cache_path.joinpath(namespace)
+        if not namespace_dir.is_dir():
+            return list()
+        return [path.stem for path in namespace_dir.iterdir() if path.suffix == ".json"]
+
+    def get_entry_path(self, namespace: str, key: str) -> Path:
+        return self.cache_path.joinpath(namespace, f"{UNSAFE_KEY_CHARS.sub('_', key)}.json")
@@ -34,6 +34,20 @@ def pass_styler(f):
         return ctx.invoke(f, ctx.obj.get("styler"), *args, **kwargs)
     return update_wrapper(new_func, f)
 
+def pass_printer(f):
+    @click.pass_context
+    def new_func(ctx, *args, **kwargs):
+        ctx.ensure_object(dict)
+        return ctx.invoke(f, ctx.obj.get("printer"), *args, **kwargs)
+    return update_wrapper(new_func, f)
+
+def pass_cache(f):
+    @click.pass_context
+    def new_func(ctx, *args, **kwargs):
+        ctx.ensure_object(dict)
+        return ctx.invoke(f, ctx.obj.get("cache"), *args, **kwargs)
+    return update_wrapper(new_func, f)
+
 def pass_default_languages(provider:str):
     def inner(f):
         @pass_config
@@ -0,0 +1,127 @@
+import os
+import sys
+import shlex
+from json import load, dumps, JSONDecodeError
+from typing import Dict, Iterable, List, Optional
+from pathlib import Path
+
+from classes.language import all_languages
+from utils.atomic import atomic_write_text
+from utils.config import get_config
+
+
+COMPLETE_VAR = "_DOJO_COMPLETE"
+COMPLETION_INDEX_FILE_NAME = "completion_index.json"
+SAVED_PROBLEMS_KEY = "saved"
+PROBLEMSET_KEY = "problemset"
+VALUE_OPTIONS = {"--format"}
+SAVED_PROBLEM_COMMANDS = {"test", "submit", "checkout"}
+PROBLEMSET_COMMANDS = {"get", "similar"}
+LANGUAGE_COMMANDS = {"get", "test", "submit", "checkout", "list"}
+
+class CompletionIndex:
+    index_path: Path
+    _data: Optional[Dict[str, List[str]]]
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = index_path
+        self._data = None
+
+    @property
+    def data(self) -> Dict[str, List[str]]:
+        if self._data is None:
+            try:
+                with self.index_path.open("r", encoding="utf-8") as f:
+                    self._data = load(f)
+            except (OSError, JSONDecodeError):
+                self._data = dict()
+        return self._data
+
+    def get(self, key: str) -> List[str]:
+        return self.data.get(key) or list()
+
+    def set(self, key: str, values: Iterable[str]) -> None:
+        self.data[key] = sorted(set(values))
+        self.save()
+
+    def add(self, key: str, values: Iterable[str]) -> None:
+        known = set(self.get(key))
+        if not known.issuperset(values):
+            self.set(key, known.union(values))
+
+    def save(self) -> None:
+        atomic_write_text(self.index_path, dumps(self.data, ensure_ascii=False))
+
+_completion_indexes: Dict[Path, CompletionIndex] = dict()
+
+def get_completion_index(cache_dir: str, provider: str) -> CompletionIndex:
+    index_path = Path(cache_dir).joinpath(provider, COMPLETION_INDEX_FILE_NAME)
+    if index_path not in _completion_indexes:
+        _completion_indexes[index_path] = CompletionIndex(index_path)
+    return _completion_indexes[index_path]
+
+def language_names() -> List[str]:
+    return [name for language in all_languages() for name in (language.name, *language.aliases)]
+
+def complete_saved_problems(index: CompletionIndex, incomplete: str) -> List[str]:
+    return [slug for slug in index.get(SAVED_PROBLEMS_KEY) if slug.startswith(incomplete)]
+
+def complete_problemset(index: CompletionIndex, incomplete: str) -> List[str]:
+    slugs = set(index.get(PROBLEMSET_KEY)).union(index.get(SAVED_PROBLEMS_KEY))
+    return sorted(slug for slug in slugs if slug.startswith(incomplete))
+
+def complete_languages(incomplete: str) -> List[str]:
+    return [name for name in language_names() if name.lower().startswith(incomplete.lower())]
+
+def shell_complete_saved_problems(ctx, param, incomplete: str) -> List[str]:
+    return complete_saved_problems(get_provider_completion_index(), incomplete)
+
+def shell_complete_problemset(ctx, param, incomplete: str) -> List[str]:
+    return complete_problemset(get_provider_completion_index(), incomplete)
+
+def shell_complete_languages(ctx, param, incomplete: str) -> List[str]:
+    return complete_languages(incomplete)
+
+def get_provider_completion_index(provider: str="leetcode") -> CompletionIndex:
+    return get_completion_index(get_config().get("main", "cache_dir"), provider)
+
+def complete_fast(index: CompletionIndex) -> bool:
+    instruction = os.environ.get(COMPLETE_VAR, "")
+    shell, _, action = instruction.partition("_")
+    if action != "complete" or shell not in ("bash", "zsh", "fish"):
+        return False
+
+    try:
+        words = shlex.split(os.environ.get("COMP_WORDS", ""))
+    except ValueError:
+        return False
+    if shell == "fish":
+        incomplete = os.environ.get("COMP_CWORD", "")
+        args = words[1:]
+        if len(incomplete) > 0 and len(args) > 0 and args[-1] == incomplete:
+            args.pop()
+    else:
+        cword = int(os.environ.get("COMP_CWORD", "0"))
+        args = words[1:cword]
+        incomplete = words[cword] if cword < len(words) else ""
+
+    while len(args) > 1 and args[0] in VALUE_OPTIONS:
+        args = args[2:]
+    if len(args) < 2 or args[0] != "leetcode" or incomplete.startswith("-") \
+            or any(arg.startswith("-") for arg in args):
+        return False
+
+    command, position = args[1], len(args)-2
+    if command in SAVED_PROBLEM_COMMANDS and position == 0:
+        values = complete_saved_problems(index, incomplete)
+    elif command in PROBLEMSET_COMMANDS and position == 0:
+        values = complete_problemset(index, incomplete)
+    elif command in LANGUAGE_COMMANDS and position == (0 if command == "list" else 1):
+        values = complete_languages(incomplete)
+    else:
+        return False
+
+    separator = "\n" if shell == "zsh" else ","
+    suffix = "\n_" if shell == "zsh" else ""
+    sys.stdout.write("\n".join(f"plain{separator}{value}{suffix}" for value in values))
+    return True
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+
+MAX_EXPONENTIAL_SIZE = 40
+SIMPLER_FIT_TOLERANCE = 1.1
+COMPLEXITY_CLASSES: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "O(1)": lambda n: np.ones_like(n),
+    "O(log n)": lambda n: np.log2(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n*np.log2(n),
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+    "O(2^n)": lambda n: np.exp2(n)
+}
+
+@dataclass()
+class ComplexityFit:
+    name: str
+    coefficient: float
+    intercept: float
+    error: float
+
+    def predict(self, size: float) -> float:
+        return self.coefficient*float(COMPLEXITY_CLASSES[self.name](np.array([size], dtype=np.float64))[0])+self.intercept
+
+def fit_complexity(sizes: Sequence[int], times: Sequence[float]) -> List[ComplexityFit]:
+    n = np.asarray(sizes, dtype=np.float64)
+    t = np.asarray(times, dtype=np.float64)
+    if len(n) < 2:
+        raise ValueError("At least two sizes are required to estimate complexity")
+
+    fits = list()
+    for name, function in COMPLEXITY_CLASSES.items():
+        if name == "O(2^n)" and n.max() > MAX_EXPONENTIAL_SIZE:
+            continue
+
+        features = function(n)
+        if name == "O(1)":
+            coefficient, intercept = float(np.median(t)), 0.0
+        else:
+            matrix = np.column_stack((features, np.ones_like(n)))/t[:, np.newaxis]
+            (coefficient, intercept), *_ = np.linalg.lstsq(matrix, np.ones_like(t), rcond=None)
+            if coefficient <= 0:
+                continue
+
+        predicted = coefficient*features+intercept
+        error = float(np.sqrt(np.mean(((predicted-t)/t)**2)))
+        fits.append(ComplexityFit(name, float(coefficient), float(intercept), error))
+
+    best_error = min(fit.error for fit in fits)
+    return sorted(
+        fits,
+        key=lambda fit: (
+            fit.error > best_error*SIMPLER_FIT_TOLERANCE,
+            fit.error if fit.error > best_error*SIMPLER_FIT_TOLERANCE else list(COMPLEXITY_CLASSES).index(fit.name)
+        )
+    )
@@ -1,9 +1,11 @@
 from contextlib import suppress
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
-from json import load, loads, dump, JSONDecodeError
-from dataclasses import dataclass
+from json import load, loads, dumps, JSONDecodeError
+from dataclasses import dataclass, field
+
+from .atomic import file_lock, atomic_write_text
 
 
 CONFIG_PATH: Path = Path("config.json")
@@ -38,47 +40,61 @@ class Config(ABC):
 class JsonConfig(Config):
     json_path: Path
     data: Dict[str, Any]
+    defaults: Dict[str, Any] = field(default_factory=dict)
     
     @classmethod
-    def from_path(cls: "Config", json_path: Path) -> "Config":
+    def from_path(cls: "Config", json_path: Path, defaults: Optional[Dict[str, Any]]=None) -> "Config":
         with json_path.open("r", encoding="utf-8") as f:
-            return cls(json_path=json_path, data=load(f))
+            return cls(json_path=json_path, data=load(f), defaults=defaults or dict())
 
     def get(self, *config_path: str, allow_last_none: bool=False) -> Any:
         error_str = f"Config not found: {'.'.join(config_path)}"
-        current_obj = self.data
-        for key in config_path:
-            if current_obj is None:
-                raise KeyError(error_str)
-            current_obj = current_obj.get(key)
+        current_obj = self._lookup(self.data, config_path)
+        if current_obj is None:
+            current_obj = self._lookup(self.defaults, config_path)
         if not allow_last_none and current_obj is None:
             raise KeyError(error_str)
         return current_obj
     
     def set(self, *config_path: str, value: Any) -> None:
-        current_obj = self.data
-        for key in config_path[:-1]:
+        with file_lock(self.json_path):
+            with suppress(OSError, JSONDecodeError), self.json_path.open("r", encoding="utf-8") as f:
+                self.data = load(f)
+
+            current_obj = self.data
+            for key in config_path[:-1]:
+                if current_obj is None:
+                    raise KeyError(f"Config not found: {'.'.join(config_path)}")
+                current_obj = current_obj.get(key)
+            current_obj[config_path[-1]] = value
+
+            atomic_write_text(self.json_path, dumps(self.data, ensure_ascii=False, indent=2))
+
+    def _lookup(self, data: Dict[str, Any], config_path: Tuple[str]) -> Any:
+        current_obj = data
+        for key in config_path:
             if current_obj is None:
-                raise KeyError(f"Config not found: {'.'.join(config_path)}")
+                return None
             current_obj = current_obj.get(key)
-        current_obj[config_path[-1]] = value
-
-        with self.json_path.open("w", encoding="utf-8") as w:
-            dump(self.data, w, ensure_ascii=False, indent=2)
+        return current_obj
 
 def get_config() -> Config:
     if not CONFIG_PATH.is_file():
-        with CONFIG_PATH.open("w", encoding="utf-8") as w:
-            dump(DEFAULT_CONFIG, w, ensure_ascii=False, indent=2)
-    return JsonConfig.from_path(CONFIG_PATH)
+        atomic_write_text(CONFIG_PATH, dumps(DEFAULT_CONFIG, ensure_ascii=False, indent=2))
+    return JsonConfig.from_path(CONFIG_PATH, defaults=DEFAULT_CONFIG)
     
 
 DEFAULT_CONFIG = {
   "main": {
     "problems_dir": "problems",
+    "problems_storage": "files",
+    "cache_dir": ".cache",
     "open_saved_problems": False,
+    "download_assets": False,
+    "trash_keep_days": 0,
     "max_description_line_length": 88,
     "max_result_line_length": 256,
+    "max_result_lines": 50,
     "show_problem_tags": True,
     "colors": {
         "title": "bright_magenta",
@@ -93,6 +109,9 @@ DEFAULT_CONFIG = {
       "default_language": "Python",
       "default_shell_language": "Bash",
       "default_sql_dialect": "MySQL",
+      "max_concurrent_requests": 8,
+      "queue_concurrency": 2,
+      "queue_submit_interval_s": 5,
       "code_prefixes": {
         "C++": None,
         "Java": None,
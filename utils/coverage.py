@@ -0,0 +1,33 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+def group_coverage(
+    groups: Sequence[Sequence[str]],
+    solved: Sequence[bool],
+    attempted: Sequence[bool]
+) -> List[Tuple[str, int, int, int]]:
+    names = sorted({name for item_groups in groups for name in item_groups})
+    if len(names) == 0:
+        return list()
+
+    name_indexes = {name: i for i, name in enumerate(names)}
+    item_indexes = np.repeat(np.arange(len(groups)), [len(item_groups) for item_groups in groups])
+    group_indexes = np.fromiter(
+        (name_indexes[name] for item_groups in groups for name in item_groups),
+        dtype=np.int64,
+        count=len(item_indexes)
+    )
+    solved_weights = np.asarray(solved, dtype=np.float64)[item_indexes]
+    attempted_weights = np.asarray(attempted, dtype=np.float64)[item_indexes]
+
+    totals = np.bincount(group_indexes, minlength=len(names))
+    solved_counts = np.bincount(group_indexes, weights=solved_weights, minlength=len(names)).astype(np.int64)
+    attempted_counts = np.bincount(group_indexes, weights=attempted_weights, minlength=len(names)).astype(np.int64)
+
+    order = np.lexsort((np.arange(len(names)), -totals))
+    return [
+        (names[i], int(totals[i]), int(solved_counts[i]), int(attempted_counts[i]))
+        for i in order
+    ]
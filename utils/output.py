@@ -0,0 +1,48 @@
+import sys
+from enum import Enum
+from json import dumps
+from typing import Any, Dict
+
+import click
+
+from utils.style import OutputStyler
+
+
+class OutputFormat(Enum):
+    TEXT = "text"
+    NDJSON = "ndjson"
+
+class OutputPrinter:
+    output_format: OutputFormat
+    styler: OutputStyler
+
+    def __init__(self, output_format: OutputFormat, styler: OutputStyler) -> None:
+        self.output_format = output_format
+        self.styler = styler
+
+    @property
+    def is_ndjson(self) -> bool:
+        return self.output_format == OutputFormat.NDJSON
+
+    def echo(self, obj: Any) -> None:
+        if self.is_ndjson:
+            self.echo_json(obj.to_json())
+        else:
+            click.echo(obj.styled_str(self.styler))
+
+    def echo_record(self, data: Dict[str, Any], text: str) -> None:
+        if self.is_ndjson:
+            self.echo_json(data)
+        else:
+            click.echo(text)
+
+    def echo_json(self, data: Dict[str, Any]) -> None:
+        sys.stdout.write(dumps(data, ensure_ascii=False))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+    def message(self, text: str) -> None:
+        click.echo(text, err=self.is_ndjson)
+
+    def confirm(self, text: str) -> bool:
+        return click.confirm(text, err=self.is_ndjson)
@@ -0,0 +1,115 @@
+import os
+from enum import Enum
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Tuple
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from .problem_formatter import ProblemFormatter
+from .problem_storage import ARCHIVE_FILE_NAME
+from classes.language import Language, LANGUAGES, any_language_by_name
+from classes.exceptions import InvalidProblemText
+
+
+CHECK_CHUNK_SIZE = 256
+
+class ProblemIssueType(Enum):
+    INVALID = "invalid"
+    MISSING_METADATA = "missing metadata"
+    ORPHANED = "orphaned"
+
+@dataclass()
+class ProblemIssue:
+    path: Path
+    issue_type: ProblemIssueType
+    language: Optional[Language]
+    details: str
+
+    @property
+    def repairable(self) -> bool:
+        return self.issue_type != ProblemIssueType.ORPHANED
+
+    def __str__(self) -> str:
+        return f"[{self.issue_type.value}] {self.path}: {self.details}"
+
+class ProblemChecker:
+    problems_path: Path
+    required_metadata: Tuple[str, ...]
+    max_workers: Optional[int]
+
+    def __init__(
+        self,
+        problems_path: Path,
+        required_metadata: Iterable[str]=tuple(),
+        max_workers: Optional[int]=None
+    ) -> None:
+        self.problems_path = problems_path
+        self.required_metadata = tuple(required_metadata)
+        self.max_workers = max_workers
+
+    def check(
+        self,
+        problem_files: Iterable[Tuple[Path, Language]],
+        find_orphans: bool=True
+    ) -> Iterator[ProblemIssue]:
+        problem_files = list(problem_files)
+        tasks = [(str(path), language.name, self.required_metadata) for path, language in problem_files]
+
+        if len(tasks) > 0:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                for issue in executor.map(check_problem_file, tasks, chunksize=CHECK_CHUNK_SIZE):
+                    if issue is not None:
+                        yield issue
+
+        if not find_orphans:
+            return
+        known_paths = {path.resolve() for path, _ in problem_files}
+        for path in self.find_unknown_files():
+            if path.resolve() not in known_paths:
+                yield ProblemIssue(path, ProblemIssueType.ORPHANED, None, "not a problem file of any language")
+
+    def find_unknown_files(self) -> Iterator[Path]:
+        if not self.problems_path.is_dir():
+            return
+
+        for entry in self.problems_path.iterdir():
+            if entry.name.startswith(".") or entry.name.startswith(ARCHIVE_FILE_NAME):
+                continue
+            if entry.is_file():
+                yield entry
+                continue
+
+            language = LANGUAGES.get(entry.name)
+            for root, dirs, files in os.walk(entry):
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+                for name in files:
+                    if name.startswith("."):
+                        continue
+                    path = Path(root, name)
+                    if language is None or language.name != entry.name or path.parent != entry \
+                            or path.suffix != f".{language.file_extension}":
+                        yield path
+
+def check_problem_file(task: Tuple[str, str, Tuple[str, ...]]) -> Optional[ProblemIssue]:
+    path_str, language_name, required_metadata = task
+    path, language = Path(path_str), any_language_by_name(language_name)
+
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            problem = ProblemFormatter(0).parse_problem(path.stem, language, f.read())
+    except (OSError, UnicodeDecodeError) as e:
+        return ProblemIssue(path, ProblemIssueType.INVALID, language, f"can't be read ({e})")
+    except InvalidProblemText:
+        return ProblemIssue(path, ProblemIssueType.INVALID, language, "header can't be parsed")
+
+    missing_keys = [key for key in required_metadata if not problem.metadata.get(key)]
+    if len(missing_keys) > 0:
+        return ProblemIssue(path, ProblemIssueType.MISSING_METADATA, language, f"missing {', '.join(missing_keys)}")
+    return None
+
+def extract_solution_code(problem_text: str, language: Language) -> str:
+    lines = problem_text.splitlines()
+    start = 0
+    while start < len(lines) and (len(lines[start].strip()) == 0 or lines[start].startswith(language.comment_symbol)):
+        start+=1
+    return "\n".join(lines[start:])
@@ -1,8 +1,8 @@
 import re
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from classes.persistent_problem import PersistentProblem
-from classes.language import Language
+from classes.language import Language, LANGUAGES
 from classes.exceptions import InvalidProblemText
 
 
@@ -20,9 +20,20 @@ class ProblemFormatter():
     ) -> None:
         self.problem_re = re.compile(PROBLEM_PATTERN)
         self.max_description_line_length = max_description_line_length
-        self.code_prefixes = code_prefixes or dict()
+        self.code_prefixes = {
+            language.name if (language := LANGUAGES.get(name)) is not None else name: prefix
+            for name, prefix in (code_prefixes or dict()).items()
+        }
 
     def get_problem_text(self, problem: PersistentProblem) -> str:
+        if (code_prefix := self.code_prefixes.get(problem.language.name)) is not None:
+            solution_code = f"{code_prefix}{problem.solution_code}"
+        else:
+            solution_code = problem.solution_code
+        
+        return f"{self.get_header_text(problem)}{solution_code}"
+
+    def get_header_text(self, problem: PersistentProblem) -> str:
         cmnt = problem.language.comment_symbol
         metadata = "\n".join((f"{cmnt} {key}={self._disable_newlines(value)}" for key, value in problem.metadata.items() if value is not None))
         description = self._format_description(problem.description, cmnt)
@@ -31,12 +42,15 @@ class ProblemFormatter():
         if len(problem.tags) > 0:
             header+=f"\n{cmnt} Tags: {', '.join(problem.tags)}"
         
-        if (code_prefix := self.code_prefixes.get(problem.language.name)) is not None:
-            solution_code = f"{code_prefix}{problem.solution_code}"
-        else:
-            solution_code = problem.solution_code
-        
-        return f"{header}\n\n{metadata}\n\n\n{description}\n\n\n{solution_code}"
+        return f"{header}\n\n{metadata}\n\n\n{description}\n\n\n"
+
+    def split_problem_text(self, problem_slug: str, problem_text: str) -> Tuple[str, str]:
+        match = self.problem_re.match(problem_text)
+        if match is None:
+            raise InvalidProblemText(f"Problem \"{problem_slug}\" is invalid")
+        code = match.group("code")
+        code_start = match.start("code")+len(code)-len(code.lstrip("\n"))
+        return problem_text[:code_start], problem_text[code_start:]
     
     def parse_problem(
         self,
@@ -1,51 +1,75 @@
 import os
 import platform
 import subprocess
-from typing import Optional, Tuple
+from time import time_ns
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from Levenshtein import ratio as levenshtein_ratio
 
 from .problem_formatter import ProblemFormatter
+from .trash import Trash
+from .problem_storage import ProblemStorage, ProblemStorageType, create_problem_storage
+from .search_index import SearchIndex, SearchDocument
+from .completion import CompletionIndex, SAVED_PROBLEMS_KEY
 from classes.persistent_problem import PersistentProblem
 from classes.language import Language
 
 
+TRASH_DIR_NAME = ".trash"
+
 class ProblemKeeper:
     provider: str
     problems_path: Path
     formatter: ProblemFormatter
+    storage: ProblemStorage
+    search_index: Optional[SearchIndex]
+    completion_index: Optional[CompletionIndex]
 
     def __init__(
         self,
         provider: str,
         formatter: ProblemFormatter,
-        problems_path: Path=Path("problems")
+        problems_path: Path=Path("problems"),
+        storage_type: ProblemStorageType=ProblemStorageType.FILES,
+        search_index: Optional[SearchIndex]=None,
+        completion_index: Optional[CompletionIndex]=None
     ) -> None:
         self.provider = provider
         self.problems_path =  problems_path.joinpath(self.provider)
         self.formatter = formatter
+        self.storage = create_problem_storage(storage_type, self.problems_path, formatter)
+        self.search_index = search_index
+        self.completion_index = completion_index
 
-    def save_problem(self, problem: PersistentProblem) -> Path:
-        problem_path = self.get_problem_path(problem.title_slug, problem.language)
-        problem_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with problem_path.open("w", encoding="utf-8") as w:
-            w.write(self.formatter.get_problem_text(problem))
-            
+    def save_problem(self, problem: PersistentProblem, materialize: bool=True) -> Path:
+        problem_path = self.storage.save_problem(problem, materialize)
+        if self.search_index is not None:
+            self.search_index.add_document(SearchDocument.from_problem(problem))
+        if self.completion_index is not None:
+            self.completion_index.add(SAVED_PROBLEMS_KEY, [problem.title_slug])
         return problem_path
     
+    def refresh_problem(self, problem: PersistentProblem) -> bool:
+        if not self.storage.refresh_problem(problem):
+            return False
+        if self.search_index is not None:
+            self.search_index.add_document(SearchDocument.from_problem(problem))
+        return True
+
     def load_problem(self, problem_slug: str, language: Language) -> PersistentProblem:
-        problem_path = self.get_problem_path(problem_slug, language)
-        if not problem_path.is_file():
-            raise FileNotFoundError(f"Problem \"{problem_slug}\" was not found") 
-        
+        return self.storage.load_problem(problem_slug, language)
+
+    def load_problem_from_path(self, problem_path: Path, language: Language) -> PersistentProblem:
+        if problem_path.resolve() == self.get_problem_path(problem_path.stem, language).resolve():
+            return self.load_problem(problem_path.stem, language)
+
         with problem_path.open("r", encoding="utf-8") as f:
             problem_text = f.read()
-            return self.formatter.parse_problem(problem_slug, language, problem_text)
+            return self.formatter.parse_problem(problem_path.stem, language, problem_text)
     
     def open_problem(self, problem_slug: str, language: Language):
-        path = self.get_problem_path(problem_slug, language)
+        path = self.storage.checkout_problem(problem_slug, language)
         match platform.system():
             case "Darwin":
                 subprocess.call(('open', path.as_posix()))
@@ -53,44 +77,84 @@ class ProblemKeeper:
                 os.startfile(path)
             case _:
                 subprocess.call(('xdg-open', path.as_posix()))
+
+    def checkout_problem(self, problem_slug: str, language: Language) -> Path:
+        return self.storage.checkout_problem(problem_slug, language)
+
+    def checkin_problem(self, problem_slug: str, language: Language) -> bool:
+        return self.storage.checkin_problem(problem_slug, language)
+
+    def list_problems(self, language: Optional[Language]=None) -> List[Tuple[str, Language]]:
+        return self.storage.list_problems(language)
+
+    def iter_problems(self, language: Optional[Language]=None) -> Iterator[PersistentProblem]:
+        return self.storage.iter_problems(language)
+
+    def search_problems(self, query: str, language: Optional[Language]=None) -> List[Tuple[str, Language]]:
+        return self.storage.search_problems(query, language)
+
+    def iter_problem_files(self, language: Optional[Language]=None) -> Iterator[Tuple[Path, Language]]:
+        return self.storage.iter_problem_files(language)
     
-    def delete_problems(self, language: Language) -> Tuple[int, int]:
-        lang_dir = self.language_dir(language)
-        removed = failed = 0
-
-        if lang_dir.is_dir():
-            for path in lang_dir.iterdir():
-                if not path.is_file():
-                    continue
-                try:
-                    os.remove(path)
-                    removed+=1
-                except Exception:
-                    failed+=1
-            os.rmdir(lang_dir)
-        return removed, failed 
+    def delete_problems(self, language: Optional[Language]=None) -> bool:
+        if language is None:
+            deleted = self.trash.move(self.problems_dir) is not None
+            if self.completion_index is not None:
+                self.completion_index.set(SAVED_PROBLEMS_KEY, list())
+            return deleted
+
+        deleted_at = time_ns()
+        deleted = self.storage.delete_problems(language, deleted_at) > 0
+        if self.trash.move(self.language_dir(language), deleted_at) is not None:
+            deleted = True
+        elif deleted:
+            self.trash.record(self.language_dir(language), deleted_at)
+        self.update_completion_index()
+        return deleted
+
+    def restore_problems(self) -> Optional[Path]:
+        if len(entries := self.trash.entries()) == 0:
+            return None
+        deleted_at = int(entries[-1].name)
+        restored = self.trash.restore_latest()
+        if restored.resolve() != self.problems_dir.resolve():
+            self.storage.restore_problems(deleted_at)
+        self.update_completion_index()
+        return restored
+
+    def update_completion_index(self) -> None:
+        if self.completion_index is not None:
+            self.completion_index.set(SAVED_PROBLEMS_KEY, (slug for slug, _ in self.list_problems()))
+
+    def purge_deleted_problems(self, keep_days: float=0, background: bool=True) -> None:
+        self.storage.purge_deleted_problems(keep_days)
+        if background:
+            self.trash.purge_in_background(keep_days)
+        else:
+            self.trash.purge(keep_days)
     
     @property
     def problems_dir(self) -> Path:
         return self.problems_path
+
+    @property
+    def trash(self) -> Trash:
+        return Trash(self.problems_path.parent.joinpath(TRASH_DIR_NAME, self.provider))
     
     def language_dir(self, language: Language) -> Path:
-        return self.problems_dir.joinpath(language.name)
+        return self.storage.language_dir(language)
     
     def get_problem_path(self, problem_slug: str, language: Language) -> Path:
-        problems_dir = self.language_dir(language)
-        return problems_dir.joinpath(f"{problem_slug}.{language.file_extension}")
+        return self.storage.get_problem_path(problem_slug, language)
     
     def is_problem_saved(self, problem_slug: str, language: Language) -> bool:
-        return self.get_problem_path(problem_slug, language).is_file()
+        return self.storage.is_problem_saved(problem_slug, language)
     
     def fuzzy_search_problem(self, problem_title: str, language: Language) -> Optional[str]:
         maxRatio, bestSlug = 0, None
-        lang_dir = self.problems_path.joinpath(language.name)
-        if lang_dir.is_dir():
-            for problem_path in lang_dir.iterdir():
-                if (ratio := levenshtein_ratio(problem_title, problem_path.stem)) > maxRatio:
-                    maxRatio = ratio
-                    bestSlug = problem_path.stem
+        for problem_slug, _ in self.list_problems(language):
+            if (ratio := levenshtein_ratio(problem_title, problem_slug)) > maxRatio:
+                maxRatio = ratio
+                bestSlug = problem_slug
         
-        return bestSlug
\ No newline at end of file
+        return bestSlug
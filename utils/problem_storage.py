@@ -0,0 +1,357 @@
+import os
+import sqlite3
+from enum import Enum
+from time import time_ns
+from hashlib import sha256
+from json import dumps, loads
+from abc import ABC, abstractmethod
+from contextlib import closing, contextmanager
+from typing import Iterator, List, Optional, Tuple
+from pathlib import Path
+
+from .problem_formatter import ProblemFormatter
+from .atomic import file_lock, atomic_write_text
+from classes.persistent_problem import PersistentProblem
+from classes.language import Language, LANGUAGES
+
+
+ARCHIVE_FILE_NAME = "archive.sqlite3"
+NS_IN_DAY = 24*60*60*10**9
+
+class ProblemStorageType(Enum):
+    FILES = "files"
+    SQLITE = "sqlite"
+
+class ProblemStorage(ABC):
+    problems_path: Path
+    formatter: ProblemFormatter
+
+    def __init__(self, problems_path: Path, formatter: ProblemFormatter) -> None:
+        self.problems_path = problems_path
+        self.formatter = formatter
+
+    @abstractmethod
+    def save_problem(self, problem: PersistentProblem, materialize: bool=True) -> Path:
+        ...
+
+    @abstractmethod
+    def load_problem(self, problem_slug: str, language: Language) -> PersistentProblem:
+        ...
+
+    @abstractmethod
+    def is_problem_saved(self, problem_slug: str, language: Language) -> bool:
+        ...
+
+    @abstractmethod
+    def list_problems(self, language: Optional[Language]=None) -> List[Tuple[str, Language]]:
+        ...
+
+    @abstractmethod
+    def iter_problems(self, language: Optional[Language]=None) -> Iterator[PersistentProblem]:
+        ...
+
+    @abstractmethod
+    def search_problems(self, query: str, language: Optional[Language]=None) -> List[Tuple[str, Language]]:
+        ...
+
+    @abstractmethod
+    def refresh_problem(self, problem: PersistentProblem) -> bool:
+        ...
+
+    def checkout_problem(self, problem_slug: str, language: Language) -> Path:
+        if not self.is_problem_saved(problem_slug, language):
+            raise FileNotFoundError(f"Problem \"{problem_slug}\" was not found")
+        return self.get_problem_path(problem_slug, language)
+
+    def checkin_problem(self, problem_slug: str, language: Language) -> bool:
+        return False
+
+    def delete_problems(self, language: Optional[Language]=None, deleted_at: Optional[int]=None) -> int:
+        return 0
+
+    def restore_problems(self, deleted_at: int) -> int:
+        return 0
+
+    def purge_deleted_problems(self, keep_days: float=0) -> None:
+        ...
+
+    def language_dir(self, language: Language) -> Path:
+        return self.problems_path.joinpath(language.name)
+
+    def get_problem_path(self, problem_slug: str, language: Language) -> Path:
+        return self.language_dir(language).joinpath(f"{problem_slug}.{language.file_extension}")
+
+    def iter_problem_files(self, language: Optional[Language]=None) -> Iterator[Tuple[Path, Language]]:
+        languages = [language] if language is not None else LANGUAGES.languages
+        for lang in languages:
+            lang_dir = self.language_dir(lang)
+            if not lang_dir.is_dir():
+                continue
+            for path in lang_dir.iterdir():
+                if path.is_file() and path.suffix == f".{lang.file_extension}":
+                    yield path, lang
+
+    def _write_problem_file(self, problem: PersistentProblem) -> Path:
+        problem_path = self.get_problem_path(problem.title_slug, problem.language)
+        with file_lock(problem_path):
+            atomic_write_text(problem_path, self.formatter.get_problem_text(problem))
+        return problem_path
+
+    def _refresh_problem_file(self, problem: PersistentProblem) -> bool:
+        problem_path = self.get_problem_path(problem.title_slug, problem.language)
+        header = self.formatter.get_header_text(problem)
+        with file_lock(problem_path):
+            with problem_path.open("r", encoding="utf-8") as f:
+                stored_header, solution = self.formatter.split_problem_text(problem.title_slug, f.read())
+            if text_hash(stored_header) == text_hash(header):
+                return False
+            atomic_write_text(problem_path, f"{header}{solution}")
+        return True
+
+    def _read_problem_file(self, problem_path: Path, language: Language) -> PersistentProblem:
+        with problem_path.open("r", encoding="utf-8") as f:
+            return self.formatter.parse_problem(problem_path.stem, language, f.read())
+
+class FileProblemStorage(ProblemStorage):
+
+    def save_problem(self, problem: PersistentProblem, materialize: bool=True) -> Path:
+        return self._write_problem_file(problem)
+
+    def load_problem(self, problem_slug: str, language: Language) -> PersistentProblem:
+        problem_path = self.get_problem_path(problem_slug, language)
+        if not problem_path.is_file():
+            raise FileNotFoundError(f"Problem \"{problem_slug}\" was not found")
+        return self._read_problem_file(problem_path, language)
+
+    def refresh_problem(self, problem: PersistentProblem) -> bool:
+        return self._refresh_problem_file(problem)
+
+    def is_problem_saved(self, problem_slug: str, language: Language) -> bool:
+        return self.get_problem_path(problem_slug, language).is_file()
+
+    def list_problems(self, language: Optional[Language]=None) -> List[Tuple[str, Language]]:
+        return [(path.stem, lang) for path, lang in self.iter_problem_files(language)]
+
+    def iter_problems(self, language: Optional[Language]=None) -> Iterator[PersistentProblem]:
+        for path, lang in self.iter_problem_files(language):
+            yield self._read_problem_file(path, lang)
+
+    def search_problems(self, query: str, language: Optional[Language]=None) -> List[Tuple[str, Language]]:
+        query = query.casefold()
+        return [
+            (problem_slug, lang)
+            for problem_slug, lang in self.list_problems(language)
+            if query in problem_slug.casefold()
+        ]
+
+class SQLiteProblemStorage(ProblemStorage):
+    archive_path: Path
+
+    def __init__(self, problems_path: Path, formatter: ProblemFormatter) -> None:
+        super().__init__(problems_path, formatter)
+        self.archive_path = problems_path.joinpath(ARCHIVE_FILE_NAME)
+
+    def save_problem(self, problem: PersistentProblem, materialize: bool=True) -> Path:
+        with self._connect() as conn:
+            self._upsert_problem(conn, problem)
+        if not materialize:
+            return self.archive_path
+        return self._write_problem_file(problem)
+
+    def load_problem(self, problem_slug: str, language: Language) -> PersistentProblem:
+        problem_path = self.get_problem_path(problem_slug, language)
+        if problem_path.is_file():
+            return self._sync_problem_file(problem_path, language)
+
+        with self._connect() as conn:
+            row = conn.execute(
+                f"{SELECT_PROBLEMS} AND p.slug = ? AND p.language = ?",
+                (problem_slug, language.name)
+            ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Problem \"{problem_slug}\" was not found")
+        return self._row_to_problem(row)
+
+    def refresh_problem(self, problem: PersistentProblem) -> bool:
+        if self.get_problem_path(problem.title_slug, problem.language).is_file():
+            if not self._refresh_problem_file(problem):
+                return False
+        else:
+            stored_problem = self.load_problem(problem.title_slug, problem.language)
+            if text_hash(self.formatter.get_header_text(stored_problem)) == text_hash(self.formatter.get_header_text(problem)):
+                return False
+
+        with self._connect() as conn:
+            self._upsert_problem(conn, problem)
+        return True
+
+    def is_problem_saved(self, problem_slug: str, language: Language) -> bool:
+        if self.get_problem_path(problem_slug, language).is_file():
+            return True
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT 1 FROM problems WHERE slug = ? AND language = ? AND deleted_at IS NULL",
+                (problem_slug, language.name)
+            ).fetchone() is not None
+
+    def list_problems(self, language: Optional[Language]=None) -> List[Tuple[str, Language]]:
+        query, params = "SELECT slug, language FROM problems WHERE deleted_at IS NULL", tuple()
+        if language is not None:
+            query, params = f"{query} AND language = ?", (language.name,)
+
+        with self._connect() as conn:
+            rows = conn.execute(f"{query} ORDER BY language, slug", params).fetchall()
+        return [(slug, lang) for slug, lang_name in rows if (lang := LANGUAGES.get(lang_name)) is not None]
+
+    def iter_problems(self, language: Optional[Language]=None) -> Iterator[PersistentProblem]:
+        query, params = SELECT_PROBLEMS, tuple()
+        if language is not None:
+            query, params = f"{query} AND p.language = ?", (language.name,)
+
+        with self._connect() as conn:
+            for row in conn.execute(f"{query} ORDER BY p.language, p.slug", params):
+                yield self._row_to_problem(row)
+
+    def search_problems(self, query: str, language: Optional[Language]=None) -> List[Tuple[str, Language]]:
+        pattern = f"%{query}%"
+        sql, params = "SELECT slug, language FROM problems WHERE deleted_at IS NULL AND (slug LIKE ? OR title LIKE ?)", (pattern, pattern)
+        if language is not None:
+            sql, params = f"{sql} AND language = ?", (*params, language.name)
+
+        with self._connect() as conn:
+            rows = conn.execute(f"{sql} ORDER BY language, slug", params).fetchall()
+        return [(slug, lang) for slug, lang_name in rows if (lang := LANGUAGES.get(lang_name)) is not None]
+
+    def checkout_problem(self, problem_slug: str, language: Language) -> Path:
+        problem_path = self.get_problem_path(problem_slug, language)
+        if problem_path.is_file():
+            return problem_path
+        return self._write_problem_file(self.load_problem(problem_slug, language))
+
+    def checkin_problem(self, problem_slug: str, language: Language) -> bool:
+        problem_path = self.get_problem_path(problem_slug, language)
+        if not problem_path.is_file():
+            return False
+        self._sync_problem_file(problem_path, language)
+        os.remove(problem_path)
+        return True
+
+    def delete_problems(self, language: Optional[Language]=None, deleted_at: Optional[int]=None) -> int:
+        query, params = "UPDATE problems SET deleted_at = ? WHERE deleted_at IS NULL", (deleted_at or time_ns(),)
+        if language is not None:
+            query, params = f"{query} AND language = ?", (*params, language.name)
+
+        with self._connect() as conn:
+            return conn.execute(query, params).rowcount
+
+    def restore_problems(self, deleted_at: int) -> int:
+        if not self.archive_path.is_file():
+            return 0
+        with self._connect() as conn:
+            return conn.execute(
+                "UPDATE problems SET deleted_at = NULL WHERE deleted_at = ?",
+                (deleted_at,)
+            ).rowcount
+
+    def purge_deleted_problems(self, keep_days: float=0) -> None:
+        if not self.archive_path.is_file():
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM problems WHERE deleted_at <= ?",
+                (time_ns()-int(keep_days*NS_IN_DAY),)
+            )
+            conn.execute(
+                "DELETE FROM descriptions WHERE hash NOT IN (SELECT description_hash FROM problems)"
+            )
+
+    def _sync_problem_file(self, problem_path: Path, language: Language) -> PersistentProblem:
+        problem = self._read_problem_file(problem_path, language)
+        with self._connect() as conn:
+            row = conn.execute(
+                f"{SELECT_PROBLEMS} AND p.slug = ? AND p.language = ?",
+                (problem.title_slug, language.name)
+            ).fetchone()
+            if row is not None:
+                problem.description = row["description"]
+                stored_problem = self._row_to_problem(row)
+                if stored_problem.solution_code == problem.solution_code \
+                        and text_hash(self.formatter.get_header_text(stored_problem)) == text_hash(self.formatter.get_header_text(problem)):
+                    return problem
+            self._upsert_problem(conn, problem)
+        return problem
+
+    def _upsert_problem(self, conn: sqlite3.Connection, problem: PersistentProblem) -> None:
+        description_hash = text_hash(problem.description)
+        conn.execute(
+            "INSERT OR IGNORE INTO descriptions (hash, description) VALUES (?, ?)",
+            (description_hash, problem.description)
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO problems (slug, language, title, difficulty, category, tags, description_hash, solution_code, metadata, updated_at, deleted_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)",
+            (
+                problem.title_slug, problem.language.name, problem.title, problem.difficulty,
+                problem.category, dumps(problem.tags, ensure_ascii=False), description_hash,
+                problem.solution_code, dumps(problem.metadata, ensure_ascii=False), time_ns()
+            )
+        )
+
+    def _row_to_problem(self, row: sqlite3.Row) -> PersistentProblem:
+        return PersistentProblem(
+            title=row["title"],
+            title_slug=row["slug"],
+            difficulty=row["difficulty"],
+            category=row["category"],
+            tags=loads(row["tags"]),
+            description=row["description"],
+            language=LANGUAGES.by_name(row["language"]),
+            solution_code=row["solution_code"],
+            metadata=loads(row["metadata"])
+        )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.archive_path)) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.executescript(ARCHIVE_SCHEMA)
+            with conn:
+                yield conn
+
+
+ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS descriptions (
+    hash TEXT PRIMARY KEY,
+    description TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS problems (
+    slug TEXT NOT NULL,
+    language TEXT NOT NULL,
+    title TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    category TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    description_hash TEXT NOT NULL REFERENCES descriptions(hash),
+    solution_code TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    updated_at INTEGER NOT NULL,
+    deleted_at INTEGER,
+    PRIMARY KEY (slug, language)
+);
+"""
+
+SELECT_PROBLEMS = "SELECT p.*, d.description FROM problems p JOIN descriptions d ON d.hash = p.description_hash WHERE p.deleted_at IS NULL"
+
+def text_hash(text: str) -> str:
+    return sha256(text.encode("utf-8")).hexdigest()
+
+def create_problem_storage(
+    storage_type: ProblemStorageType,
+    problems_path: Path,
+    formatter: ProblemFormatter
+) -> ProblemStorage:
+    match storage_type:
+        case ProblemStorageType.FILES:
+            return FileProblemStorage(problems_path, formatter)
+        case ProblemStorageType.SQLITE:
+            return SQLiteProblemStorage(problems_path, formatter)
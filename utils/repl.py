@@ -0,0 +1,97 @@
+import shlex
+from contextlib import suppress
+from typing import List, Optional
+from pathlib import Path
+
+import click
+
+try:
+    import readline
+except ImportError:
+    readline = None
+
+
+SHELL_HISTORY_FILE_NAME = "shell_history"
+SHELL_HISTORY_LENGTH = 1000
+EXIT_COMMANDS = {"exit", "quit"}
+
+class CommandCompleter:
+    group: click.Group
+    _matches: List[str]
+
+    def __init__(self, group: click.Group) -> None:
+        self.group = group
+        self._matches = list()
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_begidx()]
+            try:
+                words = shlex.split(line)
+            except ValueError:
+                words = list()
+            self._matches = self.matches(words, text)
+        return self._matches[state] if state < len(self._matches) else None
+
+    def matches(self, words: List[str], incomplete: str) -> List[str]:
+        command: click.Command = self.group
+        ctx = click.Context(command, resilient_parsing=True)
+        args, value_option = list(), None
+        for word in words:
+            if value_option is not None:
+                value_option = None
+            elif word.startswith("-"):
+                value_option = self._find_value_option(command, word)
+            elif isinstance(command, click.Group) and len(args) == 0 \
+                    and (subcommand := command.get_command(ctx, word)) is not None:
+                command = subcommand
+                ctx = click.Context(command, parent=ctx, resilient_parsing=True)
+            else:
+                args.append(word)
+
+        if value_option is not None:
+            return [f"{item.value} " for item in value_option.shell_complete(ctx, incomplete)]
+        if incomplete.startswith("-"):
+            options = [name for param in command.params if isinstance(param, click.Option) for name in param.opts]
+            return [f"{name} " for name in sorted(options) if name.startswith(incomplete)]
+        if isinstance(command, click.Group):
+            names = [name for name in command.list_commands(ctx) if not command.get_command(ctx, name).hidden]
+            if command is self.group:
+                names.extend(EXIT_COMMANDS)
+            return [f"{name} " for name in sorted(names) if name.startswith(incomplete)]
+
+        arguments = [param for param in command.params if isinstance(param, click.Argument)]
+        position = len(args)
+        if position >= len(arguments):
+            if len(arguments) == 0 or arguments[-1].nargs != -1:
+                return list()
+            position = len(arguments)-1
+        return [f"{item.value} " for item in arguments[position].shell_complete(ctx, incomplete)]
+
+    def _find_value_option(self, command: click.Command, word: str) -> Optional[click.Option]:
+        for param in command.params:
+            if isinstance(param, click.Option) and word in param.opts and not param.is_flag and not param.count:
+                return param
+        return None
+
+def setup_readline(group: click.Group, history_path: Path) -> None:
+    if readline is None:
+        return
+
+    with suppress(OSError):
+        readline.read_history_file(history_path)
+    readline.set_history_length(SHELL_HISTORY_LENGTH)
+    readline.set_completer_delims(" \t\n")
+    readline.set_completer(CommandCompleter(group).complete)
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+
+def save_history(history_path: Path) -> None:
+    if readline is None:
+        return
+
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with suppress(OSError):
+        readline.write_history_file(history_path)
@@ -0,0 +1,152 @@
+import re
+import sqlite3
+from math import log
+from heapq import nlargest
+from collections import Counter
+from dataclasses import dataclass
+from contextlib import closing, contextmanager
+from typing import Dict, Iterable, Iterator, List, Set
+from pathlib import Path
+
+from classes.persistent_problem import PersistentProblem
+
+
+SEARCH_INDEX_FILE_NAME = "search_index.sqlite3"
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "if", "in", "is", "it",
+    "of", "on", "or", "that", "the", "this", "to", "with", "you", "your"
+}
+TITLE_WEIGHT = 3
+TAGS_WEIGHT = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+@dataclass()
+class SearchDocument:
+    title_slug: str
+    title: str
+    difficulty: str
+    tags: List[str]
+    text: str
+
+    @classmethod
+    def from_problem(cls, problem: PersistentProblem) -> "SearchDocument":
+        return cls(
+            title_slug=problem.title_slug,
+            title=problem.title,
+            difficulty=problem.difficulty,
+            tags=problem.tags,
+            text=problem.description
+        )
+
+    def term_frequencies(self) -> Counter:
+        frequencies = Counter(tokenize(self.text))
+        for term in tokenize(self.title):
+            frequencies[term]+=TITLE_WEIGHT
+        for term in tokenize(" ".join(self.tags)):
+            frequencies[term]+=TAGS_WEIGHT
+        return frequencies
+
+@dataclass()
+class SearchResult:
+    title_slug: str
+    title: str
+    difficulty: str
+    score: float
+
+class SearchIndex:
+    index_path: Path
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = index_path
+
+    def add_documents(self, documents: Iterable[SearchDocument]) -> int:
+        added = 0
+        with self._connect() as conn:
+            for document in documents:
+                frequencies = document.term_frequencies()
+                conn.execute("DELETE FROM postings WHERE doc_id = (SELECT doc_id FROM docs WHERE slug = ?)", (document.title_slug,))
+                conn.execute(
+                    "INSERT INTO docs (slug, title, difficulty, length) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(slug) DO UPDATE SET title = excluded.title, difficulty = excluded.difficulty, length = excluded.length",
+                    (document.title_slug, document.title, document.difficulty, sum(frequencies.values()))
+                )
+                doc_id = conn.execute("SELECT doc_id FROM docs WHERE slug = ?", (document.title_slug,)).fetchone()[0]
+                conn.executemany(
+                    "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    ((term, doc_id, tf) for term, tf in frequencies.items())
+                )
+                added+=1
+        return added
+
+    def add_document(self, document: SearchDocument) -> None:
+        self.add_documents([document])
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM postings")
+            conn.execute("DELETE FROM docs")
+
+    def indexed_slugs(self) -> Set[str]:
+        with self._connect() as conn:
+            return {row[0] for row in conn.execute("SELECT slug FROM docs")}
+
+    def search(self, query: str, limit: int=10) -> List[SearchResult]:
+        terms = set(tokenize(query))
+        if len(terms) == 0:
+            return list()
+
+        with self._connect() as conn:
+            docs_count, avg_length = conn.execute("SELECT COUNT(*), AVG(length) FROM docs").fetchone()
+            if docs_count == 0:
+                return list()
+
+            scores: Dict[int, float] = dict()
+            for term in terms:
+                postings = conn.execute(
+                    "SELECT p.doc_id, p.tf, d.length FROM postings p JOIN docs d ON d.doc_id = p.doc_id WHERE p.term = ?",
+                    (term,)
+                ).fetchall()
+                idf = log(1+(docs_count-len(postings)+0.5)/(len(postings)+0.5))
+                for doc_id, tf, length in postings:
+                    norm = BM25_K1*(1-BM25_B+BM25_B*length/avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0)+idf*tf*(BM25_K1+1)/(tf+norm)
+
+            best = nlargest(limit, scores.items(), key=lambda item: item[1])
+            results = list()
+            for doc_id, score in best:
+                slug, title, difficulty = conn.execute(
+                    "SELECT slug, title, difficulty FROM docs WHERE doc_id = ?", (doc_id,)
+                ).fetchone()
+                results.append(SearchResult(slug, title, difficulty, score))
+        return results
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.index_path)) as conn:
+            conn.executescript(INDEX_SCHEMA)
+            with conn:
+                yield conn
+
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id INTEGER PRIMARY KEY,
+    slug TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc_id ON postings (doc_id);
+"""
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS]
@@ -0,0 +1,106 @@
+from json import load, dump
+from typing import Dict, Iterable, Iterator, List, Tuple
+from pathlib import Path
+
+import numpy as np
+
+from .search_index import SearchDocument
+
+
+SIMILARITY_MODEL_DIR_NAME = "similarity"
+ARRAY_NAMES = ("indptr", "indices", "counts")
+
+class SimilarityModel:
+    model_path: Path
+    slugs: List[str]
+    rows: Dict[str, int]
+    vocabulary: Dict[str, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    counts: np.ndarray
+
+    def __init__(self, model_path: Path) -> None:
+        self.model_path = model_path
+        self.load()
+
+    def load(self, mmap: bool=True) -> None:
+        meta_path = self.model_path.joinpath("model.json")
+        if not meta_path.is_file():
+            self.slugs, self.rows, self.vocabulary = list(), dict(), dict()
+            self.indptr = np.zeros(1, dtype=np.int64)
+            self.indices = np.zeros(0, dtype=np.int32)
+            self.counts = np.zeros(0, dtype=np.float32)
+            return
+
+        with meta_path.open("r", encoding="utf-8") as f:
+            meta = load(f)
+        self.slugs = meta.get("slugs")
+        self.rows = {slug: i for i, slug in enumerate(self.slugs)}
+        self.vocabulary = {term: i for i, term in enumerate(meta.get("terms"))}
+        for name in ARRAY_NAMES:
+            setattr(self, name, np.load(self.model_path.joinpath(f"{name}.npy"), mmap_mode="r" if mmap else None))
+
+    def update(self, documents: Iterable[SearchDocument]) -> int:
+        known_slugs = set(self.rows)
+        new_slugs, new_indptr, new_indices, new_counts = list(), list(), list(), list()
+        vocabulary = dict(self.vocabulary)
+
+        nnz = len(self.indices)
+        for document in documents:
+            frequencies = document.term_frequencies()
+            if document.title_slug in known_slugs or len(frequencies) == 0:
+                continue
+            known_slugs.add(document.title_slug)
+            new_slugs.append(document.title_slug)
+            new_indices.extend(vocabulary.setdefault(term, len(vocabulary)) for term in frequencies.keys())
+            new_counts.extend(frequencies.values())
+            nnz+=len(frequencies)
+            new_indptr.append(nnz)
+
+        if len(new_slugs) == 0:
+            return 0
+
+        self.load(mmap=False)
+        self.slugs = self.slugs+new_slugs
+        self.vocabulary = vocabulary
+        self.indptr = np.concatenate((self.indptr, np.array(new_indptr, dtype=np.int64)))
+        self.indices = np.concatenate((self.indices, np.array(new_indices, dtype=np.int32)))
+        self.counts = np.concatenate((self.counts, np.array(new_counts, dtype=np.float32)))
+        self.save()
+        return len(new_slugs)
+
+    def save(self) -> None:
+        self.model_path.mkdir(parents=True, exist_ok=True)
+        for name in ARRAY_NAMES:
+            np.save(self.model_path.joinpath(f"{name}.npy"), getattr(self, name))
+
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        with self.model_path.joinpath("model.json").open("w", encoding="utf-8") as w:
+            dump({"slugs": self.slugs, "terms": terms}, w, ensure_ascii=False)
+        self.load()
+
+    def most_similar(self, title_slug: str) -> Iterator[Tuple[str, float]]:
+        if (doc := self.rows.get(title_slug)) is None:
+            raise KeyError(f"Problem \"{title_slug}\" is not in similarity model")
+
+        docs_count, terms_count = len(self.slugs), len(self.vocabulary)
+        df = np.bincount(self.indices, minlength=terms_count)
+        idf = np.log((1+docs_count)/(1+df))+1
+        weights = (1+np.log(self.counts))*idf[self.indices]
+
+        start, end = self.indptr[doc], self.indptr[doc+1]
+        query = np.zeros(terms_count, dtype=np.float64)
+        query[self.indices[start:end]] = weights[start:end]
+
+        dots = np.add.reduceat(weights*query[self.indices], self.indptr[:-1])
+        norms = np.sqrt(np.add.reduceat(weights**2, self.indptr[:-1]))
+
+        scores = dots/(norms*np.linalg.norm(query))
+        scores[doc] = -1
+        for i in np.argsort(-scores):
+            if scores[i] <= 0:
+                break
+            yield self.slugs[i], float(scores[i])
+
+    def __contains__(self, title_slug: str) -> bool:
+        return title_slug in self.rows
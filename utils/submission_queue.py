@@ -0,0 +1,240 @@
+import sqlite3
+from time import time
+from enum import Enum
+from json import dumps, loads
+from dataclasses import dataclass
+from contextlib import closing, contextmanager, suppress
+from typing import Any, Dict, Iterator, List, Optional
+from pathlib import Path
+
+
+SUBMISSION_QUEUE_FILE_NAME = "submission_queue.sqlite3"
+WORKER_STALE_S = 60
+BUSY_TIMEOUT_S = 30
+
+class SubmissionState(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+@dataclass()
+class QueuedSubmission:
+    submission_id: int
+    problem_title: str
+    language: str
+    payload: Dict[str, Any]
+    state: SubmissionState
+    attempts: int
+    created_at: float
+    next_attempt_at: float
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    run_id: Optional[str]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "submission_id": self.submission_id,
+            "problem_title": self.problem_title,
+            "language": self.language,
+            "state": self.state.value,
+            "attempts": self.attempts,
+            "created_at": self.created_at,
+            "next_attempt_at": self.next_attempt_at,
+            "result": self.result,
+            "error": self.error,
+            "run_id": self.run_id
+        }
+
+class SubmissionQueue:
+    queue_path: Path
+
+    def __init__(self, queue_path: Path) -> None:
+        self.queue_path = queue_path
+
+    def enqueue(self, problem_title: str, language: str, payload: Dict[str, Any]) -> int:
+        now = time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO submissions (problem_title, language, payload, state, attempts, created_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, 0, ?, ?)",
+                (problem_title, language, dumps(payload, ensure_ascii=False), SubmissionState.QUEUED.value, now, now)
+            )
+            return cursor.lastrowid
+
+    def claim(self, limit: int) -> List[QueuedSubmission]:
+        if limit <= 0:
+            return list()
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT * FROM submissions WHERE state = ? AND next_attempt_at <= ? ORDER BY next_attempt_at, id LIMIT ?",
+                (SubmissionState.QUEUED.value, time(), limit)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE submissions SET state = ?, attempts = attempts + 1 WHERE id = ?",
+                ((SubmissionState.RUNNING.value, row["id"]) for row in rows)
+            )
+        submissions = [self._row_to_submission(row) for row in rows]
+        for submission in submissions:
+            submission.state = SubmissionState.RUNNING
+            submission.attempts+=1
+        return submissions
+
+    def complete(self, submission_id: int, result: Dict[str, Any]) -> None:
+        self._finish(submission_id, SubmissionState.DONE, dumps(result, ensure_ascii=False), None)
+
+    def fail(self, submission_id: int, error: str) -> None:
+        self._finish(submission_id, SubmissionState.FAILED, None, error)
+
+    def retry(self, submission_id: int, error: str, delay_s: float) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE submissions SET state = ?, next_attempt_at = ?, error = ? WHERE id = ?",
+                (SubmissionState.QUEUED.value, time()+delay_s, error, submission_id)
+            )
+
+    def set_run_id(self, submission_id: int, run_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("UPDATE submissions SET run_id = ? WHERE id = ?", (run_id, submission_id))
+
+    def requeue_running(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "UPDATE submissions SET state = ? WHERE state = ?",
+                (SubmissionState.QUEUED.value, SubmissionState.RUNNING.value)
+            ).rowcount
+
+    def pending_count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM submissions WHERE state IN (?, ?)",
+                (SubmissionState.QUEUED.value, SubmissionState.RUNNING.value)
+            ).fetchone()[0]
+
+    def next_attempt_at(self) -> Optional[float]:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT MIN(next_attempt_at) FROM submissions WHERE state = ?",
+                (SubmissionState.QUEUED.value,)
+            ).fetchone()[0]
+
+    def submissions(self, include_finished: bool=True, limit: Optional[int]=None) -> List[QueuedSubmission]:
+        query = "SELECT * FROM submissions"
+        params = list()
+        if not include_finished:
+            query+=" WHERE state IN (?, ?)"
+            params.extend((SubmissionState.QUEUED.value, SubmissionState.RUNNING.value))
+        query+=" ORDER BY id DESC LIMIT ?"
+        params.append(limit if limit is not None else -1)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._row_to_submission(row) for row in reversed(rows)]
+
+    def clear_finished(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM submissions WHERE state IN (?, ?)",
+                (SubmissionState.DONE.value, SubmissionState.FAILED.value)
+            ).rowcount
+
+    def acquire_worker(self, worker_id: str) -> bool:
+        now = time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT worker_id, heartbeat_at FROM worker WHERE id = 0").fetchone()
+            if row is not None and row["worker_id"] != worker_id and now-row["heartbeat_at"] < WORKER_STALE_S:
+                return False
+            conn.execute(
+                "INSERT INTO worker (id, worker_id, heartbeat_at) VALUES (0, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET worker_id = excluded.worker_id, heartbeat_at = excluded.heartbeat_at",
+                (worker_id, now)
+            )
+            return True
+
+    def release_worker(self, worker_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM worker WHERE id = 0 AND worker_id = ?", (worker_id,))
+
+    def release_worker_if_idle(self, worker_id: str) -> bool:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            pending = conn.execute(
+                "SELECT COUNT(*) FROM submissions WHERE state IN (?, ?)",
+                (SubmissionState.QUEUED.value, SubmissionState.RUNNING.value)
+            ).fetchone()[0]
+            if pending > 0:
+                return False
+            conn.execute("DELETE FROM worker WHERE id = 0 AND worker_id = ?", (worker_id,))
+            return True
+
+    def is_worker_alive(self) -> bool:
+        with self._connect() as conn:
+            row = conn.execute("SELECT heartbeat_at FROM worker WHERE id = 0").fetchone()
+        return row is not None and time()-row["heartbeat_at"] < WORKER_STALE_S
+
+    def _finish(self, submission_id: int, state: SubmissionState, result: Optional[str], error: Optional[str]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE submissions SET state = ?, result = ?, error = ? WHERE id = ?",
+                (state.value, result, error, submission_id)
+            )
+
+    def _row_to_submission(self, row: sqlite3.Row) -> QueuedSubmission:
+        return QueuedSubmission(
+            submission_id=row["id"],
+            problem_title=row["problem_title"],
+            language=row["language"],
+            payload=loads(row["payload"]),
+            state=SubmissionState(row["state"]),
+            attempts=row["attempts"],
+            created_at=row["created_at"],
+            next_attempt_at=row["next_attempt_at"],
+            result=loads(row["result"]) if row["result"] is not None else None,
+            error=row["error"],
+            run_id=row["run_id"]
+        )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.queue_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.queue_path, timeout=BUSY_TIMEOUT_S, isolation_level=None)) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(QUEUE_SCHEMA)
+            if "run_id" not in {column["name"] for column in conn.execute("PRAGMA table_info(submissions)")}:
+                with suppress(sqlite3.OperationalError):
+                    conn.execute("ALTER TABLE submissions ADD COLUMN run_id TEXT")
+            try:
+                yield conn
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            if conn.in_transaction:
+                conn.execute("COMMIT")
+
+
+QUEUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY,
+    problem_title TEXT NOT NULL,
+    language TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    result TEXT,
+    error TEXT,
+    run_id TEXT
+);
+CREATE INDEX IF NOT EXISTS submissions_state ON submissions (state, next_attempt_at);
+CREATE TABLE IF NOT EXISTS worker (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    worker_id TEXT NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+"""
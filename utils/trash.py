@@ -0,0 +1,108 @@
+import os
+import sys
+import shutil
+import platform
+import subprocess
+from time import time_ns
+from contextlib import suppress
+from typing import List, Optional
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+
+ORIGIN_FILE_NAME = ".origin"
+PURGING_PREFIX = ".purging-"
+NS_IN_DAY = 24*60*60*10**9
+
+class Trash:
+    trash_path: Path
+
+    def __init__(self, trash_path: Path) -> None:
+        self.trash_path = trash_path
+
+    def move(self, path: Path, entry_id: Optional[int]=None) -> Optional[Path]:
+        if not path.exists():
+            return None
+
+        trashed_path = self.record(path, entry_id).joinpath(path.name)
+        os.rename(path, trashed_path)
+        return trashed_path
+
+    def record(self, path: Path, entry_id: Optional[int]=None) -> Path:
+        entry_path = self.trash_path.joinpath(str(entry_id if entry_id is not None else time_ns()))
+        entry_path.mkdir(parents=True)
+        entry_path.joinpath(ORIGIN_FILE_NAME).write_text(str(path.resolve()), encoding="utf-8")
+        return entry_path
+
+    def restore_latest(self) -> Optional[Path]:
+        entries = self.entries()
+        if len(entries) == 0:
+            return None
+
+        entry_path = entries[-1]
+        origin = Path(entry_path.joinpath(ORIGIN_FILE_NAME).read_text(encoding="utf-8"))
+        if entry_path.joinpath(origin.name).exists():
+            if origin.exists():
+                raise FileExistsError(f"Can't restore \"{origin}\", it already exists")
+            origin.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(entry_path.joinpath(origin.name), origin)
+        shutil.rmtree(entry_path, ignore_errors=True)
+        return origin
+
+    def entries(self) -> List[Path]:
+        if not self.trash_path.is_dir():
+            return list()
+        return sorted(
+            (path for path in self.trash_path.iterdir() if path.is_dir() and path.name.isdigit()),
+            key=lambda path: int(path.name)
+        )
+
+    def purge(self, keep_days: float=0) -> int:
+        min_timestamp = time_ns()-int(keep_days*NS_IN_DAY)
+        purging_paths = list()
+        for entry_path in self.entries():
+            if int(entry_path.name) > min_timestamp:
+                continue
+            purging_path = entry_path.with_name(f"{PURGING_PREFIX}{entry_path.name}")
+            with suppress(FileNotFoundError):
+                os.rename(entry_path, purging_path)
+                purging_paths.append(purging_path)
+
+        if self.trash_path.is_dir():
+            purging_paths.extend(
+                path for path in self.trash_path.iterdir()
+                if path.name.startswith(PURGING_PREFIX) and path not in purging_paths
+            )
+
+        children = [child for path in purging_paths for child in path.iterdir()]
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(self._remove, children))
+        for path in purging_paths:
+            shutil.rmtree(path, ignore_errors=True)
+        return len(purging_paths)
+
+    def purge_in_background(self, keep_days: float=0) -> subprocess.Popen:
+        kwargs = {}
+        if platform.system() == "Windows":
+            kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+
+        return subprocess.Popen(
+            (sys.executable, str(Path(__file__).resolve()), str(self.trash_path.resolve()), str(keep_days)),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **kwargs
+        )
+
+    def _remove(self, path: Path) -> None:
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            with suppress(OSError):
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    Trash(Path(sys.argv[1])).purge(float(sys.argv[2]))